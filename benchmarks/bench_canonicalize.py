@@ -0,0 +1,91 @@
+"""URL 정규화 처리량 비교: 기존 canonicalize_url + url_hash (URL 마다 2번 정규화) vs canonicalize_urls 배치.
+
+코퍼스는 뉴스레터/피드 수집 형태를 흉내 낸다: 링크 재등장이 Zipf 분포로 몰리고, 대부분 추적 파라미터가 붙어 있으며
+일부는 일반 쿼리/퍼센트 인코딩/서브도메인을 가진다. 두 경로의 출력이 같은지도 확인한다.
+
+사용법: python benchmarks/bench_canonicalize.py --urls 1000000 --unique 150000
+"""
+import argparse
+import hashlib
+import random
+import sys
+import time
+from pathlib import Path
+from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from linkedin_intel import utils  # noqa: E402
+from linkedin_intel.utils import LINKEDIN_SUBDOMAIN_MAP, TRACKING_PARAMS, canonicalize_urls  # noqa: E402
+
+
+def legacy_canonicalize(url: str) -> str:
+    """변경 전 canonicalize_url."""
+    if not url:
+        return ""
+    try:
+        parsed = urlparse(url.strip())
+    except Exception:
+        return url
+    scheme = "https" if parsed.scheme in ("http", "https", "") else parsed.scheme
+    netloc = LINKEDIN_SUBDOMAIN_MAP.get(parsed.netloc.lower(), parsed.netloc.lower())
+    path = parsed.path.rstrip("/") or "/"
+    query_params = parse_qs(parsed.query, keep_blank_values=False)
+    filtered = {k: v for k, v in query_params.items() if k.lower() not in TRACKING_PARAMS}
+    query = urlencode(sorted(filtered.items()), doseq=True) if filtered else ""
+    return urlunparse((scheme, netloc, path, "", query, ""))
+
+
+def legacy_url_hash(url: str) -> str:
+    return hashlib.sha256(legacy_canonicalize(url).encode()).hexdigest()
+
+
+def make_corpus(n: int, unique: int, seed: int = 42) -> list[str]:
+    rng = random.Random(seed)
+    hosts = ["www.linkedin.com", "kr.linkedin.com", "linkedin.com", "de.linkedin.com", "www.lgcorp.com", "news.example.com"]
+    tails = ["?utm_source=share&utm_medium=member_desktop", "?trk=public_post_feed-article-content", "/?trackingId=abc%3D%3D&lipi=urn",
+        "", "/", "?id=42&lang=ko", "?q=software+defined+vehicle&page=2", "?utm_campaign=weekly&ref=nl"]
+    base = []
+    for k in range(unique):
+        host = rng.choices(hosts, weights=[50, 10, 10, 5, 10, 15])[0]
+        path = f"/posts/user{k % 4099}_sdv-cockpit-activity-{7000000000 + k}" if "linkedin" in host else f"/articles/{k}"
+        base.append(f"{rng.choice(['https', 'http'])}://{host}{path}{rng.choices(tails, weights=[30, 20, 10, 15, 5, 8, 4, 8])[0]}")
+    # 상위 링크가 뉴스레터마다 반복되는 Zipf 형태
+    weights = [1 / (rank + 1) ** 0.9 for rank in range(unique)]
+    return rng.choices(base, weights=weights, k=n)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--urls", type=int, default=1_000_000)
+    parser.add_argument("--unique", type=int, default=150_000)
+    parser.add_argument("--batch", type=int, default=500, help="ingest 배치 크기와 같게")
+    args = parser.parse_args()
+    corpus = make_corpus(args.urls, args.unique)
+
+    started = time.perf_counter()
+    legacy = [(legacy_canonicalize(u), legacy_url_hash(u)) for u in corpus]
+    legacy_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for u in corpus:
+        hashlib.sha256(utils._canonicalize(u).encode()).hexdigest()
+    no_memo_s = time.perf_counter() - started
+
+    utils.canonical_url_key.cache_clear()
+    started = time.perf_counter()
+    batched = []
+    for start in range(0, len(corpus), args.batch):
+        batched.extend(canonicalize_urls(corpus[start:start + args.batch]))
+    batched_s = time.perf_counter() - started
+
+    assert [tuple(r) for r in batched] == legacy, "출력 불일치"
+    info = utils.canonical_url_key.cache_info()
+    print(f"urls={len(corpus):,} unique={len(set(corpus)):,} cache={info.maxsize:,} hit={info.hits / len(corpus):.1%}")
+    print(f"legacy   {legacy_s:7.2f}s {len(corpus) / legacy_s:12,.0f} urls/s")
+    print(f"no-memo  {no_memo_s:7.2f}s {len(corpus) / no_memo_s:12,.0f} urls/s  ({legacy_s / no_memo_s:.1f}x, 빠른 경로만)")
+    print(f"batched  {batched_s:7.2f}s {len(corpus) / batched_s:12,.0f} urls/s  ({legacy_s / batched_s:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""항목 목록 페이지 조회 지연: LIMIT/OFFSET vs (collected_at, id) 키셋 커서 (dashboard.queries.item_page).
+
+같은 깊이의 페이지를 두 방식으로 반복 조회해 p50 을 비교한다. 키셋은 앞 페이지를 걸어 얻은 커서로 한 번에 조회.
+
+사용법: python benchmarks/bench_pagination.py --items 200000 --depths 1 10 100 1000
+"""
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sqlalchemy import select  # noqa: E402
+from linkedin_intel.config import settings  # noqa: E402
+from linkedin_intel.connectors.base import BaseConnector  # noqa: E402
+from linkedin_intel.dashboard import queries  # noqa: E402
+from linkedin_intel.models import database, get_session, Item  # noqa: E402
+
+PAGE = 100
+
+
+class ListConnector(BaseConnector):
+    channel = "google_cse"
+
+    def fetch(self, items, **kwargs):
+        return items
+
+
+def p50_ms(fn, rounds: int = 20) -> float:
+    latencies = []
+    for _ in range(rounds):
+        t = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - t) * 1000)
+    return statistics.median(latencies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--depths", type=int, nargs="*", default=[1, 10, 100, 1000])
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.database_path = str(Path(tmp) / "bench.db")
+        database._engine = database._SessionLocal = None
+        database.init_db()
+        database.seed_data()
+        ListConnector(query_id=1).ingest(chunk_size=5000, items=({"url": f"https://www.linkedin.com/posts/u_activity-{k}",
+            "title": f"Post {k}", "snippet": "Software defined vehicle " * 10} for k in range(args.items)))
+        with get_session(read_only=True) as s:
+            offset_stmt = select(Item.id, Item.title, Item.channel, Item.collected_at, Item.url).where(Item.query_id == 1) \
+                .order_by(Item.collected_at.desc(), Item.id.desc()).limit(PAGE)
+            cursors, page = {1: None}, queries.item_page(s, query_id=1, limit=PAGE)
+            for depth in range(2, max(args.depths) + 1):
+                if not page.has_next:
+                    break
+                cursors[depth] = page.last
+                page = queries.item_page(s, query_id=1, after=page.last, limit=PAGE)
+            for depth in args.depths:
+                if depth not in cursors:
+                    continue
+                offset = p50_ms(lambda depth=depth: [r._asdict() for r in s.execute(offset_stmt.offset((depth - 1) * PAGE))])
+                keyset = p50_ms(lambda depth=depth: queries.item_page(s, query_id=1, after=cursors[depth], limit=PAGE))
+                print(f"page {depth:5d}  offset p50 {offset:8.2f} ms   keyset p50 {keyset:6.2f} ms")
+        database.get_engine().dispose()
+        database.get_engine(read_only=True).dispose()
+
+
+if __name__ == "__main__":
+    main()
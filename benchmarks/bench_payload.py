@@ -0,0 +1,104 @@
+"""raw payload 저장 비교: items.raw_json 평문 vs item_payloads (zlib + 학습 사전), 'geo compact' 전후.
+
+CSE 응답과 비슷한 pagemap(metatags/cse_image/...) 을 가진 항목으로 변경 전 형태의 DB 를 만든 뒤
+파일 크기, 전체 행 조회(SELECT * ... LIMIT 1000) 지연, payload 1건 디코딩 시간을 compact 전후로 잰다.
+
+사용법: python benchmarks/bench_payload.py --items 30000
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sqlalchemy import text  # noqa: E402
+from linkedin_intel.config import settings  # noqa: E402
+from linkedin_intel.connectors.base import BaseConnector  # noqa: E402
+from linkedin_intel.models import database, get_engine, get_session  # noqa: E402
+from linkedin_intel.payload import compact, dumps, encode, load_payload, train_dictionary  # noqa: E402
+
+
+class ListConnector(BaseConnector):
+    channel = "google_cse"
+
+    def fetch(self, items, **kwargs):
+        return items
+
+
+def make_pagemap(rng: random.Random, k: int) -> dict:
+    user = f"user{rng.randrange(5000)}"
+    title = f"{rng.choice(['Excited to share', 'Proud moment', 'New release', 'Hiring'])}: SDV cockpit update #{k}"
+    image = f"https://media.licdn.com/dms/image/v2/D56{rng.getrandbits(40):010x}/feedshare-shrink_800/0/{rng.getrandbits(44)}"
+    return {"displayLink": "www.linkedin.com", "formattedUrl": f"https://www.linkedin.com/posts/{user}_activity-{k}",
+        "pagemap": {
+            "cse_thumbnail": [{"src": f"https://encrypted-tbn0.gstatic.com/images?q=tbn:{rng.getrandbits(64):016x}", "width": "225", "height": "225"}],
+            "metatags": [{"og:image": image, "og:type": "article", "twitter:card": "summary_large_image", "twitter:title": title,
+                "og:site_name": "LinkedIn", "twitter:site": "@LinkedIn", "al:android:url": f"https://www.linkedin.com/posts/{user}_activity-{k}",
+                "al:ios:app_name": "LinkedIn", "al:android:app_name": "LinkedIn", "al:ios:app_store_id": "288429040",
+                "al:android:package": "com.linkedin.android", "og:title": title, "twitter:image": image,
+                "og:description": "Software defined vehicle, digital cockpit and ADAS " * rng.randint(1, 3),
+                "article:published_time": f"2026-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}T0{rng.randint(0, 9)}:00:00.000Z",
+                "viewport": "width=device-width, initial-scale=1.0", "locale": "en_US", "litmsprofilename": "public-post"}],
+            "socialmediaposting": [{"headline": title, "datepublished": "2026-03-01", "commentcount": str(rng.randint(0, 90))}],
+            "interactioncounter": [{"userinteractioncount": str(rng.randint(0, 900)), "interactiontype": "https://schema.org/LikeAction"}],
+            "cse_image": [{"src": image}]}}
+
+
+def read_latency_ms(rounds: int = 30) -> float:
+    latencies = []
+    with get_engine().connect() as conn:
+        for _ in range(rounds):
+            t = time.perf_counter()
+            conn.execute(text("SELECT * FROM items ORDER BY collected_at DESC LIMIT 1000")).all()
+            latencies.append((time.perf_counter() - t) * 1000)
+    return statistics.median(latencies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=30_000)
+    args = parser.parse_args()
+    rng = random.Random(42)
+    payloads = [make_pagemap(rng, k) for k in range(args.items)]
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.database_path = str(Path(tmp) / "bench.db")
+        database._engine = database._SessionLocal = None
+        database.init_db()
+        database.seed_data()
+        ListConnector(query_id=1).ingest(items=[{"url": p["formattedUrl"], "title": p["pagemap"]["metatags"][0]["og:title"],
+            "raw": p} for p in payloads])
+        # 변경 전 형태로: payload 를 평문 raw_json 컬럼으로 되돌린다
+        with get_engine().begin() as conn:
+            conn.exec_driver_sql("ALTER TABLE items ADD COLUMN raw_json TEXT")
+            conn.exec_driver_sql("DELETE FROM item_payloads")
+            conn.execute(text("UPDATE items SET raw_json = :raw WHERE id = :id"),
+                [{"raw": json.dumps(p), "id": i + 1} for i, p in enumerate(payloads)])
+        with get_engine().connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.exec_driver_sql("VACUUM")
+        before_read = read_latency_ms()
+        result = compact(get_engine())
+        after_read = read_latency_ms()
+        with get_session() as s:
+            t = time.perf_counter()
+            for item_id in range(1, 1001):
+                load_payload(s, item_id)
+            decode_us = (time.perf_counter() - t) * 1000
+        database.get_engine().dispose()
+
+    raw_bytes = sum(len(json.dumps(p)) for p in payloads)
+    zdict = train_dictionary([dumps(p) for p in payloads[:2000]])
+    plain_z = sum(len(encode(p)) for p in payloads[:5000]) / 5000
+    dict_z = sum(len(encode(p, zdict)) for p in payloads[:5000]) / 5000
+    print(f"payload   raw {raw_bytes / len(payloads):6.0f} B/item  zlib {plain_z:6.0f} B/item  zlib+dict {dict_z:6.0f} B/item")
+    print(f"db file   {result.bytes_before / 1e6:7.1f} MB -> {result.bytes_after / 1e6:7.1f} MB (compact, {result.converted:,} items)")
+    print(f"read      SELECT * LIMIT 1000 p50 {before_read:.2f} ms -> {after_read:.2f} ms")
+    print(f"decode    load_payload (조회+해제) {decode_us:.1f} us/item (1000 items)")
+
+
+if __name__ == "__main__":
+    main()
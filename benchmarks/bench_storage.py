@@ -0,0 +1,106 @@
+"""SQLite 저장 프로필별 수집 처리량 / 대시보드 조회 지연 비교.
+
+각 프로필마다 새 DB 에 청크 단위 커밋으로 수집한 뒤, 별도 프로세스가 계속 수집(쓰기)하는 동안
+대시보드와 같은 조회를 읽기 전용 연결로 반복해 지연과 락 에러 수를 잰다.
+
+사용법: python benchmarks/bench_storage.py --items 50000 --chunk-size 500 --reads 200
+"""
+import argparse
+import multiprocessing as mp
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sqlalchemy.exc import OperationalError  # noqa: E402
+from linkedin_intel.config import settings  # noqa: E402
+from linkedin_intel.connectors.base import BaseConnector  # noqa: E402
+from linkedin_intel.dashboard import queries  # noqa: E402
+from linkedin_intel.models import database, get_session  # noqa: E402
+from linkedin_intel.models.database import STORAGE_PROFILES  # noqa: E402
+
+
+class ListConnector(BaseConnector):
+    channel = "google_cse"
+
+    def fetch(self, items, **kwargs):
+        return items
+
+
+def make_items(start: int, n: int) -> list[dict]:
+    return [{"url": f"https://www.linkedin.com/posts/user{k % 997}_activity-{k}", "title": f"Post {k} about SDV",
+        "snippet": "Software defined vehicle cockpit " * 4, "raw": {"displayLink": "linkedin.com"}} for k in range(start, start + n)]
+
+
+def use_db(path: Path, profile: str) -> None:
+    settings.database_path = str(path)
+    settings.sqlite_profile = profile
+    database._engine = database._SessionLocal = database._ro_engine = database._ro_SessionLocal = None
+
+
+def writer(path: str, profile: str, start: int, chunk_size: int, stop) -> None:
+    use_db(Path(path), profile)
+    while not stop.is_set():
+        ListConnector(query_id=1).ingest(chunk_size=chunk_size, items=make_items(start, chunk_size * 4))
+        start += chunk_size * 4
+
+
+def dashboard_queries() -> None:
+    """dashboard/app.py 가 캐시 미스 때 실행하는 조회 묶음."""
+    with get_session(read_only=True) as session:
+        queries.data_version(session)
+        queries.overview(session)
+        queries.item_stats(session, query_id=1, channel="google_cse")
+        queries.item_page(session, query_id=1)
+
+
+def bench_profile(profile: str, items: int, chunk_size: int, reads: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        use_db(path, profile)
+        database.init_db()
+        database.seed_data()
+        started = time.perf_counter()
+        ListConnector(query_id=1).ingest(chunk_size=chunk_size, items=make_items(0, items))
+        ingest_rate = items / (time.perf_counter() - started)
+        database.get_engine().dispose()
+
+        stop = mp.get_context("spawn").Event()
+        proc = mp.get_context("spawn").Process(target=writer, args=(str(path), profile, items, chunk_size, stop))
+        proc.start()
+        time.sleep(1.0)
+        latencies, locked = [], 0
+        for _ in range(reads):
+            t = time.perf_counter()
+            try:
+                dashboard_queries()
+                latencies.append((time.perf_counter() - t) * 1000)
+            except OperationalError:
+                locked += 1
+        stop.set()
+        proc.join()
+        database.get_engine(read_only=True).dispose()
+    latencies.sort()
+    return {"profile": profile, "ingest_items_per_s": round(ingest_rate),
+        "read_p50_ms": round(statistics.median(latencies), 2) if latencies else None,
+        "read_p95_ms": round(latencies[int(len(latencies) * 0.95) - 1], 2) if latencies else None, "read_locked_errors": locked}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=50_000)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--reads", type=int, default=200)
+    parser.add_argument("--profiles", nargs="*", default=list(STORAGE_PROFILES))
+    args = parser.parse_args()
+    for profile in args.profiles:
+        r = bench_profile(profile, args.items, args.chunk_size, args.reads)
+        print(f"{r['profile']:13s} ingest {r['ingest_items_per_s']:>8,} items/s  read p50 {r['read_p50_ms']} ms  "
+              f"p95 {r['read_p95_ms']} ms  locked {r['read_locked_errors']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""dedup 키 비교: canonical_url UNIQUE(문자열 인덱스) vs url_key(8바이트 정수 인덱스) + URL 확인.
+
+같은 항목을 두 형태의 items 테이블에 넣고 DB 파일/인덱스 크기와 배치 dedup 조회(500개 IN) 지연을 잰다.
+조회는 ingest 와 같게 절반은 기존 URL, 절반은 새 URL 로 섞는다.
+
+사용법: python benchmarks/bench_url_key.py --items 200000 --probes 400
+"""
+import argparse
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from linkedin_intel.utils import canonicalize_urls  # noqa: E402
+
+COLUMNS = """id INTEGER PRIMARY KEY, url VARCHAR(2048) NOT NULL, {key} title VARCHAR(500), snippet TEXT,
+    collected_at DATETIME NOT NULL, last_seen_at DATETIME NOT NULL, query_id INTEGER, channel VARCHAR(50) NOT NULL"""
+LAYOUTS = {
+    "canonical_url UNIQUE": {
+        "ddl": [f"CREATE TABLE items ({COLUMNS.format(key='canonical_url VARCHAR(2048) NOT NULL UNIQUE,')})"],
+        "probe": "SELECT canonical_url FROM items WHERE canonical_url IN ({marks})",
+        "args": lambda keys: [k.url for k in keys]},
+    "url_key INDEX": {
+        "ddl": [f"CREATE TABLE items ({COLUMNS.format(key='canonical_url VARCHAR(2048) NOT NULL, url_key BIGINT NOT NULL,')})",
+            "CREATE INDEX idx_items_url_key ON items (url_key)"],
+        "probe": "SELECT canonical_url FROM items WHERE url_key IN ({marks})",
+        "args": lambda keys: [k.key for k in keys]},
+}
+
+
+def make_urls(n: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    return [f"https://www.linkedin.com/posts/{rng.choice(['lg-vs', 'sdv', 'mobility'])}-user{rng.randrange(50_000)}"
+        f"_software-defined-vehicle-cockpit-activity-{7100000000000000000 + k}-{rng.getrandbits(16):04x}/"
+        f"?utm_source=share&utm_medium=member_desktop" for k in range(n)]
+
+
+def bench_layout(name: str, layout: dict, stored: list, probes: list[list], tmp: Path) -> dict:
+    path = tmp / f"{name.split()[0]}.db"
+    conn = sqlite3.connect(path)
+    for ddl in layout["ddl"]:
+        conn.execute(ddl)
+    has_key = "url_key" in layout["ddl"][0]
+    rows = [(k.url, k.url, *((k.key,) if has_key else ()), "Post about SDV", "snippet " * 8, "2026-01-01", "2026-01-01", 1, "email")
+        for k in stored]
+    cols = "url, canonical_url, " + ("url_key, " if has_key else "") + "title, snippet, collected_at, last_seen_at, query_id, channel"
+    started = time.perf_counter()
+    conn.executemany(f"INSERT INTO items ({cols}) VALUES ({', '.join('?' * len(rows[0]))})", rows)
+    conn.commit()
+    insert_s = time.perf_counter() - started
+    conn.execute("VACUUM")
+    index_bytes = conn.execute("SELECT sum(pgsize) FROM dbstat WHERE name LIKE 'sqlite_autoindex_items%' OR name LIKE 'idx_items%'").fetchone()[0]
+    conn.close()
+
+    conn = sqlite3.connect(path)  # 캐시 비운 상태에서 시작
+    latencies = []
+    for batch in probes:
+        args = layout["args"](batch)
+        t = time.perf_counter()
+        found = {url for (url,) in conn.execute(layout["probe"].format(marks=", ".join("?" * len(args))), args)}
+        existing = [k for k in batch if k.url in found]  # url_key 는 전체 URL 로 충돌 확인 (ingest 와 같은 비용)
+        latencies.append((time.perf_counter() - t) * 1000)
+    conn.close()
+    latencies.sort()
+    return {"layout": name, "db_mb": path.stat().st_size / 1e6, "index_mb": index_bytes / 1e6, "insert_s": insert_s,
+        "p50_ms": statistics.median(latencies), "p95_ms": latencies[int(len(latencies) * 0.95) - 1], "found_last": len(existing)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--probes", type=int, default=400, help="500개 IN 조회 반복 수")
+    args = parser.parse_args()
+    stored = canonicalize_urls(make_urls(args.items, seed=1))
+    fresh = canonicalize_urls(make_urls(args.probes * 250, seed=2))
+    rng = random.Random(3)
+    probes = [rng.sample(stored, 250) + fresh[i * 250:(i + 1) * 250] for i in range(args.probes)]
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, layout in LAYOUTS.items():
+            r = bench_layout(name, layout, stored, probes, Path(tmp))
+            print(f"{r['layout']:21s} db {r['db_mb']:7.1f} MB  dedup index {r['index_mb']:6.1f} MB  insert {r['insert_s']:5.2f}s  "
+                  f"probe p50 {r['p50_ms']:.2f} ms  p95 {r['p95_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
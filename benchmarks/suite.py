@@ -0,0 +1,398 @@
+"""핫 패스 벤치마크 묶음: URL 정규화 / 커넥터별 ingest / 이메일·RSS 파싱 / 대시보드 조회.
+
+크기(항목 수)마다 고정 시드로 픽스처를 만들고, 케이스마다 워밍업 후 repeat 회 실행한 중앙값을 JSON 으로 남긴다.
+ingest 케이스는 반복마다 새 DB 와 빈 URL 캐시에서 시작한다 (준비 시간은 측정에서 뺀다).
+--compare 로 이전 결과와 비교해 중앙값이 threshold 이상 느려진 케이스가 있으면 종료 코드 1.
+
+사용법: python benchmarks/suite.py --sizes 10000 100000 --out bench.json --compare baseline.json --threshold 0.1
+"""
+import argparse
+import email.message
+import fnmatch
+import gc
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+import feedparser  # noqa: E402
+import sqlalchemy  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+from bench_canonicalize import make_corpus  # noqa: E402
+from linkedin_intel.config import settings  # noqa: E402
+from linkedin_intel.connectors.base import BaseConnector  # noqa: E402
+from linkedin_intel.connectors.csv_import import CSVConnector  # noqa: E402
+from linkedin_intel.connectors.email_import import EmailConnector  # noqa: E402
+from linkedin_intel.connectors.google_cse import GoogleCSEConnector  # noqa: E402
+from linkedin_intel.connectors.rss import FeedPoll, RSSConnector, ingest_poll  # noqa: E402
+from linkedin_intel.dashboard import queries  # noqa: E402
+from linkedin_intel.models import database, get_session, Source, SourceType, SEED_QUERIES  # noqa: E402
+from linkedin_intel.rollup import rebuild_rollups  # noqa: E402
+from linkedin_intel.search import search_items  # noqa: E402
+from linkedin_intel.utils import canonical_url_key, canonicalize_url  # noqa: E402
+
+SEED = 42
+DUP_RATIO = 0.2  # ingest 입력 중 이미 본 URL 비율 (재수집 / 뉴스레터 간 반복 링크)
+LINKS_PER_EML = 50
+ENTRIES_PER_FEED = 50
+RSS_SOURCES = 20
+CSE_PAGE = 10
+CSE_PAGES_PER_QUERY = 3  # geo collect --pages 기본값: 쿼리 하나 = ingest 한 번
+PAGE_SIZE = 100  # dashboard/app.py PAGE_SIZE
+DEEP_PAGE = 50
+QUERY_CALLS = 20  # 대시보드 케이스 한 번 실행에서 반복하는 호출 수
+SEARCH_TEXT = "software defined vehicle"
+CHANNELS = ("google_cse", "rss", "email", "manual")
+
+
+@dataclass
+class Bench:
+    run: Callable[[], Any]
+    ops: int  # 실행 한 번이 처리하는 단위 수 (항목 / 조회 호출)
+    reset: Callable[[], None] | None = None  # 매 실행 전 준비 (측정 제외)
+
+
+class ListConnector(BaseConnector):
+    channel = "manual"
+
+    def fetch(self, items, **kwargs):
+        return items
+
+
+# ---------------------------------------------------------------------------
+# 픽스처 (크기별로 한 번 만들고 같은 크기의 케이스끼리 공유)
+# ---------------------------------------------------------------------------
+
+class Fixtures:
+    def __init__(self, size: int, workdir: Path):
+        self.size = size
+        self.workdir = workdir / str(size)
+        self.workdir.mkdir(parents=True, exist_ok=True)
+        self._cache: dict[str, Any] = {}
+
+    def _once(self, name: str, build: Callable[[], Any]) -> Any:
+        if name not in self._cache:
+            self._cache[name] = build()
+        return self._cache[name]
+
+    def urls(self) -> list[str]:
+        """추적 파라미터 / 서브도메인이 섞인 URL. 재등장은 Zipf 분포 (bench_canonicalize 와 같은 코퍼스)."""
+        return self._once("urls", lambda: make_corpus(self.size, max(1, int(self.size * (1 - DUP_RATIO))), SEED))
+
+    def published(self, k: int) -> datetime:
+        return datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=k * 7)
+
+    def csv_file(self) -> Path:
+        def build() -> Path:
+            import csv
+            path = self.workdir / "items.csv"
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["url", "title", "snippet", "published_at", "author"])
+                for k, url in enumerate(self.urls()):
+                    writer.writerow([url, f"Post {k} about SDV cockpit | LinkedIn", "Software defined vehicle " * 4,
+                        self.published(k).isoformat(), f"user{k % 997}"])
+            return path
+        return self._once("csv", build)
+
+    def eml_dir(self) -> Path:
+        """뉴스레터 한 통에 링크 LINKS_PER_EML 개. 일부는 Google 리다이렉트로 감싼다."""
+        def build() -> Path:
+            directory = self.workdir / "eml"
+            directory.mkdir(exist_ok=True)
+            urls = self.urls()
+            for n, start in enumerate(range(0, len(urls), LINKS_PER_EML)):
+                links = []
+                for k, url in enumerate(urls[start:start + LINKS_PER_EML], start):
+                    href = f"https://www.google.com/url?q={url}&sa=D" if k % 5 == 0 else url
+                    links.append(f'<p><a href="{href}">Post {k} about SDV cockpit</a><br>Software defined vehicle</p>')
+                msg = email.message.EmailMessage()
+                msg["Subject"], msg["From"] = f"Weekly digest {n}", "digest@linkedin.com"
+                msg["Date"] = format_datetime(self.published(start))
+                msg.set_content(f"<html><body>{''.join(links)}<a href='mailto:x@y.z'>unsubscribe</a></body></html>", subtype="html")
+                (directory / f"nl_{n:06d}.eml").write_bytes(msg.as_bytes())
+            return directory
+        return self._once("eml", build)
+
+    def feed_entries(self) -> list[feedparser.FeedParserDict]:
+        """feedparser 가 돌려주는 것과 같은 형태의 항목 (XML 파싱은 HTTP 조회 단계라 제외)."""
+        def build() -> list[feedparser.FeedParserDict]:
+            return [feedparser.FeedParserDict(id=f"urn:li:activity:{k}", link=url, title=f"Post {k} about SDV cockpit",
+                author=f"user{k % 997}", published=format_datetime(self.published(k)) if k % 3 else self.published(k).isoformat(),
+                summary=f"<p>Software defined vehicle <b>cockpit</b> update {k}</p><img src='x.png'>")
+                for k, url in enumerate(self.urls())]
+        return self._once("entries", build)
+
+    def cse_pages(self) -> list[dict[str, Any]]:
+        def build() -> list[dict[str, Any]]:
+            urls = self.urls()
+            return [{"items": [{"link": url, "title": f"Post {k} | LinkedIn", "snippet": "Software defined vehicle " * 4,
+                "displayLink": "www.linkedin.com", "formattedUrl": url,
+                "pagemap": {"metatags": [{"article:published_time": self.published(k).isoformat(), "author": f"user{k % 997}"}]}}
+                for k, url in enumerate(urls[start:start + CSE_PAGE], start)]} for start in range(0, len(urls), CSE_PAGE)]
+        return self._once("cse", build)
+
+    def dashboard_db(self) -> Path:
+        """채널 4개 x 시드 쿼리에 나눠 수집하고 collected_at 을 90일에 펼친 DB (집계/검색 색인 포함)."""
+        def build() -> Path:
+            path = self.workdir / "dashboard.db"
+            use_db(path)
+            query_ids = range(1, len(SEED_QUERIES) + 1)
+            items = ({"url": f"https://www.linkedin.com/posts/user{k % 997}_activity-{k}", "title": f"Post {k} about SDV cockpit",
+                "snippet": "Software defined vehicle " * 4 if k % 4 else "Infotainment platform update",
+                "channel": CHANNELS[k % len(CHANNELS)]} for k in range(self.size))
+            ListConnector(query_id=query_ids[0]).ingest(chunk_size=5000, items=items)
+            with database.get_engine().begin() as conn:
+                conn.execute(text(f"UPDATE items SET query_id = 1 + id % {len(query_ids)}, "
+                    "collected_at = datetime(collected_at, '-' || (id % 90) || ' days', '-' || (id % 1440) || ' minutes')"))
+                rebuild_rollups(conn)
+            database.get_engine().dispose()
+            return path
+        return self._once("dashboard_db", build)
+
+
+def close_db() -> None:
+    for engine in (database._engine, database._ro_engine):
+        if engine is not None:
+            engine.dispose()
+
+
+def use_db(path: Path, fresh: bool = True) -> None:
+    close_db()
+    if fresh:
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{path}{suffix}").unlink(missing_ok=True)
+    settings.database_path = str(path)
+    database._engine = database._SessionLocal = database._ro_engine = database._ro_SessionLocal = None
+    if fresh:
+        database.init_db()
+        database.seed_data()
+
+
+def fresh_ingest_db(fx: Fixtures, sources: int = 0) -> Callable[[], None]:
+    def reset() -> None:
+        use_db(fx.workdir / "ingest.db")
+        canonical_url_key.cache_clear()
+        if sources:
+            with get_session() as s:
+                s.add_all(Source(name=f"feed{n}", type=SourceType.RSS, config_json="{}") for n in range(sources))
+    return reset
+
+
+# ---------------------------------------------------------------------------
+# 케이스
+# ---------------------------------------------------------------------------
+
+def bench_canonicalize(fx: Fixtures) -> Bench:
+    urls = fx.urls()
+    return Bench(run=lambda: [canonicalize_url(u) for u in urls], ops=len(urls), reset=canonical_url_key.cache_clear)
+
+
+def bench_ingest_csv(fx: Fixtures) -> Bench:
+    path = fx.csv_file()
+    return Bench(run=lambda: CSVConnector(query_id=1).ingest(csv_path=path), ops=fx.size, reset=fresh_ingest_db(fx))
+
+
+def bench_ingest_email(fx: Fixtures) -> Bench:
+    directory = fx.eml_dir()
+    return Bench(run=lambda: EmailConnector(query_id=1).ingest(eml_path=directory), ops=fx.size, reset=fresh_ingest_db(fx))
+
+
+def bench_ingest_rss(fx: Fixtures) -> Bench:
+    """피드 하나 = ingest_poll 한 번 (스케줄러 / geo collect 의 쓰기 단계)."""
+    entries = fx.feed_entries()
+
+    def run() -> None:
+        for n, start in enumerate(range(0, len(entries), ENTRIES_PER_FEED)):
+            ingest_poll(FeedPoll(source_id=1 + n % RSS_SOURCES, name="feed", entries=entries[start:start + ENTRIES_PER_FEED]))
+    return Bench(run=run, ops=len(entries), reset=fresh_ingest_db(fx, sources=RSS_SOURCES))
+
+
+def bench_ingest_cse(fx: Fixtures) -> Bench:
+    """쿼리 하나 (CSE_PAGES_PER_QUERY 페이지) = ingest 한 번. HTTP 는 제외하고 응답 JSON 파싱부터."""
+    pages = fx.cse_pages()
+
+    def run() -> None:
+        for n, start in enumerate(range(0, len(pages), CSE_PAGES_PER_QUERY)):
+            connector = GoogleCSEConnector(query_id=1 + n % len(SEED_QUERIES))
+            connector.ingest(items=[item for page in pages[start:start + CSE_PAGES_PER_QUERY] for item in connector._parse_items(page)])
+    return Bench(run=run, ops=fx.size, reset=fresh_ingest_db(fx))
+
+
+def bench_parse_eml(fx: Fixtures) -> Bench:
+    files = sorted(fx.eml_dir().glob("*.eml"))
+    connector = EmailConnector()
+    return Bench(run=lambda: [connector._parse_eml(path) for path in files], ops=fx.size)
+
+
+def bench_parse_rss_entry(fx: Fixtures) -> Bench:
+    entries = fx.feed_entries()
+    connector = RSSConnector()
+    return Bench(run=lambda: [connector._parse_entry(entry) for entry in entries], ops=len(entries))
+
+
+def dashboard_bench(call: Callable[[Any], Any]) -> Callable[[Fixtures], Bench]:
+    """dashboard/app.py 의 load_* 와 같이 호출마다 읽기 전용 세션을 새로 연다 (캐시 미스 경로)."""
+    def build(fx: Fixtures) -> Bench:
+        use_db(fx.dashboard_db(), fresh=False)
+
+        def run() -> None:
+            for _ in range(QUERY_CALLS):
+                with get_session(read_only=True) as session:
+                    call(session)
+        return Bench(run=run, ops=QUERY_CALLS)
+    return build
+
+
+def deep_page(session) -> queries.ItemPage:
+    """DEEP_PAGE 번째 페이지 (커서는 앞 페이지를 걸어서 한 번만 구해 둔다)."""
+    if deep_page.cursor is None:
+        page = queries.item_page(session, limit=PAGE_SIZE)
+        for _ in range(DEEP_PAGE - 1):
+            if not page.has_next:
+                break
+            page = queries.item_page(session, after=page.last, limit=PAGE_SIZE)
+        deep_page.cursor = page.last
+    return queries.item_page(session, after=deep_page.cursor, limit=PAGE_SIZE)
+
+
+deep_page.cursor = None
+
+CASES: dict[str, Callable[[Fixtures], Bench]] = {
+    "canonicalize_url": bench_canonicalize,
+    "ingest.csv": bench_ingest_csv,
+    "ingest.email": bench_ingest_email,
+    "ingest.rss": bench_ingest_rss,
+    "ingest.google_cse": bench_ingest_cse,
+    "parse.eml": bench_parse_eml,
+    "parse.rss_entry": bench_parse_rss_entry,
+    "dashboard.data_version": dashboard_bench(queries.data_version),
+    "dashboard.overview": dashboard_bench(queries.overview),
+    "dashboard.item_stats": dashboard_bench(lambda s: queries.item_stats(s, None, None)),
+    "dashboard.item_stats_filtered": dashboard_bench(lambda s: queries.item_stats(s, 1, "google_cse")),
+    "dashboard.daily_series": dashboard_bench(lambda s: queries.daily_series(s, None, None)),
+    "dashboard.daily_series_filtered": dashboard_bench(lambda s: queries.daily_series(s, 1, "google_cse")),
+    "dashboard.item_page": dashboard_bench(lambda s: queries.item_page(s, None, None, limit=PAGE_SIZE)),
+    "dashboard.item_page_filtered": dashboard_bench(lambda s: queries.item_page(s, 1, "google_cse", limit=PAGE_SIZE)),
+    "dashboard.item_page_deep": dashboard_bench(deep_page),
+    "dashboard.search": dashboard_bench(lambda s: search_items(s, SEARCH_TEXT, query_id=None, channel=None, limit=50)),
+}
+
+
+# ---------------------------------------------------------------------------
+# 실행 / 비교
+# ---------------------------------------------------------------------------
+
+def measure(bench: Bench, warmup: int, repeat: int) -> list[float]:
+    timings = []
+    for n in range(warmup + repeat):
+        if bench.reset:
+            bench.reset()
+        gc.collect()
+        started = time.perf_counter()
+        bench.run()
+        elapsed = time.perf_counter() - started
+        if n >= warmup:
+            timings.append(elapsed)
+    return timings
+
+
+def summarize(case: str, size: int, bench: Bench, timings: list[float]) -> dict[str, Any]:
+    median = statistics.median(timings)
+    return {"case": case, "size": size, "ops": bench.ops, "repeat": len(timings), "median_s": round(median, 6),
+        "min_s": round(min(timings), 6), "max_s": round(max(timings), 6),
+        "stdev_s": round(statistics.stdev(timings), 6) if len(timings) > 1 else 0.0,
+        "per_op_us": round(median / bench.ops * 1e6, 3), "ops_per_s": round(bench.ops / median, 1)}
+
+
+def environment() -> dict[str, Any]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {"timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"), "git_commit": commit,
+        "python": platform.python_version(), "implementation": platform.python_implementation(), "platform": platform.platform(),
+        "machine": platform.machine(), "cpu_count": os.cpu_count(), "sqlite": sqlite3.sqlite_version,
+        "sqlalchemy": sqlalchemy.__version__, "sqlite_profile": settings.sqlite_profile}
+
+
+def compare(results: list[dict[str, Any]], baseline: dict[str, Any], threshold: float) -> list[dict[str, Any]]:
+    """(case, size) 가 같은 기준 결과보다 중앙값이 threshold 비율 이상 느려진 항목."""
+    before = {(r["case"], r["size"]): r for r in baseline["results"]}
+    env = baseline.get("environment", {})
+    for key in ("python", "sqlite", "machine", "cpu_count"):
+        if env.get(key) != environment()[key]:
+            print(f"! 기준과 환경이 다름: {key} {env.get(key)} -> {environment()[key]}")
+    regressions = []
+    print(f"\n{'case':34s} {'size':>9s} {'base ms':>10s} {'now ms':>10s} {'change':>8s}")
+    for r in results:
+        base = before.get((r["case"], r["size"]))
+        if base is None:
+            continue
+        change = r["median_s"] / base["median_s"] - 1 if base["median_s"] else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append({**r, "baseline_median_s": base["median_s"], "change": round(change, 4)})
+            flag = "  REGRESSION"
+        print(f"{r['case']:34s} {r['size']:>9,} {base['median_s'] * 1000:>10.2f} {r['median_s'] * 1000:>10.2f} {change:>+8.1%}{flag}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="*", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--cases", nargs="*", default=["*"], help="케이스 이름 glob (예: 'ingest.*' 'dashboard.search')")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--out", type=Path, help="결과 JSON 경로")
+    parser.add_argument("--compare", type=Path, help="비교할 기준 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.10, help="회귀로 볼 중앙값 증가 비율")
+    parser.add_argument("--workdir", type=Path, help="픽스처 / DB 디렉터리 (기본: 임시 디렉터리)")
+    parser.add_argument("--list", action="store_true", help="케이스 이름만 출력")
+    args = parser.parse_args()
+    if args.list:
+        print("\n".join(CASES))
+        return
+    selected = [name for name in CASES if any(fnmatch.fnmatchcase(name, pattern) for pattern in args.cases)]
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = args.workdir or Path(tmp)
+        for size in args.sizes:
+            fx = Fixtures(size, workdir)
+            deep_page.cursor = None
+            for name in selected:
+                bench = CASES[name](fx)
+                r = summarize(name, size, bench, measure(bench, args.warmup, args.repeat))
+                results.append(r)
+                print(f"{name:34s} {size:>9,}  median {r['median_s'] * 1000:>10.2f} ms  "
+                      f"{r['per_op_us']:>10.2f} us/op  ±{r['stdev_s'] * 1000:.2f} ms", flush=True)
+            close_db()
+
+    report = {"environment": environment(), "args": {"sizes": args.sizes, "cases": selected, "repeat": args.repeat,
+        "warmup": args.warmup}, "results": results}
+    if args.out:
+        args.out.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n")
+        print(f"\n결과 저장: {args.out}")
+    if args.compare:
+        regressions = compare(results, json.loads(args.compare.read_text()), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)}개 케이스가 {args.threshold:.0%} 이상 느려졌습니다")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
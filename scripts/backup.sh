@@ -11,6 +11,7 @@ set -euo pipefail
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 PROJECT_ROOT="$(dirname "$SCRIPT_DIR")"
 
+GEO="$PROJECT_ROOT/.venv/bin/geo"
 DATA_DIR="$PROJECT_ROOT/data"
 BACKUP_DIR="$PROJECT_ROOT/backups"
 DATE=$(date +%Y%m%d_%H%M%S)
@@ -19,8 +20,8 @@ mkdir -p "$BACKUP_DIR"
 
 if [ -f "$DATA_DIR/geo.db" ]; then
     BACKUP_FILE="$BACKUP_DIR/geo_$DATE.db"
-    cp "$DATA_DIR/geo.db" "$BACKUP_FILE"
-    echo "✅ 백업 완료: $BACKUP_FILE"
+    # WAL 모드(SQLITE_PROFILE)에서는 -wal 파일에만 있는 커밋이 있으므로 cp 대신 sqlite backup API 사용
+    DATABASE_PATH="$DATA_DIR/geo.db" "$GEO" backup "$BACKUP_FILE"
     
     # 파일 크기 표시
     SIZE=$(du -h "$BACKUP_FILE" | cut -f1)
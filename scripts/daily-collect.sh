@@ -57,7 +57,8 @@ source "$VENV/bin/activate"
 # =============================================================================
 log "💾 Step 1: DB 백업"
 if [ -f "$DATA_DIR/geo.db" ]; then
-    cp "$DATA_DIR/geo.db" "$BACKUP_DIR/geo_$DATE.db"
+    # 수집 중(WAL)에도 일관된 스냅샷이 되도록 cp 대신 sqlite backup API 사용
+    DATABASE_PATH="$DATA_DIR/geo.db" "$GEO" backup "$BACKUP_DIR/geo_$DATE.db" >> "$LOG_FILE" 2>&1 || error_exit "DB 백업 실패"
     log "  백업 완료: $BACKUP_DIR/geo_$DATE.db"
     
     # 30일 이상 된 백업 삭제
@@ -68,60 +69,22 @@ else
 fi
 
 # =============================================================================
-# 2. Google CSE 수집
+# 2. 전체 수집 (CSE + RSS + Email, 한 프로세스에서 동시에)
 # =============================================================================
-log "🔍 Step 2: Google CSE 수집"
-CSE_SUCCESS=0
-CSE_FAIL=0
-
-for QUERY_ID in 1 2 3 4 5; do
-    log "  쿼리 ID $QUERY_ID 수집 중..."
-    if $GEO ingest google-cse --query-id "$QUERY_ID" --pages 3 >> "$LOG_FILE" 2>&1; then
-        ((CSE_SUCCESS++))
-    else
-        ((CSE_FAIL++))
-        log "  ⚠️ 쿼리 ID $QUERY_ID 수집 실패"
-    fi
-    sleep 2  # Rate limit 대응
-done
-
-log "  CSE 완료: 성공 $CSE_SUCCESS, 실패 $CSE_FAIL"
+log "🚀 Step 2: 전체 수집"
+COLLECT_FAIL=0
 
-# =============================================================================
-# 3. RSS 수집
-# =============================================================================
-log "📡 Step 3: RSS 수집"
-RSS_SUCCESS=0
-RSS_FAIL=0
-
-for SOURCE_ID in 1 2 3; do
-    if $GEO ingest rss --source-id "$SOURCE_ID" >> "$LOG_FILE" 2>&1; then
-        ((RSS_SUCCESS++))
-    else
-        ((RSS_FAIL++))
-    fi
-done
-
-log "  RSS 완료: 성공 $RSS_SUCCESS, 실패 $RSS_FAIL"
-
-# =============================================================================
-# 4. Email 수집
-# =============================================================================
-log "📧 Step 4: Email 수집"
-if [ -d "$DATA_DIR/eml" ] && [ "$(ls -A "$DATA_DIR/eml" 2>/dev/null)" ]; then
-    if $GEO ingest email --path "$DATA_DIR/eml" --query-id 1 >> "$LOG_FILE" 2>&1; then
-        log "  Email 수집 완료"
-    else
-        log "  ⚠️ Email 수집 실패"
-    fi
+if $GEO collect --pages 3 --eml-path "$DATA_DIR/eml" --email-query-id 1 >> "$LOG_FILE" 2>&1; then
+    log "  수집 완료"
 else
-    log "  ⚠️ $DATA_DIR/eml 폴더가 비어있음, 스킵"
+    COLLECT_FAIL=1
+    log "  ⚠️ 일부 수집 실패 (상세는 $LOG_FILE)"
 fi
 
 # =============================================================================
-# 5. 로그 정리
+# 3. 로그 정리
 # =============================================================================
-log "🧹 Step 5: 로그 정리"
+log "🧹 Step 3: 로그 정리"
 find "$LOG_DIR" -name "*.log" -mtime +7 -delete 2>/dev/null || true
 log "  7일 이상 된 로그 삭제 완료"
 
@@ -130,12 +93,11 @@ log "  7일 이상 된 로그 삭제 완료"
 # =============================================================================
 log "=========================================="
 log "일일 수집 완료: $(date '+%Y-%m-%d %H:%M:%S')"
-log "  CSE: 성공 $CSE_SUCCESS, 실패 $CSE_FAIL"
-log "  RSS: 성공 $RSS_SUCCESS, 실패 $RSS_FAIL"
+log "  수집: $([ $COLLECT_FAIL -eq 0 ] && echo 성공 || echo 일부 실패)"
 log "=========================================="
 
 # 실패가 있으면 종료 코드 1
-if [ $CSE_FAIL -gt 0 ] || [ $RSS_FAIL -gt 0 ]; then
+if [ $COLLECT_FAIL -gt 0 ]; then
     exit 1
 fi
 
@@ -0,0 +1,105 @@
+"""디스크 응답 캐시 (유료 API 응답 재사용).
+
+키마다 gzip JSON 파일 하나. TTL 은 파일 mtime(받은 시각) 기준이고, 전체 크기가 한도를 넘으면 만료된 것부터,
+그다음 오래 전에 받은 것부터 지운다. 쓰기는 임시 파일 + rename 이라 여러 프로세스가 같은 디렉터리를 써도 반쯤 쓴 파일을 읽지 않는다.
+"""
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+EVICT_TO = 0.9  # 한도를 넘으면 이 비율까지 줄인다 (매 쓰기마다 정리하지 않도록)
+
+
+class ResponseCache:
+    def __init__(self, directory: str | Path, ttl_seconds: float, max_bytes: int):
+        self.directory = Path(directory)
+        self.ttl = ttl_seconds
+        self.max_bytes = max_bytes
+        self._size: int | None = None  # 처음 쓸 때 디렉터리를 한 번 훑어 계산
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_bytes > 0
+
+    def _path(self, key: tuple) -> Path:
+        digest = hashlib.sha256(json.dumps(key, ensure_ascii=False).encode()).hexdigest()
+        return self.directory / f"{digest}.json.gz"
+
+    def get(self, key: tuple) -> Any | None:
+        """만료 전이면 저장된 값, 없거나 만료/손상이면 None."""
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            return json.loads(gzip.decompress(path.read_bytes()))
+        except (OSError, EOFError, ValueError):
+            return None
+
+    def put(self, key: tuple, value: Any) -> None:
+        if not self.enabled:
+            return
+        data = gzip.compress(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode(), compresslevel=6)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        with self._lock:
+            if self._size is None:
+                self._size = self.size()
+            else:
+                self._size += len(data)
+            if self._size > self.max_bytes:
+                self._size = self._evict(int(self.max_bytes * EVICT_TO))
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        for path in self.directory.glob("*.json.gz"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue  # 다른 프로세스가 방금 지움
+            entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def size(self) -> int:
+        return sum(size for _, size, _ in self._entries()) if self.directory.exists() else 0
+
+    def _evict(self, target: int) -> int:
+        """만료 항목을 지우고, 그래도 target 을 넘으면 오래된 순으로 지운다. 남은 크기를 반환."""
+        now = time.time()
+        kept, total = [], 0
+        for mtime, size, path in sorted(self._entries()):
+            if now - mtime > self.ttl:
+                path.unlink(missing_ok=True)
+            else:
+                kept.append((size, path))
+                total += size
+        for size, path in kept:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        return total
+
+    def clear(self) -> int:
+        """전부 지우고 지운 파일 수를 반환."""
+        entries = self._entries() if self.directory.exists() else []
+        for _, _, path in entries:
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self._size = 0
+        return len(entries)
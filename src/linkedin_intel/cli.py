@@ -2,17 +2,30 @@
 import logging
 import subprocess
 import sys
+from datetime import datetime
 from pathlib import Path
 import typer
 from rich.console import Console
-from rich.table import Table
 
 app = typer.Typer(name="geo", help="LG VS GEO - LinkedIn Intelligence CLI", add_completion=False)
 ingest_app = typer.Typer(help="데이터 수집")
 app.add_typer(ingest_app, name="ingest")
+rollup_app = typer.Typer(help="일자별 집계 (item_rollups)")
+app.add_typer(rollup_app, name="rollup")
+scheduler_app = typer.Typer(help="상주 수집 스케줄러 (쿼리/소스별 주기, jitter, 실패 시 backoff)")
+app.add_typer(scheduler_app, name="scheduler")
+synth_app = typer.Typer(help="부하 테스트용 합성 데이터 / 오프라인 대역 서버 (CSE API, RSS)")
+app.add_typer(synth_app, name="synth")
+tags_app = typer.Typer(help="자동 태깅 규칙 (키워드 / 정규식)")
+app.add_typer(tags_app, name="tags")
 console = Console()
 
 
+def quota_line(q) -> str:
+    limit = f"{q.limit:,}" if q.limit else "무제한"
+    return f"CSE 할당량 {q.day}: {q.requests:,} / {limit} 사용, 캐시 적중 {q.cache_hits:,}"
+
+
 def setup_logging(verbose: bool = False):
     from linkedin_intel.config import settings
     level = logging.DEBUG if verbose else getattr(logging, settings.log_level)
@@ -38,26 +51,44 @@ def init_db(seed: bool = typer.Option(False, "--seed", "-s"), force: bool = type
 @app.command("status")
 def status():
     """DB 상태 확인."""
-    from linkedin_intel.models import get_db_path, get_session, Query, Source, Item, Run, Tag
+    from rich.table import Table
+    from sqlalchemy import func
+    from linkedin_intel.models import get_db_path, get_session, init_db, Query, Source, ItemRollup, Run, Tag
+    from linkedin_intel.quota import usage
     db = get_db_path()
     if not db.exists():
         console.print("[red]✗ DB 없음. 'geo init-db' 실행 필요[/]")
         raise typer.Exit(1)
+    init_db()
     with get_session() as s:
         table = Table(title=f"DB 상태: {db}")
         table.add_column("항목", style="cyan")
         table.add_column("개수", style="green", justify="right")
         table.add_row("Queries", str(s.query(Query).count()))
         table.add_row("Sources", str(s.query(Source).count()))
-        table.add_row("Items", str(s.query(Item).count()))
+        table.add_row("Items", str(s.query(func.coalesce(func.sum(ItemRollup.new_count), 0)).scalar()))
         table.add_row("Runs", str(s.query(Run).count()))
         table.add_row("Tags", str(s.query(Tag).count()))
         console.print(table)
+        quota = usage(s)
+    console.print(f"[{'red' if quota.exhausted else 'dim'}]{quota_line(quota)}[/]")
+
+
+@app.command("backup")
+def backup(dest: Path = typer.Argument(..., help="백업 파일 경로")):
+    """DB 온라인 백업 (WAL 사용 중에도 일관된 스냅샷, 수집과 동시에 실행 가능)."""
+    from linkedin_intel.models import backup_db, get_db_path
+    if not get_db_path().exists():
+        console.print(f"[red]✗ DB 없음: {get_db_path()}[/]")
+        raise typer.Exit(1)
+    backup_db(dest)
+    console.print(f"[green]✓ 백업 완료: {dest} ({dest.stat().st_size / 1e6:,.1f} MB)[/]")
 
 
 @app.command("queries")
 def list_queries():
     """쿼리 목록."""
+    from rich.table import Table
     from linkedin_intel.models import init_db, get_session, Query
     init_db()
     with get_session() as s:
@@ -74,38 +105,357 @@ def list_queries():
         console.print(table)
 
 
+@app.command("runs")
+def list_runs(limit: int = typer.Option(20, "--limit", "-n"), stats: bool = typer.Option(False, "--stats", help="커넥터별 단계 시간/바이트/RSS 백분위"),
+              window: int = typer.Option(200, "--window", help="--stats 에 쓸 최근 Run 수"),
+              prom_file: str = typer.Option(None, "--prom-file", help="Prometheus textfile 형식으로 저장할 경로")):
+    """최근 수집 실행 (Run) 목록 / 지표."""
+    from rich.table import Table
+    from linkedin_intel.metrics import PHASES, load_run_stats, percentile, write_textfile
+    from linkedin_intel.models import init_db, get_session, Run
+    init_db()
+    with get_session(read_only=True) as s:
+        grouped = load_run_stats(s, limit=window) if stats else {}
+        runs = [] if stats else s.query(Run).order_by(Run.id.desc()).limit(limit).all()
+        if prom_file:
+            write_textfile(prom_file, s)
+            console.print(f"[green]✓ Prometheus textfile 저장: {prom_file}[/]")
+        if not stats:
+            table = Table(title="최근 실행")
+            for column in ("ID", "상태", "시작", "소요(s)", "신규", "쿼리/소스", "에러"):
+                table.add_column(column, justify="right" if column in ("ID", "소요(s)", "신규") else "left")
+            for r in runs:
+                seconds = f"{(r.ended_at - r.started_at).total_seconds():.1f}" if r.ended_at else "-"
+                target = f"q{r.query_id}" if r.query_id else f"s{r.source_id}" if r.source_id else "-"
+                table.add_row(str(r.id), r.status.value, r.started_at.strftime("%m-%d %H:%M:%S"), seconds, str(r.records_fetched), target,
+                    (r.error or "")[:40])
+            console.print(table)
+            return
+    if not grouped:
+        console.print("[yellow]지표가 기록된 실행 없음[/]")
+        return
+    table = Table(title=f"커넥터별 실행 지표 (최근 {window}개 Run)")
+    for column in ("커넥터", "지표", "p50", "p95", "max"):
+        table.add_column(column, style="cyan" if column == "커넥터" else None, justify="left" if column in ("커넥터", "지표") else "right")
+
+    def row(connector: str, label: str, values: list[float], fmt) -> None:
+        table.add_row(connector, label, fmt(percentile(values, 0.5)), fmt(percentile(values, 0.95)), fmt(max(values)))
+
+    seconds, mb = (lambda v: f"{v:.3f}s"), (lambda v: f"{v / 1e6:.1f}MB")
+    for connector, entry in grouped.items():
+        label = f"{connector} ({entry.runs}회, 실패 {entry.failed})"
+        row(label, "ingest 전체", entry.samples["ingest_seconds"], seconds)
+        for phase in PHASES:
+            if any(entry.samples[f"phase:{phase}"]):
+                row("", phase, entry.samples[f"phase:{phase}"], seconds)
+        if any(entry.samples["bytes_downloaded"]):
+            row("", "다운로드", entry.samples["bytes_downloaded"], mb)
+        if entry.samples.get("rss_end_bytes"):
+            row("", "종료 시 RSS", entry.samples["rss_end_bytes"], mb)
+        row("", "프로세스 최대 RSS", entry.samples["process_peak_rss_bytes"], mb)
+    console.print(table)
+
+
+@rollup_app.command("rebuild")
+def rollup_rebuild():
+    """items 전체로 일자별 집계 재구성."""
+    from sqlalchemy import func, select
+    from linkedin_intel.models import init_db, get_engine, ItemRollup
+    from linkedin_intel.rollup import rebuild_rollups
+    init_db()
+    with get_engine().begin() as conn:
+        rebuild_rollups(conn)
+        rows, items = conn.execute(select(func.count(), func.coalesce(func.sum(ItemRollup.new_count), 0))).one()
+    console.print(f"[green]✓ 집계 재구성 완료: {rows}행 (items {items:,}건)[/]")
+
+
+@app.command("compact")
+def compact(samples: int = typer.Option(2000, "--samples", help="사전 학습에 쓸 payload 수"),
+            vacuum: bool = typer.Option(True, "--vacuum/--no-vacuum", help="변환 후 VACUUM 으로 파일 크기 축소")):
+    """items.raw_json 평문을 압축 payload 테이블로 옮기고 사전을 다시 학습해 재압축."""
+    from linkedin_intel.models import init_db, get_engine
+    from linkedin_intel.payload import compact as do_compact
+    init_db()
+    result = do_compact(get_engine(), samples=samples, vacuum=vacuum)
+    if result.dict_id is None:
+        console.print("[yellow]압축할 payload 없음[/]")
+        return
+    console.print(f"[green]✓ payload 압축 완료: 변환 {result.converted:,}건, 재압축 {result.recompressed:,}건 (사전 #{result.dict_id})[/]")
+    console.print(f"  DB 크기 {result.bytes_before / 1e6:,.1f} MB → {result.bytes_after / 1e6:,.1f} MB")
+
+
+@app.command("payload")
+def payload(item_id: int = typer.Argument(..., help="Item ID")):
+    """항목 원본 payload(raw) 를 풀어서 출력."""
+    from linkedin_intel.models import init_db, get_session
+    from linkedin_intel.payload import load_payload
+    init_db()
+    with get_session(read_only=True) as s:
+        raw = load_payload(s, item_id)
+    if raw is None:
+        console.print(f"[yellow]payload 없음: item {item_id}[/]")
+        raise typer.Exit(1)
+    console.print_json(data=raw)
+
+
+@app.command("neardup")
+def neardup(rebuild: bool = typer.Option(False, "--rebuild", help="전체 항목의 서명/묶음 재계산 (기존 DB, NEARDUP_THRESHOLD 변경 후)"),
+            top: int = typer.Option(10, "--top", "-n", help="큰 묶음 몇 개를 보여줄지")):
+    """유사 게시물 묶음 현황 (제목+스니펫 MinHash)."""
+    from rich.table import Table
+    from linkedin_intel.config import settings
+    from linkedin_intel.models import init_db, get_session
+    from linkedin_intel.neardup import cluster_stats, rebuild_clusters, top_clusters
+    init_db()
+    if rebuild:
+        if not settings.neardup_threshold:
+            console.print("[red]✗ NEARDUP_THRESHOLD=0 (유사 게시물 묶기 꺼짐)[/]")
+            raise typer.Exit(1)
+        with console.status("서명 계산 중...") as status:
+            stats = rebuild_clusters(on_batch=lambda done: status.update(f"서명 계산 중... {done:,}건"))
+        console.print("[green]✓ 유사 게시물 묶음 재구성 완료[/]")
+    else:
+        with get_session(read_only=True) as s:
+            stats = cluster_stats(s)
+    console.print(f"서명 {stats.signed:,}건, 묶음 {stats.clusters:,}개 (묶인 구성원 {stats.clustered:,}건, 기준 유사도 {settings.neardup_threshold:g})")
+    with get_session(read_only=True) as s:
+        clusters = top_clusters(s, top)
+    if clusters:
+        table = Table(title="큰 묶음")
+        table.add_column("대표 ID", style="cyan", justify="right")
+        table.add_column("건수", style="green", justify="right")
+        table.add_column("제목", style="white")
+        for cluster, count, title in clusters:
+            table.add_row(str(cluster), str(count), title or "-")
+        console.print(table)
+
+
+@tags_app.callback(invoke_without_command=True)
+def tags(ctx: typer.Context):
+    """태그별 규칙 수 / 태그된 항목 수."""
+    if ctx.invoked_subcommand is not None:
+        return
+    from rich.table import Table
+    from linkedin_intel.models import init_db, get_session
+    from linkedin_intel.tagging import tag_counts
+    init_db()
+    with get_session(read_only=True) as s:
+        counts = tag_counts(s)
+    table = Table(title="태그")
+    table.add_column("태그", style="cyan")
+    table.add_column("규칙", justify="right")
+    table.add_column("항목", style="green", justify="right")
+    for name, rules, items in counts:
+        table.add_row(name, str(rules) if rules else "[dim]수동[/]", f"{items:,}")
+    console.print(table)
+
+
+@tags_app.command("rules")
+def tags_rules(tag: str = typer.Option(None, "--tag", "-t", help="이 태그의 규칙만")):
+    """규칙 목록."""
+    from rich.table import Table
+    from sqlalchemy import select
+    from linkedin_intel.models import init_db, get_session, Tag, TagRule
+    init_db()
+    stmt = select(TagRule.id, Tag.name, TagRule.kind, TagRule.pattern).join(Tag).order_by(Tag.name, TagRule.id)
+    with get_session(read_only=True) as s:
+        rows = s.execute(stmt.where(Tag.name == tag) if tag else stmt).all()
+    table = Table(title="태깅 규칙")
+    table.add_column("ID", style="dim", justify="right")
+    table.add_column("태그", style="cyan")
+    table.add_column("종류")
+    table.add_column("패턴", style="white")
+    for rule_id, name, kind, pattern in rows:
+        table.add_row(str(rule_id), name, kind.value, pattern)
+    console.print(table)
+
+
+@tags_app.command("add")
+def tags_add(tag: str = typer.Argument(..., help="태그 이름 (없으면 만든다)"), pattern: str = typer.Argument(..., help="키워드(단어 단위, 대소문자 무시) 또는 정규식"),
+             regex: bool = typer.Option(False, "--regex", "-r", help="정규식 규칙")):
+    """규칙 추가. 새 수집 항목부터 적용되고, 기존 항목은 geo retag."""
+    from linkedin_intel.models import init_db, get_session, TagRuleKind
+    from linkedin_intel.tagging import add_rule
+    init_db()
+    try:
+        with get_session() as s:
+            rule = add_rule(s, tag, TagRuleKind.REGEX if regex else TagRuleKind.KEYWORD, pattern)
+            rule_id = rule.id
+    except ValueError as e:
+        console.print(f"[red]✗ {e}[/]")
+        raise typer.Exit(1) from None
+    console.print(f"[green]✓ 규칙 {rule_id} 추가: {tag} ← {pattern}[/] [dim](기존 항목에 적용: geo retag --tag {tag})[/]")
+
+
+@tags_app.command("remove")
+def tags_remove(rule_id: int = typer.Argument(..., help="규칙 ID (geo tags rules)")):
+    """규칙 삭제. 이미 붙은 태그는 geo retag 로 정리."""
+    from linkedin_intel.models import init_db, get_session, TagRule
+    init_db()
+    with get_session() as s:
+        rule = s.get(TagRule, rule_id)
+        if rule is None:
+            console.print("[red]✗ 규칙 없음[/]")
+            raise typer.Exit(1)
+        name, pattern = rule.tag.name, rule.pattern
+        s.delete(rule)
+    console.print(f"[green]✓ 규칙 {rule_id} 삭제: {name} ← {pattern}[/] [dim](정리: geo retag --tag {name})[/]")
+
+
+@app.command("retag")
+def retag(tag: list[str] = typer.Option(None, "--tag", "-t", help="이 태그만 (규칙을 모두 지운 태그도 지정하면 비운다)"),
+          batch_size: int = typer.Option(5000, "--batch-size", help="한 번에 읽고 커밋할 항목 수")):
+    """현재 규칙을 전체 수집 이력에 다시 적용 (수동 태그는 그대로)."""
+    from sqlalchemy import select
+    from linkedin_intel.models import init_db, get_session, Tag
+    from linkedin_intel.tagging import retag as do_retag
+    init_db()
+    tag_ids = None
+    if tag:
+        with get_session(read_only=True) as s:
+            found = dict(s.execute(select(Tag.name, Tag.id).where(Tag.name.in_(tag))).all())
+        if missing := [name for name in tag if name not in found]:
+            console.print(f"[red]✗ 태그 없음: {', '.join(missing)}[/]")
+            raise typer.Exit(1)
+        tag_ids = set(found.values())
+    with console.status("태그 적용 중...") as status:
+        stats = do_retag(tag_ids, batch_size=batch_size, on_batch=lambda done: status.update(f"태그 적용 중... {done:,}건"))
+    if not stats.items:
+        console.print("[yellow]⚠ 적용할 규칙 / 항목 없음[/]")
+        return
+    console.print(f"[green]✓ {stats.items:,}건 확인: 태그 +{stats.added:,} / -{stats.removed:,}[/]")
+
+
+@app.command("export")
+def export(out: Path = typer.Argument(..., help="출력 파일 (.parquet / .jsonl / .csv)"), fmt: str = typer.Option(None, "--format", "-f", help="parquet / jsonl / csv (기본: 확장자)"),
+           query_id: int = typer.Option(None, "--query-id", "-q"), channel: str = typer.Option(None, "--channel", "-c"),
+           since: datetime = typer.Option(None, "--since", formats=["%Y-%m-%d"], help="수집일 이후 (포함)"),
+           until: datetime = typer.Option(None, "--until", formats=["%Y-%m-%d"], help="수집일 이전 (미포함)"),
+           since_id: int = typer.Option(None, "--since-id", help="이 id 다음 항목만 (증분 내보내기, 지난번 출력의 마지막 id)"),
+           chunk_size: int = typer.Option(5000, "--chunk-size", help="한 번에 읽고 쓰는 행 수 (Parquet row group 크기)")):
+    """수집 항목을 파일로 내보내기 (태그 / 쿼리 / 소스 이름 포함, 메모리 일정)."""
+    from linkedin_intel.models import init_db
+    from linkedin_intel.export import export_format, export_items
+    try:
+        fmt = export_format(out, fmt)
+    except ValueError as e:
+        console.print(f"[red]✗ {e}[/]")
+        raise typer.Exit(1) from None
+    init_db()
+    try:
+        with console.status("내보내는 중...") as status:
+            result = export_items(out, fmt, query_id=query_id, channel=channel, since=since, until=until, since_id=since_id,
+                chunk_size=chunk_size, on_chunk=lambda rows: status.update(f"내보내는 중... {rows:,}건"))
+    except ImportError as e:
+        console.print(f"[red]✗ {e}[/]")
+        raise typer.Exit(1) from None
+    hint = f" [dim](다음 증분: --since-id {result.last_id})[/]" if result.last_id is not None else ""
+    if not result.rows:
+        console.print(f"[yellow]⚠ 내보낼 항목 없음 (빈 {fmt} 파일: {out})[/]{hint}")
+        return
+    console.print(f"[green]✓ {result.rows:,}건 → {out}[/]{hint}")
+
+
+@app.command("search")
+def search(text: str = typer.Argument(None, help="검색어 (단어별 AND, 끝에 * 는 접두 검색)"), query_id: int = typer.Option(None, "--query-id", "-q"),
+           channel: str = typer.Option(None, "--channel", "-c"), limit: int = typer.Option(20, "--limit", "-n"),
+           rebuild: bool = typer.Option(False, "--rebuild", help="전문 검색 색인 재구성")):
+    """제목/스니펫/작성자 전문 검색."""
+    from rich.markup import escape
+    from rich.table import Table
+    from linkedin_intel.models import init_db, get_engine, get_session
+    from linkedin_intel.search import create_search_index, render_highlight, search_items
+    init_db()
+    if rebuild:
+        with get_engine().begin() as conn:
+            if not create_search_index(conn):
+                console.print("[red]✗ 이 SQLite 빌드는 FTS5 를 지원하지 않음[/]")
+                raise typer.Exit(1)
+        console.print("[green]✓ 검색 색인 재구성 완료[/]")
+        if not text:
+            return
+    if not text:
+        console.print("[red]✗ 검색어 필요[/]")
+        raise typer.Exit(1)
+    with get_session(read_only=True) as s:
+        hits = search_items(s, text, query_id=query_id, channel=channel, limit=limit)
+    if not hits:
+        console.print("[yellow]검색 결과 없음[/]")
+        return
+    table = Table(title=f"검색: {escape(text)}", show_lines=True)
+    table.add_column("제목 / 스니펫", style="white", ratio=3)
+    table.add_column("채널", style="cyan")
+    table.add_column("수집일", style="green")
+    table.add_column("URL", style="blue", overflow="fold")
+    for hit in hits:
+        body = render_highlight(hit.title_hl, "[bold yellow]", "[/]", escape) or "-"
+        if hit.snippet_hl:
+            body += "\n[dim]" + render_highlight(hit.snippet_hl, "[/][bold yellow]", "[/][dim]", escape) + "[/]"
+        table.add_row(body, hit.channel, hit.collected_at.strftime("%Y-%m-%d"), hit.url)
+    console.print(table)
+
+
 @ingest_app.command("google-cse")
-def ingest_cse(query_id: int = typer.Option(..., "--query-id", "-q"), pages: int = typer.Option(1, "--pages", "-p"), verbose: bool = typer.Option(False, "--verbose", "-v")):
+def ingest_cse(query_id: list[int] = typer.Option(None, "--query-id", "-q"), all_queries: bool = typer.Option(False, "--all", help="모든 쿼리 수집"),
+               pages: int = typer.Option(1, "--pages", "-p"), concurrent: bool = typer.Option(False, "--concurrent", "-c", help="페이지/쿼리 동시 요청 (asyncio)"),
+               incremental: bool = typer.Option(None, "--incremental/--full", help="CSE 증분 수집 (기본 CSE_INCREMENTAL)"), verbose: bool = typer.Option(False, "--verbose", "-v")):
     """Google CSE 수집."""
     setup_logging(verbose)
     from linkedin_intel.config import settings
-    from linkedin_intel.connectors.google_cse import GoogleCSEConnector
+    from linkedin_intel.connectors.google_cse import GoogleCSEConnector, ingest_queries
     from linkedin_intel.models import init_db, get_session, Query
     init_db()
     if not settings.has_cse_credentials():
         console.print("[red]✗ CSE 자격증명 미설정[/]")
         raise typer.Exit(1)
+    if not query_id and not all_queries:
+        console.print("[red]✗ --query-id 또는 --all 필요[/]")
+        raise typer.Exit(1)
     with get_session() as s:
-        q = s.query(Query).filter(Query.id == query_id).first()
-        if not q:
-            console.print(f"[red]✗ 쿼리 ID {query_id} 없음[/]")
-            raise typer.Exit(1)
-        query_string = q.query_string
-        console.print(f"[blue]🔍 CSE 수집: '{q.name}' ({pages}페이지)[/]")
-    connector = GoogleCSEConnector(query_id=query_id)
-    result = connector.ingest(query_string=query_string, pages=pages)
-    console.print(f"[green]✓ 완료: 총 {result.total_fetched}, 신규 {result.new_items}, 중복 {result.duplicates}[/]")
-    if result.errors:
-        console.print(f"[yellow]  에러: {result.errors}[/]")
+        q = s.query(Query).order_by(Query.id)
+        if not all_queries:
+            q = q.filter(Query.id.in_(query_id))
+        queries = {x.id: (x.name, x.query_string) for x in q}
+    missing = sorted(set(query_id or []) - set(queries))
+    if missing:
+        console.print(f"[red]✗ 쿼리 ID {', '.join(map(str, missing))} 없음[/]")
+        raise typer.Exit(1)
+    console.print(f"[blue]🔍 CSE 수집: {', '.join(name for name, _ in queries.values())} ({pages}페이지)[/]")
+    if concurrent:
+        results = ingest_queries({qid: qs for qid, (_, qs) in queries.items()}, pages=pages, incremental=incremental)
+    else:
+        results = {qid: GoogleCSEConnector(query_id=qid).ingest(query_string=qs, pages=pages, incremental=incremental) for qid, (_, qs) in queries.items()}
+    for qid, result in results.items():
+        console.print(f"[green]✓ {queries[qid][0]}: 총 {result.total_fetched}, 신규 {result.new_items}, 중복 {result.duplicates}[/]")
+        if result.errors:
+            console.print(f"[yellow]  에러: {result.errors} ({result.error_messages[-1]})[/]")
 
 
 @ingest_app.command("rss")
-def ingest_rss(source_id: int = typer.Option(..., "--source-id", "-s"), query_id: int = typer.Option(None, "--query-id", "-q"), verbose: bool = typer.Option(False, "--verbose", "-v")):
+def ingest_rss(source_id: int = typer.Option(None, "--source-id", "-s"), all_sources: bool = typer.Option(False, "--all", help="모든 RSS 소스 동시 조회 (조건부 요청)"),
+               query_id: int = typer.Option(None, "--query-id", "-q"), verbose: bool = typer.Option(False, "--verbose", "-v")):
     """RSS 수집."""
     setup_logging(verbose)
-    from linkedin_intel.connectors.rss import RSSConnector
+    from linkedin_intel.connectors.rss import RSSConnector, ingest_all_feeds
     from linkedin_intel.models import init_db
     init_db()
+    if all_sources:
+        console.print("[blue]📡 RSS 전체 수집[/]")
+        failed = 0
+        for poll, result in ingest_all_feeds(query_id=query_id):
+            if result is None:
+                console.print(f"[dim]- {poll.name}: 변경 없음 ({poll.status})[/]")
+            elif result.failed:
+                failed += 1
+                console.print(f"[red]✗ {poll.name}: {result.error_messages[-1]}[/]")
+            else:
+                console.print(f"[green]✓ {poll.name}: 총 {result.total_fetched}, 신규 {result.new_items}, 중복 {result.duplicates}[/]")
+        if failed:
+            raise typer.Exit(1)
+        return
+    if source_id is None:
+        console.print("[red]✗ --source-id 또는 --all 필요[/]")
+        raise typer.Exit(1)
     console.print(f"[blue]📡 RSS 수집: source_id={source_id}[/]")
     connector = RSSConnector(query_id=query_id, source_id=source_id)
     result = connector.ingest()
@@ -113,7 +463,9 @@ def ingest_rss(source_id: int = typer.Option(..., "--source-id", "-s"), query_id
 
 
 @ingest_app.command("email")
-def ingest_email(path: str = typer.Option("./data/eml", "--path", "-p"), query_id: int = typer.Option(..., "--query-id", "-q"), verbose: bool = typer.Option(False, "--verbose", "-v")):
+def ingest_email(path: str = typer.Option("./data/eml", "--path", "-p"), query_id: int = typer.Option(..., "--query-id", "-q"), chunk_size: int = typer.Option(None, "--chunk-size"),
+                 workers: int = typer.Option(None, "--workers", "-w", help="파싱 프로세스 수"), incremental: bool = typer.Option(True, "--incremental/--full", help="이미 처리한 파일 건너뛰기"),
+                 verbose: bool = typer.Option(False, "--verbose", "-v")):
     """Email (.eml) 수집."""
     setup_logging(verbose)
     from linkedin_intel.connectors.email_import import EmailConnector
@@ -125,12 +477,12 @@ def ingest_email(path: str = typer.Option("./data/eml", "--path", "-p"), query_i
         raise typer.Exit(1)
     console.print(f"[blue]📧 Email 수집: {path}[/]")
     connector = EmailConnector(query_id=query_id)
-    result = connector.ingest(eml_path=eml_path)
+    result = connector.ingest(chunk_size=chunk_size, eml_path=eml_path, workers=workers, incremental=incremental)
     console.print(f"[green]✓ 완료: 총 {result.total_fetched}, 신규 {result.new_items}, 중복 {result.duplicates}[/]")
 
 
 @ingest_app.command("csv")
-def ingest_csv(file: str = typer.Option(..., "--file", "-f"), query_id: int = typer.Option(..., "--query-id", "-q"), verbose: bool = typer.Option(False, "--verbose", "-v")):
+def ingest_csv(file: str = typer.Option(..., "--file", "-f"), query_id: int = typer.Option(..., "--query-id", "-q"), chunk_size: int = typer.Option(None, "--chunk-size"), verbose: bool = typer.Option(False, "--verbose", "-v")):
     """CSV 임포트."""
     setup_logging(verbose)
     from linkedin_intel.connectors.csv_import import CSVConnector
@@ -142,10 +494,175 @@ def ingest_csv(file: str = typer.Option(..., "--file", "-f"), query_id: int = ty
         raise typer.Exit(1)
     console.print(f"[blue]📄 CSV 임포트: {file}[/]")
     connector = CSVConnector(query_id=query_id)
-    result = connector.ingest(csv_path=csv_path)
+    result = connector.ingest(chunk_size=chunk_size, csv_path=csv_path)
     console.print(f"[green]✓ 완료: 총 {result.total_fetched}, 신규 {result.new_items}, 중복 {result.duplicates}[/]")
 
 
+@app.command("collect")
+def collect(pages: int = typer.Option(3, "--pages", "-p", help="CSE 쿼리당 페이지 수"), cse: bool = typer.Option(True, "--cse/--no-cse"),
+            rss: bool = typer.Option(True, "--rss/--no-rss"), eml_path: str = typer.Option("./data/eml", "--eml-path", help="빈 문자열이면 Email 건너뛰기"),
+            email_query_id: int = typer.Option(1, "--email-query-id"), concurrency: int = typer.Option(None, "--concurrency", "-c", help="동시 조회 수 (기본 COLLECT_CONCURRENCY)"),
+            incremental: bool = typer.Option(None, "--incremental/--full", help="CSE 증분 수집 (기본 CSE_INCREMENTAL)"), verbose: bool = typer.Option(False, "--verbose", "-v")):
+    """전체 수집: 모든 쿼리(CSE) / RSS 소스 / .eml 폴더를 한 프로세스에서 동시에."""
+    setup_logging(verbose)
+    from linkedin_intel.collect import collect as do_collect
+    from linkedin_intel.models import init_db
+    init_db()
+
+    def report(r):
+        if r.result is None:
+            console.print(f"[dim]- [{r.channel}] {r.name}: 변경 없음 ({r.status})[/]")
+        elif r.result.failed:
+            console.print(f"[red]✗ [{r.channel}] {r.name}: {r.result.error_messages[-1]}[/]")
+        else:
+            console.print(f"[green]✓ [{r.channel}] {r.name}: 총 {r.result.total_fetched}, 신규 {r.result.new_items}, 중복 {r.result.duplicates}[/]")
+
+    console.print("[blue]🚀 전체 수집 시작[/]")
+    summary = do_collect(pages=pages, cse=cse, rss=rss, eml_path=Path(eml_path) if eml_path else None, email_query_id=email_query_id,
+        concurrency=concurrency, on_result=report, incremental=incremental)
+    for reason in summary.skipped:
+        console.print(f"[yellow]⚠ 건너뜀: {reason}[/]")
+    total = summary.total
+    console.print(f"[bold]합계: 커넥터 {len(summary.results)}개, 총 {total.total_fetched}, 신규 {total.new_items}, 중복 {total.duplicates}, "
+                  f"에러 {total.errors} (실패 {summary.failed}, 변경 없음 {summary.unchanged})[/]")
+    if cse:
+        from linkedin_intel.models import get_session
+        from linkedin_intel.quota import usage
+        with get_session() as s:
+            console.print(f"[dim]{quota_line(usage(s))}[/]")
+    if summary.failed:
+        raise typer.Exit(1)
+
+
+@scheduler_app.callback(invoke_without_command=True)
+def scheduler(ctx: typer.Context, pages: int = typer.Option(3, "--pages", "-p", help="CSE 쿼리당 페이지 수"),
+              eml_path: str = typer.Option("", "--eml-path", help=".eml 폴더도 주기적으로 수집 (SCHEDULER_EMAIL_INTERVAL_MINUTES)"),
+              email_query_id: int = typer.Option(1, "--email-query-id"), concurrency: int = typer.Option(None, "--concurrency", "-c", help="동시 실행 수 (기본 COLLECT_CONCURRENCY)"),
+              incremental: bool = typer.Option(None, "--incremental/--full", help="CSE 증분 수집 (기본 CSE_INCREMENTAL)"), verbose: bool = typer.Option(False, "--verbose", "-v")):
+    """스케줄러 실행 (SIGINT/SIGTERM 으로 종료, 실행 중인 수집은 끝까지 마친다)."""
+    if ctx.invoked_subcommand is not None:
+        return
+    setup_logging(verbose)
+    from datetime import datetime
+    from linkedin_intel.models import init_db
+    from linkedin_intel.scheduler import Scheduler, serve
+    init_db()
+
+    def report(job, r):
+        when = datetime.fromtimestamp(job.due).strftime("%m-%d %H:%M")
+        if r is None or (r.result is not None and r.result.failed):
+            error = r.result.error_messages[-1] if r is not None else "실행 실패"
+            console.print(f"[red]✗ {job.name}: {error} — {job.failures}회 연속 실패, 다음 {when}[/]")
+        elif r.result is None:
+            console.print(f"[dim]- {job.name}: 변경 없음 ({r.status}), 다음 {when}[/]")
+        else:
+            console.print(f"[green]✓ {job.name}: 총 {r.result.total_fetched}, 신규 {r.result.new_items}, 중복 {r.result.duplicates}, 다음 {when}[/]")
+
+    console.print("[blue]⏰ 스케줄러 시작 (Ctrl+C 로 종료)[/]")
+    serve(Scheduler(pages=pages, eml_path=Path(eml_path) if eml_path else None, email_query_id=email_query_id,
+        concurrency=concurrency, on_result=report, incremental=incremental))
+    console.print("[green]✓ 스케줄러 종료[/]")
+
+
+@scheduler_app.command("plan")
+def scheduler_plan():
+    """작업별 주기와 다음 실행 예정 시각 (마지막 Run 기준)."""
+    from datetime import datetime
+    from rich.table import Table
+    from linkedin_intel.models import init_db
+    from linkedin_intel.scheduler import Scheduler
+    init_db()
+    scheduler = Scheduler()
+    scheduler.refresh()
+    table = Table(title="수집 스케줄")
+    table.add_column("작업", style="cyan")
+    table.add_column("이름")
+    table.add_column("주기(분)", justify="right")
+    table.add_column("다음 실행", style="green")
+    for job in sorted(scheduler.jobs.values(), key=lambda j: j.due):
+        table.add_row(f"{job.key[0]}:{job.key[1]}", job.name, f"{job.interval / 60:g}", datetime.fromtimestamp(job.due).strftime("%Y-%m-%d %H:%M"))
+    console.print(table)
+
+
+@scheduler_app.command("interval")
+def scheduler_interval(minutes: int = typer.Argument(None, help="수집 주기(분). 생략하면 채널 기본값으로 되돌림"),
+                       query_id: int = typer.Option(None, "--query-id", "-q"), source_id: int = typer.Option(None, "--source-id", "-s")):
+    """쿼리/소스별 수집 주기 설정."""
+    from linkedin_intel.models import init_db, get_session, Query, Source
+    if (query_id is None) == (source_id is None):
+        console.print("[red]✗ --query-id 또는 --source-id 중 하나 필요[/]")
+        raise typer.Exit(1)
+    init_db()
+    with get_session() as s:
+        target = s.get(Query, query_id) if query_id is not None else s.get(Source, source_id)
+        if target is None:
+            console.print("[red]✗ 대상 없음[/]")
+            raise typer.Exit(1)
+        target.interval_minutes = minutes
+        name = target.name
+    console.print(f"[green]✓ {name}: 수집 주기 {f'{minutes}분' if minutes else '채널 기본값'}[/]")
+
+
+@synth_app.callback(invoke_without_command=True)
+def synth(ctx: typer.Context, items: int = typer.Option(10000, "--items", "-n", help="추가할 Item 수"), runs: int = typer.Option(200, "--runs", help="추가할 Run 수"),
+          days: int = typer.Option(90, "--days", help="collected_at / Run 을 펼칠 기간"),
+          feeds: int = typer.Option(10, "--feeds", help="대역 서버 피드를 가리키는 RSS Source 수 (synth-feed-N)"),
+          feed_base_url: str = typer.Option("http://127.0.0.1:8765", "--feed-base-url", help="geo synth serve 주소"),
+          eml_dir: str = typer.Option("", "--eml-dir", help=".eml 코퍼스를 쓸 폴더"), eml_files: int = typer.Option(100, "--eml-files"),
+          links: int = typer.Option(50, "--links", help=".eml 한 통의 링크 수"), csv_file: str = typer.Option("", "--csv", help="CSV 코퍼스 경로"),
+          csv_rows: int = typer.Option(10000, "--csv-rows"), db: str = typer.Option("", "--db", help="대상 DB 파일 (기본 DATABASE_PATH)"),
+          seed: int = typer.Option(42, "--seed")):
+    """합성 Item / Run / Tag 행을 DB 에 추가하고 .eml / CSV 코퍼스를 만든다 (고정 seed 로 재현 가능)."""
+    if ctx.invoked_subcommand is not None:
+        return
+    from linkedin_intel.config import settings
+    from linkedin_intel.models import init_db, seed_data
+    from linkedin_intel.synth import synth_db, write_csv, write_eml
+    if db:
+        settings.database_path = db
+    if items or runs or feeds:
+        init_db()
+        seed_data()
+        console.print(f"[blue]🧪 합성 데이터: {settings.database_path}[/]")
+        summary = synth_db(items, runs, days=days, feeds=feeds, feed_base_url=feed_base_url, seed=seed)
+        console.print(f"[green]✓ Item {summary.items:,} (태그 {summary.tagged:,}), Run {summary.runs:,}, RSS Source {summary.sources}[/]")
+    if eml_dir:
+        count = write_eml(Path(eml_dir), eml_files, links, seed=seed)
+        console.print(f"[green]✓ .eml {eml_files:,}통 (링크 {count:,}): {eml_dir}[/]")
+    if csv_file:
+        write_csv(Path(csv_file), csv_rows, seed=seed)
+        console.print(f"[green]✓ CSV {csv_rows:,}행: {csv_file}[/]")
+
+
+@synth_app.command("serve")
+def synth_serve(host: str = typer.Option("127.0.0.1", "--host"), port: int = typer.Option(8765, "--port", "-p"),
+                latency_ms: float = typer.Option(0.0, "--latency-ms", help="응답 지연"), jitter_ms: float = typer.Option(0.0, "--jitter-ms", help="지연에 더할 0~N ms"),
+                error_rate: float = typer.Option(0.0, "--error-rate", help="500 응답 비율"), throttle_rate: float = typer.Option(0.0, "--throttle-rate", help="429 응답 비율"),
+                retry_after: int = typer.Option(1, "--retry-after", help="429 Retry-After (초)"), etag: bool = typer.Option(True, "--etag/--no-etag", help="RSS 조건부 요청(304) 지원"),
+                feeds: int = typer.Option(10, "--feeds"), feed_entries: int = typer.Option(50, "--feed-entries"),
+                feed_new_entries: int = typer.Option(5, "--feed-new-entries", help="rotate 간격마다 새 항목 수"),
+                rotate_seconds: float = typer.Option(300.0, "--rotate-seconds"), cse_total: int = typer.Option(100, "--cse-total", help="쿼리당 totalResults"),
+                seed: int = typer.Option(42, "--seed"), verbose: bool = typer.Option(False, "--verbose", "-v")):
+    """CSE JSON API / RSS 피드 대역 서버 (Ctrl+C 로 종료)."""
+    setup_logging(verbose)
+    from linkedin_intel.standin import CSE_PATH, StandinConfig, StandinServer
+    config = StandinConfig(latency_ms=latency_ms, jitter_ms=jitter_ms, error_rate=error_rate, throttle_rate=throttle_rate, retry_after=retry_after,
+        etag=etag, feeds=feeds, feed_entries=feed_entries, feed_new_entries=feed_new_entries, feed_rotate_seconds=rotate_seconds,
+        cse_total_results=cse_total, seed=seed)
+    server = StandinServer(config, host, port)
+    console.print(f"[blue]🧪 대역 서버: {server.base_url}[/]")
+    console.print(f"  CSE:  GOOGLE_CSE_ENDPOINT={server.base_url}{CSE_PATH} (API 키 / CX 는 아무 값)")
+    console.print(f"  RSS:  {server.base_url}/feeds/0.xml ~ /feeds/{feeds - 1}.xml ('geo synth --feeds {feeds}' 로 Source 등록)")
+    console.print(f"  통계: {server.base_url}/_stats")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    console.print("[green]✓ 대역 서버 종료[/]")
+
+
 @app.command("dashboard")
 def dashboard(port: int = typer.Option(None, "--port", "-p")):
     """Streamlit 대시보드."""
@@ -153,7 +670,7 @@ def dashboard(port: int = typer.Option(None, "--port", "-p")):
     port = port or settings.streamlit_port
     dashboard_path = Path(__file__).parent / "dashboard" / "app.py"
     if not dashboard_path.exists():
-        console.print(f"[red]✗ 대시보드 파일 없음[/]")
+        console.print("[red]✗ 대시보드 파일 없음[/]")
         raise typer.Exit(1)
     console.print(f"[blue]🚀 대시보드: http://localhost:{port}[/]")
     # 가상환경에서 geo를 직접 실행할 때 PATH에 .venv/bin 이 없을 수 있어
@@ -0,0 +1,145 @@
+"""전체 수집 오케스트레이터 (geo collect).
+
+모든 Query(CSE) 와 RSS Source 를 한 프로세스에서 하나의 엔진 / HTTP 커넥션 풀로 수집한다.
+네트워크 조회는 concurrency 개까지 동시에, SQLite 쓰기는 전용 스레드 하나에서 도착 순서대로 처리한다.
+"""
+import asyncio
+import logging
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+import httpx
+from linkedin_intel.config import settings
+from linkedin_intel.connectors.base import IngestResult, deferred_error
+from linkedin_intel.connectors.email_import import EmailConnector
+from linkedin_intel.connectors.google_cse import GoogleCSEConnector
+from linkedin_intel.connectors.rss import load_rss_sources, poll_feed, ingest_poll
+from linkedin_intel.models import get_session, Query
+from linkedin_intel.quota import usage
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CollectResult:
+    """커넥터 하나(쿼리/피드/메일함)의 수집 결과. result 가 None 이면 변경 없는 피드."""
+    channel: str
+    name: str
+    result: IngestResult | None
+    status: str = "changed"
+
+
+@dataclass
+class CollectSummary:
+    results: list[CollectResult] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+
+    @property
+    def total(self) -> IngestResult:
+        total = IngestResult()
+        for r in self.results:
+            if r.result is not None:
+                total.total_fetched += r.result.total_fetched
+                total.merge(r.result)
+        return total
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for r in self.results if r.result is not None and r.result.failed)
+
+    @property
+    def unchanged(self) -> int:
+        return sum(1 for r in self.results if r.result is None)
+
+
+def load_queries() -> dict[int, tuple[str, str]]:
+    with get_session() as session:
+        return {q.id: (q.name, q.query_string) for q in session.query(Query).order_by(Query.id)}
+
+
+def http_client(concurrency: int) -> httpx.AsyncClient:
+    return httpx.AsyncClient(timeout=30, follow_redirects=True, limits=httpx.Limits(max_connections=concurrency))
+
+
+def writer_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="geo-writer")
+
+
+async def collect_query(client: httpx.AsyncClient, writer: Executor, query_id: int, name: str, query_string: str, pages: int = 1,
+                        limit: asyncio.Semaphore | None = None, incremental: bool | None = None) -> CollectResult:
+    """CSE 쿼리 하나를 받아 writer 스레드에서 저장. 조회 실패도 FAILED Run 으로 남는다."""
+    connector = GoogleCSEConnector(query_id=query_id)
+    async with limit or nullcontext():
+        try:
+            data = await connector.fetch_async(client, query_string, pages, incremental)
+        except Exception as e:
+            logger.warning(f"CSE query {query_id} failed: {e}")
+            data = e
+    items = deferred_error(data) if isinstance(data, Exception) else data
+    result = await asyncio.get_running_loop().run_in_executor(writer, lambda: connector.ingest(items=items))
+    return CollectResult(GoogleCSEConnector.channel, name, result)
+
+
+async def collect_source(client: httpx.AsyncClient, writer: Executor, source_id: int, name: str, config: dict[str, Any],
+                         limit: asyncio.Semaphore | None = None) -> CollectResult:
+    """RSS 소스 하나를 조건부 조회 후 저장. 변경 없으면 result=None."""
+    async with limit or nullcontext():
+        poll = await poll_feed(client, source_id, name, config)
+    result = await asyncio.get_running_loop().run_in_executor(writer, ingest_poll, poll)
+    return CollectResult("rss", name, result, poll.status)
+
+
+async def collect_email(writer: Executor, eml_path: Path, query_id: int | None = None) -> CollectResult:
+    connector = EmailConnector(query_id=query_id)
+    result = await asyncio.get_running_loop().run_in_executor(writer, lambda: connector.ingest(eml_path=eml_path))
+    return CollectResult(EmailConnector.channel, str(eml_path), result)
+
+
+async def collect_async(queries: dict[int, tuple[str, str]], sources: list[tuple[int, str, dict[str, Any]]], pages: int = 3,
+                        eml_path: Path | None = None, email_query_id: int | None = None, concurrency: int | None = None,
+                        client: httpx.AsyncClient | None = None, on_result: Callable[[CollectResult], None] | None = None,
+                        incremental: bool | None = None) -> list[CollectResult]:
+    """CSE 쿼리 / RSS 피드를 동시에 조회하고, 도착하는 대로 쓰기 스레드에서 ingest 한다. 결과는 입력 순서."""
+    concurrency = concurrency or settings.collect_concurrency
+    limit = asyncio.Semaphore(concurrency)
+
+    async def report(job) -> CollectResult:
+        collected = await job
+        if on_result:
+            on_result(collected)
+        return collected
+
+    # SQLite 는 쓰기가 하나씩이므로 ingest 는 한 스레드에 줄 세운다 (그동안 이벤트 루프는 다음 응답을 받는다)
+    with writer_executor() as writer:
+        async with (http_client(concurrency) if client is None else nullcontext(client)) as client:
+            jobs = [collect_query(client, writer, qid, name, qs, pages, limit, incremental) for qid, (name, qs) in queries.items()]
+            jobs += [collect_source(client, writer, sid, name, config, limit) for sid, name, config in sources]
+            if eml_path is not None:
+                jobs.append(collect_email(writer, eml_path, email_query_id))
+            return list(await asyncio.gather(*(report(job) for job in jobs)))
+
+
+def collect(pages: int = 3, cse: bool = True, rss: bool = True, eml_path: Path | None = None, email_query_id: int | None = None,
+            concurrency: int | None = None, on_result: Callable[[CollectResult], None] | None = None,
+            incremental: bool | None = None) -> CollectSummary:
+    """DB 의 모든 쿼리/RSS 소스(+ .eml 폴더)를 한 번에 수집. 자격증명이 없거나 폴더가 비어 있으면 해당 채널은 건너뛴다."""
+    summary = CollectSummary()
+    queries = {}
+    if cse and not settings.has_cse_credentials():
+        summary.skipped.append("google_cse: CSE 자격증명 미설정")
+    elif cse:
+        with get_session() as session:
+            quota = usage(session)
+        if quota.exhausted:
+            summary.skipped.append(f"google_cse: 오늘 할당량 소진 ({quota.requests}/{quota.limit}, {settings.cse_quota_timezone} 자정에 리셋)")
+        else:
+            queries = load_queries()
+    sources = load_rss_sources() if rss else []
+    if eml_path is not None and not (eml_path.is_dir() and any(eml_path.iterdir())):
+        summary.skipped.append(f"email: {eml_path} 폴더가 비어있음")
+        eml_path = None
+    summary.results = asyncio.run(collect_async(queries, sources, pages=pages, eml_path=eml_path, email_query_id=email_query_id,
+        concurrency=concurrency, on_result=on_result, incremental=incremental))
+    return summary
@@ -11,8 +11,30 @@ class Settings(BaseSettings):
 
     google_cse_api_key: str = Field(default="")
     google_cse_cx: str = Field(default="")
+    google_cse_endpoint: str = Field(default="https://www.googleapis.com/customsearch/v1")
     database_path: str = Field(default="./data/geo.db")
-    request_delay: float = Field(default=1.0)
+    sqlite_profile: Literal["default", "ingest-heavy", "read-mostly"] = Field(default="default")
+    cse_qps: float = Field(default=1.0)
+    cse_daily_quota: int = Field(default=100)
+    cse_concurrency: int = Field(default=4)
+    cse_max_retries: int = Field(default=3)
+    cse_quota_timezone: str = Field(default="America/Los_Angeles")
+    cse_cache_dir: str = Field(default="./data/cse_cache")
+    cse_cache_ttl_minutes: int = Field(default=360)
+    cse_cache_max_mb: int = Field(default=64)
+    cse_incremental: bool = Field(default=False)
+    neardup_threshold: float = Field(default=0.0)
+    rss_concurrency: int = Field(default=8)
+    collect_concurrency: int = Field(default=8)
+    scheduler_cse_interval_minutes: int = Field(default=1440)
+    scheduler_rss_interval_minutes: int = Field(default=60)
+    scheduler_email_interval_minutes: int = Field(default=60)
+    scheduler_jitter: float = Field(default=0.1)
+    scheduler_retry_minutes: int = Field(default=5)
+    scheduler_max_backoff_minutes: int = Field(default=1440)
+    email_workers: int = Field(default=0)
+    ingest_chunk_size: int = Field(default=1000)
+    metrics_textfile: str = Field(default="")
     streamlit_port: int = Field(default=8501)
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = Field(default="INFO")
 
@@ -1,8 +1,29 @@
-"""데이터 수집 커넥터."""
-from .base import BaseConnector, IngestResult
-from .google_cse import GoogleCSEConnector
-from .rss import RSSConnector
-from .email_import import EmailConnector
-from .csv_import import CSVConnector
+"""데이터 수집 커넥터.
+
+서브모듈은 처음 접근할 때 불러온다 (httpx/feedparser/bs4 를 쓰지 않는 커넥터의 CLI 시작 시간을 줄이기 위해).
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+_EXPORTS = {
+    "BaseConnector": "base", "IngestResult": "base", "GoogleCSEConnector": "google_cse", "RSSConnector": "rss",
+    "EmailConnector": "email_import", "CSVConnector": "csv_import",
+}
+
+if TYPE_CHECKING:
+    from .base import BaseConnector, IngestResult
+    from .csv_import import CSVConnector
+    from .email_import import EmailConnector
+    from .google_cse import GoogleCSEConnector
+    from .rss import RSSConnector
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = ["BaseConnector", "IngestResult", "GoogleCSEConnector", "RSSConnector", "EmailConnector", "CSVConnector"]
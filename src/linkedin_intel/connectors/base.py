@@ -1,11 +1,24 @@
 """커넥터 기본 클래스."""
 import json
+import time
 from abc import ABC, abstractmethod
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from itertools import islice
+from typing import Any, Iterable, Iterator
+from sqlalchemy import insert, select, update
+from linkedin_intel.config import settings
+from linkedin_intel.metrics import RunStats, write_textfile
 from linkedin_intel.models import get_session, Item, Run, RunStatus
-from linkedin_intel.utils import canonicalize_url, clean_title
+from linkedin_intel.neardup import assign_clusters, minhash
+from linkedin_intel.payload import save_payloads
+from linkedin_intel.rollup import apply_rollups, rollup_key
+from linkedin_intel.tagging import tag_items, Tagger
+from linkedin_intel.utils import CanonicalUrl, canonicalize_urls, clean_title
+
+# IN 조회 / 다중 INSERT 한 번에 묶는 행 수 (SQLite 바인드 변수 한도 이내)
+BATCH_SIZE = 500
 
 
 @dataclass
@@ -15,6 +28,20 @@ class IngestResult:
     duplicates: int = 0
     errors: int = 0
     error_messages: list[str] = field(default_factory=list)
+    run_id: int | None = None
+    failed: bool = False
+
+    def merge(self, other: "IngestResult") -> None:
+        self.new_items += other.new_items
+        self.duplicates += other.duplicates
+        self.errors += other.errors
+        self.error_messages.extend(other.error_messages)
+
+
+def deferred_error(exc: BaseException) -> Iterator[dict[str, Any]]:
+    """소비 시점에 exc 를 던지는 빈 이터레이터. 미리 실패한 수집을 ingest 의 FAILED Run 으로 남길 때 사용."""
+    raise exc
+    yield
 
 
 class BaseConnector(ABC):
@@ -23,60 +50,138 @@ class BaseConnector(ABC):
     def __init__(self, query_id: int | None = None, source_id: int | None = None):
         self.query_id = query_id
         self.source_id = source_id
+        # 이번 실행의 단계별 지표. fetch 를 ingest 전에 따로 돌린 경우(동시 수집)도 같은 커넥터면 여기 쌓인다
+        self.stats = RunStats()
+        self.tagger: Tagger | None = None  # ingest 시작 때 tag_rules 로 만든다
 
     @abstractmethod
-    def fetch(self, **kwargs) -> list[dict[str, Any]]:
-        pass
+    def fetch(self, **kwargs) -> Iterable[dict[str, Any]]:
+        """수집 항목을 반환. 제너레이터로 구현하면 청크 단위로 소비된다."""
+
+    def ingest(self, chunk_size: int | None = None, items: Iterable[dict[str, Any]] | None = None, **kwargs) -> IngestResult:
+        """fetch 결과를 chunk_size 건씩 별도 트랜잭션으로 커밋. 실패해도 이미 커밋된 청크는 남는다.
 
-    def ingest(self, **kwargs) -> IngestResult:
+        items 를 넘기면 fetch 대신 미리 받아둔 항목을 저장한다 (동시 수집 후 저장용).
+        """
+        chunk_size = chunk_size or settings.ingest_chunk_size
         result = IngestResult()
+        started = time.perf_counter()
+        self.stats.begin()
         with get_session() as session:
             run = Run(source_id=self.source_id, query_id=self.query_id, status=RunStatus.RUNNING)
             session.add(run)
             session.flush()
-            run_id = run.id
-            try:
-                items = self.fetch(**kwargs)
-                result.total_fetched = len(items)
-                for item_data in items:
-                    try:
-                        if self._save_item(session, item_data):
-                            result.new_items += 1
-                        else:
-                            result.duplicates += 1
-                    except Exception as e:
-                        result.errors += 1
-                        result.error_messages.append(str(e))
-                run.status = RunStatus.COMPLETED
-                run.ended_at = datetime.utcnow()
-                run.records_fetched = result.new_items
-            except Exception as e:
-                result.errors += 1
-                result.error_messages.append(str(e))
-                run.status = RunStatus.FAILED
-                run.ended_at = datetime.utcnow()
-                run.error = str(e)[:1000]
+            result.run_id = run.id
+            self.tagger = Tagger.load(session)
+        try:
+            items = iter(self.fetch(**kwargs) if items is None else items)
+            while chunk := self._next_chunk(items, chunk_size):
+                result.total_fetched += len(chunk)
+                chunk_result = IngestResult()
+                with get_session() as session:
+                    # 청크 트랜잭션을 쓰기로 시작해 쓰기 락을 먼저 잡는다. 조회~INSERT 사이에 다른 수집이 같은 URL 을 넣을 수 없다
+                    session.execute(update(Run).where(Run.id == result.run_id).values(records_fetched=result.new_items))
+                    for start in range(0, len(chunk), BATCH_SIZE):
+                        self._save_batch(session, chunk[start:start + BATCH_SIZE], chunk_result)
+                    session.execute(update(Run).where(Run.id == result.run_id)
+                        .values(records_fetched=result.new_items + chunk_result.new_items))
+                    with self.stats.phase("commit"):
+                        session.commit()
+                result.merge(chunk_result)
+        except BaseException as e:
+            result.errors += 1
+            result.error_messages.append(str(e))
+            result.failed = True
+            self._finish_run(result, RunStatus.FAILED, started, error=str(e)[:1000])
+            if not isinstance(e, Exception):
+                raise
+        else:
+            self._finish_run(result, RunStatus.COMPLETED, started)
         return result
 
-    def _save_item(self, session, item_data: dict[str, Any]) -> bool:
+    def _next_chunk(self, items: Iterator[dict[str, Any]], chunk_size: int) -> list[dict[str, Any]]:
+        # 제너레이터 커넥터(csv/email)는 파일 읽기·파싱이 여기서 일어난다
+        with self.stats.phase("fetch"):
+            return list(islice(items, chunk_size))
+
+    def _finish_run(self, result: IngestResult, status: RunStatus, started: float, error: str | None = None) -> None:
+        stats = self.stats.to_dict(self.channel, result, time.perf_counter() - started)
+        self.stats = RunStats()
+        with get_session() as session:
+            session.execute(update(Run).where(Run.id == result.run_id).values(status=status,
+                ended_at=datetime.utcnow(), records_fetched=result.new_items, error=error, stats_json=json.dumps(stats)))
+        # 파일 쓰기 동안 쓰기 트랜잭션(락)을 잡고 있지 않도록 커밋한 뒤 읽기 세션으로
+        if settings.metrics_textfile:
+            with get_session(read_only=True) as session:
+                write_textfile(settings.metrics_textfile, session)
+
+    def _save_batch(self, session, batch: list[dict[str, Any]], result: IngestResult) -> None:
+        """배치 단위 저장: url_key 일괄 조회 1회 + 중복 UPDATE 1회 + 신규 bulk INSERT 1회(+ payload) + 일자 집계 upsert + 규칙 태그 + 유사 묶음."""
+        now = datetime.utcnow()
+        rows: dict[str, dict[str, Any]] = {}
+        raws: dict[str, dict[str, Any]] = {}
+        seen: Counter = Counter()
+        with self.stats.phase("canonicalize"):
+            canonical = canonicalize_urls(item_data.get("url") for item_data in batch)
+            for item_data, canonical_url in zip(batch, canonical, strict=True):
+                try:
+                    row = self._build_row(item_data, now, canonical_url)
+                except Exception as e:
+                    result.errors += 1
+                    result.error_messages.append(str(e))
+                    continue
+                # URL 없음 / 같은 배치 안의 반복 URL 은 기존과 같이 중복으로 집계
+                if row is None or row["canonical_url"] in rows:
+                    result.duplicates += 1
+                    if row is not None:
+                        seen[self._rollup_key(row)] += 1
+                    continue
+                rows[row["canonical_url"]] = row
+                if item_data.get("raw"):
+                    raws[row["canonical_url"]] = item_data["raw"]
+        if rows:
+            with self.stats.phase("dedup"):
+                # 고정 폭 url_key 인덱스로 찾고 전체 URL 로 확인 (키 충돌은 서로 다른 항목으로 남는다)
+                keys = list({row["url_key"] for row in rows.values()})
+                existing = {url for url in session.scalars(select(Item.canonical_url).where(Item.url_key.in_(keys))) if url in rows}
+                if existing:
+                    session.execute(update(Item).where(Item.url_key.in_([rows[url]["url_key"] for url in existing]),
+                        Item.canonical_url.in_(list(existing))).values(last_seen_at=now).execution_options(synchronize_session=False))
+                    result.duplicates += len(existing)
+                    seen.update(self._rollup_key(rows[canonical]) for canonical in existing)
+            with self.stats.phase("insert"):
+                new_rows = [row for canonical, row in rows.items() if canonical not in existing]
+                if new_rows:
+                    ids = session.scalars(insert(Item).returning(Item.id, sort_by_parameter_order=True), new_rows).all()
+                    # 원본 payload 는 압축해 사이드 테이블로 (items 행을 읽을 때 끌려오지 않도록)
+                    save_payloads(session, [(item_id, raws[row["canonical_url"]]) for item_id, row in zip(ids, new_rows, strict=True)
+                        if row["canonical_url"] in raws])
+                    result.new_items += len(new_rows)
+                apply_rollups(session, Counter(self._rollup_key(row) for row in new_rows), seen)
+            if new_rows and self.tagger:
+                with self.stats.phase("tag"):
+                    tag_items(session, self.tagger, [(item_id, row["title"], row["snippet"]) for item_id, row in zip(ids, new_rows, strict=True)])
+            if new_rows and settings.neardup_threshold:
+                with self.stats.phase("neardup"):
+                    signatures = [(item_id, minhash(row["title"], row["snippet"])) for item_id, row in zip(ids, new_rows, strict=True)]
+                    assign_clusters(session, [(item_id, signature) for item_id, signature in signatures if signature is not None])
+
+    @staticmethod
+    def _rollup_key(row: dict[str, Any]):
+        return rollup_key(row["collected_at"].date(), row["query_id"], row["channel"], row["source_id"])
+
+    def _build_row(self, item_data: dict[str, Any], now: datetime, canonical: CanonicalUrl) -> dict[str, Any] | None:
         url = item_data.get("url", "")
         if not url:
-            return False
-        canonical = canonicalize_url(url)
-        existing = session.query(Item).filter(Item.canonical_url == canonical).first()
-        if existing:
-            existing.last_seen_at = datetime.utcnow()
-            return False
+            return None
         published_at = item_data.get("published_at")
         if published_at and isinstance(published_at, str):
             try:
                 published_at = datetime.fromisoformat(published_at.replace("Z", "+00:00"))
             except (ValueError, TypeError):
                 published_at = None
-        item = Item(
-            url=url, canonical_url=canonical, title=clean_title(item_data.get("title")),
-            snippet=item_data.get("snippet"), author=item_data.get("author"), published_at=published_at,
-            source_id=self.source_id, query_id=self.query_id, channel=self.channel,
-            raw_json=json.dumps(item_data.get("raw", {})) if item_data.get("raw") else None)
-        session.add(item)
-        return True
+        return {
+            "url": url, "canonical_url": canonical.url, "url_key": canonical.key, "title": clean_title(item_data.get("title")),
+            "snippet": item_data.get("snippet"), "author": item_data.get("author"), "published_at": published_at,
+            "collected_at": now, "last_seen_at": now, "source_id": self.source_id, "query_id": self.query_id,
+            "channel": item_data.get("channel") or self.channel}
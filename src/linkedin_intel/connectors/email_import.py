@@ -1,14 +1,22 @@
 """Email (.eml) 커넥터."""
 import email
+import hashlib
 import logging
+import os
 import re
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from datetime import datetime
 from email import policy
 from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Any
-from urllib.parse import unquote, urlparse
+from typing import Any, Callable, Iterable, Iterator
+from urllib.parse import unquote
 from bs4 import BeautifulSoup
-from linkedin_intel.connectors.base import BaseConnector
+from sqlalchemy.dialects.sqlite import insert
+from linkedin_intel.config import settings
+from linkedin_intel.connectors.base import BaseConnector, IngestResult
+from linkedin_intel.models import get_session, ProcessedFile
 
 logger = logging.getLogger(__name__)
 GOOGLE_REDIRECT = re.compile(r"https?://www\.google\.com/url\?.*?url=([^&]+)")
@@ -17,20 +25,51 @@ GOOGLE_REDIRECT = re.compile(r"https?://www\.google\.com/url\?.*?url=([^&]+)")
 class EmailConnector(BaseConnector):
     channel = "email"
 
-    def fetch(self, eml_path: Path, **kwargs) -> list[dict[str, Any]]:
-        eml_files = [eml_path] if eml_path.is_file() else list(eml_path.glob("*.eml"))
-        all_items = []
+    def __init__(self, query_id: int | None = None, source_id: int | None = None):
+        super().__init__(query_id=query_id, source_id=source_id)
+        self._manifest_updates: list[dict[str, Any]] = []
+
+    def ingest(self, chunk_size: int | None = None, items: Iterable[dict[str, Any]] | None = None, **kwargs) -> IngestResult:
+        result = super().ingest(chunk_size=chunk_size, items=items, **kwargs)
+        # 실행 전체가 성공했을 때만 매니페스트에 기록해야 실패한 파일을 다음에 다시 읽는다
+        if not result.failed and self._manifest_updates:
+            record_processed(self._manifest_updates)
+        return result
+
+    def fetch(self, eml_path: Path, workers: int | None = None, incremental: bool = True, **kwargs) -> Iterator[dict[str, Any]]:
+        """workers>1 이면 프로세스 풀로 파싱. incremental 이면 크기/mtime 이 같은 기존 파일은 열지 않는다."""
+        eml_files = [eml_path] if eml_path.is_file() else sorted(eml_path.glob("*.eml"))
+        manifest = load_manifest(eml_files) if incremental else {}
+        self._manifest_updates = []
+        pending = []
         for f in eml_files:
-            try:
-                all_items.extend(self._parse_eml(f))
-            except Exception as e:
-                logger.warning(f"Failed to parse {f.name}: {e}")
-        logger.info(f"Email parsed {len(all_items)} items from {len(eml_files)} files")
-        return all_items
+            st = f.stat()
+            known = manifest.get(str(f.resolve()))
+            if known and known.size == st.st_size and known.mtime_ns == st.st_mtime_ns:
+                continue
+            pending.append((f, st, known))
+        workers = workers or settings.email_workers or os.cpu_count() or 1
+        count = 0
+        with (ProcessPoolExecutor(max_workers=workers) if workers > 1 and len(pending) > workers else _InlineExecutor()) as executor:
+            outcomes = _imap_bounded(executor, _parse_file, [str(f) for f, _, _ in pending], ahead=workers * 4)
+            for (f, st, known), (digest, items, error) in zip(pending, outcomes, strict=True):
+                if error:
+                    logger.warning(f"Failed to parse {f.name}: {error}")
+                    continue
+                self._manifest_updates.append({"path": str(f.resolve()), "size": st.st_size, "mtime_ns": st.st_mtime_ns,
+                    "content_hash": digest, "items_found": len(items), "processed_at": datetime.utcnow()})
+                if known and known.content_hash == digest:
+                    continue  # touch 만 된 파일
+                count += len(items)
+                yield from items
+        logger.info(f"Email parsed {count} items from {len(pending)} files ({len(eml_files) - len(pending)} unchanged)")
 
     def _parse_eml(self, eml_path: Path) -> list[dict[str, Any]]:
         with open(eml_path, "rb") as f:
-            msg = email.message_from_binary_file(f, policy=policy.default)
+            return self._parse_bytes(f.read(), eml_path.name)
+
+    def _parse_bytes(self, data: bytes, file_name: str) -> list[dict[str, Any]]:
+        msg = email.message_from_bytes(data, policy=policy.default)
         email_date = None
         if msg.get("Date"):
             try:
@@ -52,7 +91,7 @@ class EmailConnector(BaseConnector):
                 continue
             seen.add(url)
             items.append({"url": url, "title": a.get_text(strip=True), "snippet": "", "published_at": email_date,
-                "raw": {"email_file": eml_path.name}})
+                "raw": {"email_file": file_name}})
         return items
 
     def _get_html(self, msg) -> str | None:
@@ -69,3 +108,52 @@ class EmailConnector(BaseConnector):
     def _unwrap_redirect(self, url: str) -> str:
         m = GOOGLE_REDIRECT.search(url)
         return unquote(m.group(1)) if m else url
+
+
+def _parse_file(path: str) -> tuple[str | None, list[dict[str, Any]], str | None]:
+    """프로세스 풀 작업 단위: (sha256, 항목, 에러). 한 파일의 실패가 풀 전체를 멈추지 않도록 예외를 값으로 돌려준다."""
+    try:
+        data = Path(path).read_bytes()
+        return hashlib.sha256(data).hexdigest(), EmailConnector()._parse_bytes(data, Path(path).name), None
+    except Exception as e:
+        return None, [], str(e)
+
+
+class _InlineExecutor(Executor):
+    """파일이 적을 때 프로세스 생성 비용 없이 현재 프로세스에서 실행."""
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+def _imap_bounded(executor: Executor, fn: Callable, args: list[Any], ahead: int) -> Iterator[Any]:
+    """순서를 유지하면서 최대 ahead 개만 미리 제출 (결과가 메모리에 쌓이지 않도록)."""
+    futures = deque()
+    for arg in args:
+        futures.append(executor.submit(fn, arg))
+        if len(futures) >= ahead:
+            yield futures.popleft().result()
+    while futures:
+        yield futures.popleft().result()
+
+
+def load_manifest(files: list[Path]) -> dict[str, ProcessedFile]:
+    paths = [str(f.resolve()) for f in files]
+    manifest = {}
+    with get_session() as session:
+        for start in range(0, len(paths), 500):
+            for entry in session.query(ProcessedFile).filter(ProcessedFile.path.in_(paths[start:start + 500])):
+                session.expunge(entry)
+                manifest[entry.path] = entry
+    return manifest
+
+
+def record_processed(updates: list[dict[str, Any]]) -> None:
+    with get_session() as session:
+        for start in range(0, len(updates), 500):
+            stmt = insert(ProcessedFile)
+            stmt = stmt.on_conflict_do_update(index_elements=[ProcessedFile.path], set_={c: stmt.excluded[c]
+                for c in ("size", "mtime_ns", "content_hash", "items_found", "processed_at")})
+            session.execute(stmt, updates[start:start + 500])
@@ -1,41 +1,212 @@
 """Google CSE 커넥터."""
+import asyncio
+import itertools
 import logging
+import math
 import time
+from contextlib import nullcontext
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 import httpx
+from sqlalchemy import func, select
+from linkedin_intel.cache import ResponseCache
 from linkedin_intel.config import settings
-from linkedin_intel.connectors.base import BaseConnector
+from linkedin_intel.connectors.base import BaseConnector, IngestResult, deferred_error
+from linkedin_intel.models import get_session, Item, Run, RunStatus
+from linkedin_intel.quota import record_cache_hit, reserve
+from linkedin_intel.ratelimit import TokenBucket
+from linkedin_intel.utils import canonicalize_urls
 
 logger = logging.getLogger(__name__)
-CSE_API_URL = "https://www.googleapis.com/customsearch/v1"
+PAGE_SIZE = 10
+MAX_START = 91  # CSE 는 최대 100건(start<=91)까지만 반환
+RETRY_STATUS = (429, 503)
+MAX_RETRY_AFTER = 60.0
+INCREMENTAL_OVERLAP_DAYS = 1  # CSE 의 날짜는 색인 시각 기준이라 경계에 걸친 게시물을 놓치지 않도록 하루 더 본다
+
+
+@lru_cache
+def get_rate_limiter() -> TokenBucket:
+    """프로세스 전역 CSE 토큰 버킷 (QPS). 일일 한도는 프로세스 간에 공유되는 quota 장부가 맡는다."""
+    return TokenBucket(rate=settings.cse_qps, capacity=max(1.0, settings.cse_qps))
+
+
+def get_response_cache() -> ResponseCache:
+    return _response_cache(settings.cse_cache_dir, settings.cse_cache_ttl_minutes * 60, settings.cse_cache_max_mb << 20)
+
+
+@lru_cache
+def _response_cache(directory: str, ttl_seconds: float, max_bytes: int) -> ResponseCache:
+    return ResponseCache(directory, ttl_seconds, max_bytes)
+
+
+def _page_starts(pages: int) -> list[int]:
+    return [page * PAGE_SIZE + 1 for page in range(pages) if page * PAGE_SIZE + 1 <= MAX_START]
+
+
+def _has_next_page(data: dict[str, Any]) -> bool:
+    return bool(data.get("queries", {}).get("nextPage")) and len(data.get("items", [])) >= PAGE_SIZE
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float | None:
+    """429/503 이면 다시 요청하기까지 대기(초): Retry-After, 없으면 1, 2, 4... CSE_MAX_RETRIES 를 넘기면 None."""
+    if response.status_code not in RETRY_STATUS or attempt >= settings.cse_max_retries:
+        return None
+    try:
+        return min(max(float(response.headers["Retry-After"]), 0.0), MAX_RETRY_AFTER)
+    except (KeyError, ValueError):
+        return min(2.0 ** attempt, MAX_RETRY_AFTER)
+
+
+def _total_results(data: dict[str, Any]) -> int | None:
+    try:
+        return int(data["searchInformation"]["totalResults"])
+    except (KeyError, TypeError, ValueError):
+        return None
 
 
 class GoogleCSEConnector(BaseConnector):
     channel = "google_cse"
 
-    def fetch(self, query_string: str, pages: int = 1, **kwargs) -> list[dict[str, Any]]:
+    def fetch(self, query_string: str, pages: int = 1, concurrent: bool = False, incremental: bool | None = None, **kwargs) -> list[dict[str, Any]]:
+        """incremental (기본 CSE_INCREMENTAL): 마지막 성공 Run 이후로 dateRestrict 를 걸고, 전부 이미 있는 URL 인 페이지에서 멈춘다."""
         if not settings.has_cse_credentials():
             raise ValueError("Google CSE credentials not configured")
+        if concurrent:
+            return asyncio.run(self._fetch_concurrent(query_string, pages, incremental))
+        incremental = settings.cse_incremental if incremental is None else incremental
+        restrict = self._date_restrict() if incremental else None
         all_items = []
-        for page in range(pages):
-            start = page * 10 + 1
-            if start > 91:
-                break
-            items = self._search(query_string, start)
-            all_items.extend(items)
-            if page < pages - 1:
-                time.sleep(settings.request_delay)
+        with httpx.Client(timeout=30) as client:
+            for start in _page_starts(pages):
+                data = self._request(client, query_string, start, restrict)
+                page = self._parse_items(data)
+                all_items.extend(page)
+                if not _has_next_page(data) or (incremental and self._all_known(page, start)):
+                    break
         return all_items
 
-    def _search(self, query: str, start: int = 1) -> list[dict[str, Any]]:
-        params = {"key": settings.google_cse_api_key, "cx": settings.google_cse_cx, "q": query, "start": start, "num": 10}
+    async def _fetch_concurrent(self, query_string: str, pages: int, incremental: bool | None = None) -> list[dict[str, Any]]:
+        async with _async_client() as client:
+            return await self.fetch_async(client, query_string, pages, incremental)
+
+    async def fetch_async(self, client: httpx.AsyncClient, query_string: str, pages: int = 1, incremental: bool | None = None) -> list[dict[str, Any]]:
+        """첫 페이지로 전체 결과 수를 확인한 뒤 남은 페이지를 동시에 요청. incremental 이면 멈출 곳을 봐야 하므로 한 페이지씩."""
+        if not settings.has_cse_credentials():
+            raise ValueError("Google CSE credentials not configured")
+        starts = _page_starts(pages)
+        if not starts:
+            return []
+        if settings.cse_incremental if incremental is None else incremental:
+            return await self._fetch_incremental_async(client, query_string, starts)
+        first = await self._request_async(client, query_string, starts[0])
+        items = self._parse_items(first)
+        if not _has_next_page(first):
+            return items
+        total = _total_results(first)
+        rest = [start for start in starts[1:] if total is None or start <= total]
+
+        for data in await asyncio.gather(*(self._request_async(client, query_string, start) for start in rest)):
+            items.extend(self._parse_items(data))
+        return items
+
+    async def _fetch_incremental_async(self, client: httpx.AsyncClient, query_string: str, starts: list[int]) -> list[dict[str, Any]]:
+        # DB 조회는 이벤트 루프를 막지 않도록 스레드에서
+        restrict = await asyncio.to_thread(self._date_restrict)
+        items = []
+        for start in starts:
+            data = await self._request_async(client, query_string, start, restrict)
+            page = self._parse_items(data)
+            items.extend(page)
+            if not _has_next_page(data) or await asyncio.to_thread(self._all_known, page, start):
+                break
+        return items
+
+    def _date_restrict(self) -> str | None:
+        """마지막으로 성공한 이 쿼리의 CSE Run 이후 일수 (dN). 없으면 None (전체 조회)."""
+        if self.query_id is None:
+            return None
+        with get_session() as session:
+            last = session.scalar(select(func.max(Run.started_at)).where(Run.query_id == self.query_id, Run.status == RunStatus.COMPLETED,
+                func.json_extract(Run.stats_json, "$.connector") == self.channel))
+        if last is None:
+            return None
+        days = math.ceil((datetime.utcnow() - last).total_seconds() / 86400) + INCREMENTAL_OVERLAP_DAYS
+        return f"d{max(1, days)}"
+
+    def _all_known(self, page: list[dict[str, Any]], start: int) -> bool:
+        """페이지의 URL 이 전부 items 에 있으면 True (뒤 페이지는 더 오래된 결과라 더 볼 필요가 없다)."""
+        canonical = {c.url: c.key for c in canonicalize_urls(item["url"] for item in page) if c.url}
+        if not canonical:
+            return False
+        with self.stats.phase("dedup"), get_session() as session:
+            known = set(session.scalars(select(Item.canonical_url).where(Item.url_key.in_(set(canonical.values())))))
+        if not canonical.keys() <= known:
+            return False
+        logger.debug(f"CSE incremental: all {len(canonical)} URLs known at start={start}, stopping")
+        return True
+
+    def _params(self, query: str, start: int, date_restrict: str | None = None) -> dict[str, Any]:
+        params = {"key": settings.google_cse_api_key, "cx": settings.google_cse_cx, "q": query, "start": start, "num": PAGE_SIZE}
+        if date_restrict:
+            params["dateRestrict"] = date_restrict
+        return params
+
+    def _cache_key(self, query: str, start: int, date_restrict: str | None = None) -> tuple:
+        return settings.google_cse_endpoint, settings.google_cse_cx, query, start, PAGE_SIZE, date_restrict
+
+    def _request(self, client: httpx.Client, query: str, start: int = 1, date_restrict: str | None = None) -> dict[str, Any]:
+        """캐시 -> 일일 한도 장부 -> QPS 제한 -> HTTP 순서. 캐시 적중은 할당량을 쓰지 않는다."""
+        key = self._cache_key(query, start, date_restrict)
+        if (cached := get_response_cache().get(key)) is not None:
+            logger.debug(f"CSE cache hit: {query} (start={start})")
+            record_cache_hit()
+            return cached
         logger.debug(f"CSE search: {query} (start={start})")
-        with httpx.Client(timeout=30) as client:
-            response = client.get(CSE_API_URL, params=params)
-            response.raise_for_status()
-            data = response.json()
-        return [self._parse_item(item) for item in data.get("items", [])]
+        for attempt in itertools.count():
+            reserve()
+            get_rate_limiter().acquire()
+            with self.stats.phase("http"):
+                response = client.get(settings.google_cse_endpoint, params=self._params(query, start, date_restrict))
+            self.stats.add_download(len(response.content))
+            delay = _retry_delay(response, attempt)
+            if delay is None:
+                break
+            logger.warning(f"CSE {response.status_code} for {query!r} (start={start}), retrying in {delay:g}s")
+            time.sleep(delay)
+        response.raise_for_status()
+        data = response.json()
+        get_response_cache().put(key, data)
+        return data
+
+    async def _request_async(self, client: httpx.AsyncClient, query: str, start: int = 1, date_restrict: str | None = None) -> dict[str, Any]:
+        key = self._cache_key(query, start, date_restrict)
+        if (cached := get_response_cache().get(key)) is not None:
+            logger.debug(f"CSE cache hit: {query} (start={start})")
+            await asyncio.to_thread(record_cache_hit)
+            return cached
+        logger.debug(f"CSE search: {query} (start={start})")
+        for attempt in itertools.count():
+            # 장부는 DB 쓰기라 이벤트 루프를 막지 않도록 스레드에서
+            await asyncio.to_thread(reserve)
+            await get_rate_limiter().acquire_async()
+            with self.stats.phase("http"):
+                response = await client.get(settings.google_cse_endpoint, params=self._params(query, start, date_restrict))
+            self.stats.add_download(len(response.content))
+            delay = _retry_delay(response, attempt)
+            if delay is None:
+                break
+            logger.warning(f"CSE {response.status_code} for {query!r} (start={start}), retrying in {delay:g}s")
+            await asyncio.sleep(delay)
+        response.raise_for_status()
+        data = response.json()
+        get_response_cache().put(key, data)
+        return data
+
+    def _parse_items(self, data: dict[str, Any]) -> list[dict[str, Any]]:
+        with self.stats.phase("parse"):
+            return [self._parse_item(item) for item in data.get("items", [])]
 
     def _parse_item(self, item: dict[str, Any]) -> dict[str, Any]:
         pagemap = item.get("pagemap", {})
@@ -51,3 +222,36 @@ class GoogleCSEConnector(BaseConnector):
             "url": item.get("link", ""), "title": item.get("title", ""), "snippet": item.get("snippet", ""),
             "published_at": published_at, "author": metatags.get("author"),
             "raw": {"displayLink": item.get("displayLink"), "formattedUrl": item.get("formattedUrl"), "pagemap": pagemap}}
+
+
+def _async_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(timeout=30, limits=httpx.Limits(max_connections=settings.cse_concurrency))
+
+
+async def fetch_queries_async(queries: dict[int, str], pages: int = 1, client: httpx.AsyncClient | None = None,
+                              connectors: dict[int, GoogleCSEConnector] | None = None, incremental: bool | None = None) -> dict[int, list[dict[str, Any]] | Exception]:
+    """여러 쿼리를 하나의 AsyncClient 로 동시에 수집. 실패한 쿼리는 예외 객체로 돌려준다.
+
+    connectors 를 넘기면 그 커넥터로 받아 HTTP 지표(stats)가 이후 ingest 의 Run 에 이어진다.
+    """
+    connectors = connectors if connectors is not None else {}
+
+    async def one(client: httpx.AsyncClient, query_id: int, query_string: str):
+        try:
+            connector = connectors.setdefault(query_id, GoogleCSEConnector(query_id=query_id))
+            return await connector.fetch_async(client, query_string, pages, incremental)
+        except Exception as e:
+            logger.warning(f"CSE query {query_id} failed: {e}")
+            return e
+
+    async with (_async_client() if client is None else nullcontext(client)) as client:
+        results = await asyncio.gather(*(one(client, qid, qs) for qid, qs in queries.items()))
+    return dict(zip(queries, results, strict=True))
+
+
+def ingest_queries(queries: dict[int, str], pages: int = 1, incremental: bool | None = None) -> dict[int, IngestResult]:
+    """쿼리들을 동시에 받아온 뒤 쿼리별 Run 으로 저장."""
+    connectors = {qid: GoogleCSEConnector(query_id=qid) for qid in queries}
+    fetched = asyncio.run(fetch_queries_async(queries, pages, connectors=connectors, incremental=incremental))
+    return {qid: connectors[qid].ingest(items=deferred_error(data) if isinstance(data, Exception) else data)
+            for qid, data in fetched.items()}
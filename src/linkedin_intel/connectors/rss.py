@@ -1,16 +1,35 @@
 """RSS 커넥터."""
+import asyncio
+import hashlib
 import json
 import logging
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 from datetime import datetime
 from email.utils import parsedate_to_datetime
 from typing import Any
 import feedparser
 import httpx
 from bs4 import BeautifulSoup
-from linkedin_intel.connectors.base import BaseConnector
-from linkedin_intel.models import get_session, Source
+from linkedin_intel.config import settings
+from linkedin_intel.connectors.base import BaseConnector, IngestResult, deferred_error
+from linkedin_intel.metrics import RunStats
+from linkedin_intel.models import get_session, Source, SourceType
 
 logger = logging.getLogger(__name__)
+HEADERS = {"User-Agent": "GEO-LinkedIn-Intel/1.0"}
+
+
+@dataclass
+class FeedPoll:
+    """조건부 요청 한 번의 결과. changed 가 아니면 파싱/DB 작업을 건너뛴다."""
+    source_id: int
+    name: str
+    status: str = "changed"  # changed | not_modified | unchanged | error
+    entries: list[Any] = field(default_factory=list)
+    validators: dict[str, str] = field(default_factory=dict)
+    error: Exception | None = None
+    stats: RunStats = field(default_factory=RunStats)  # 조회 단계 지표, ingest_poll 에서 Run 으로 넘어간다
 
 
 class RSSConnector(BaseConnector):
@@ -26,19 +45,21 @@ class RSSConnector(BaseConnector):
                     feed_url = config.get("feed_url")
         if not feed_url:
             raise ValueError("RSS feed URL not provided")
-        
-        headers = {"User-Agent": "GEO-LinkedIn-Intel/1.0"}
-        with httpx.Client(timeout=30, follow_redirects=True) as client:
-            response = client.get(feed_url, headers=headers)
-            response.raise_for_status()
-        feed = feedparser.parse(response.text)
-        items = []
-        for entry in feed.entries[:max_items]:
-            if entry.get("link"):
-                items.append(self._parse_entry(entry))
+
+        with httpx.Client(timeout=30, follow_redirects=True) as client, self.stats.phase("http"):
+            response = client.get(feed_url, headers=HEADERS)
+        self.stats.add_download(len(response.content))
+        response.raise_for_status()
+        with self.stats.phase("parse"):
+            feed = feedparser.parse(response.text)
+        items = self.parse_entries(feed.entries[:max_items])
         logger.info(f"RSS fetched {len(items)} items from {feed_url}")
         return items
 
+    def parse_entries(self, entries: list[Any]) -> list[dict[str, Any]]:
+        with self.stats.phase("parse"):
+            return [self._parse_entry(entry) for entry in entries if entry.get("link")]
+
     def _parse_entry(self, entry: dict[str, Any]) -> dict[str, Any]:
         published_at = None
         date_str = entry.get("published") or entry.get("updated")
@@ -56,3 +77,86 @@ class RSSConnector(BaseConnector):
             summary = soup.get_text(separator=" ", strip=True)[:500]
         return {"url": entry.get("link", ""), "title": entry.get("title", ""), "snippet": summary,
             "published_at": published_at, "author": entry.get("author"), "raw": {"feed_id": entry.get("id")}}
+
+
+def _entries_hash(entries: list[Any]) -> str:
+    ids = "\n".join(entry.get("id") or entry.get("link") or "" for entry in entries)
+    return hashlib.sha256(ids.encode()).hexdigest()
+
+
+def load_rss_sources() -> list[tuple[int, str, dict[str, Any]]]:
+    with get_session() as session:
+        sources = session.query(Source).filter(Source.type == SourceType.RSS).order_by(Source.id).all()
+        return [(s.id, s.name, json.loads(s.config_json) if s.config_json else {}) for s in sources]
+
+
+async def poll_feed(client: httpx.AsyncClient, source_id: int, name: str, config: dict[str, Any], max_items: int = 50) -> FeedPoll:
+    """ETag/Last-Modified 조건부 GET. 304 이거나 엔트리 ID 해시가 같으면 unchanged 로 끝낸다."""
+    poll = FeedPoll(source_id=source_id, name=name)
+    try:
+        feed_url = config.get("feed_url")
+        if not feed_url:
+            raise ValueError("RSS feed URL not provided")
+        headers = dict(HEADERS)
+        if config.get("etag"):
+            headers["If-None-Match"] = config["etag"]
+        if config.get("last_modified"):
+            headers["If-Modified-Since"] = config["last_modified"]
+        with poll.stats.phase("http"):
+            response = await client.get(feed_url, headers=headers)
+        poll.stats.add_download(len(response.content))
+        if response.status_code == 304:
+            poll.status = "not_modified"
+            return poll
+        response.raise_for_status()
+        poll.validators = {k: v for k, v in (("etag", response.headers.get("ETag")),
+            ("last_modified", response.headers.get("Last-Modified"))) if v}
+        with poll.stats.phase("parse"):
+            entries = feedparser.parse(response.content).entries[:max_items]
+        poll.validators["entries_hash"] = _entries_hash(entries)
+        if poll.validators["entries_hash"] == config.get("entries_hash"):
+            poll.status = "unchanged"
+        else:
+            poll.entries = entries
+    except Exception as e:
+        logger.warning(f"RSS source {source_id} failed: {e}")
+        poll.status, poll.error = "error", e
+    return poll
+
+
+async def poll_feeds(sources: list[tuple[int, str, dict[str, Any]]], max_items: int = 50,
+                     client: httpx.AsyncClient | None = None) -> list[FeedPoll]:
+    """모든 피드를 하나의 커넥션 풀로 동시에 조회."""
+    limits = httpx.Limits(max_connections=settings.rss_concurrency)
+    async with (httpx.AsyncClient(timeout=30, follow_redirects=True, limits=limits) if client is None else nullcontext(client)) as client:
+        return list(await asyncio.gather(*(poll_feed(client, sid, name, config, max_items) for sid, name, config in sources)))
+
+
+def save_validators(source_id: int, validators: dict[str, str]) -> None:
+    with get_session() as session:
+        source = session.get(Source, source_id)
+        config = json.loads(source.config_json) if source.config_json else {}
+        if any(config.get(k) != v for k, v in validators.items()):
+            config.update(validators)
+            source.config_json = json.dumps(config)
+
+
+def ingest_poll(poll: FeedPoll, query_id: int | None = None) -> IngestResult | None:
+    """조회 결과 하나를 저장. 변경 없는 피드는 None (Run 도 남기지 않음)."""
+    if poll.status in ("not_modified", "unchanged"):
+        if poll.validators:
+            save_validators(poll.source_id, poll.validators)
+        return None
+    connector = RSSConnector(query_id=query_id, source_id=poll.source_id)
+    connector.stats = poll.stats
+    items = deferred_error(poll.error) if poll.error else connector.parse_entries(poll.entries)
+    result = connector.ingest(items=items)
+    # 저장이 끝난 뒤에만 검증자를 갱신해야 실패한 피드를 다음 실행에서 다시 받는다
+    if not result.failed:
+        save_validators(poll.source_id, poll.validators)
+    return result
+
+
+def ingest_all_feeds(max_items: int = 50, query_id: int | None = None) -> list[tuple[FeedPoll, IngestResult | None]]:
+    polls = asyncio.run(poll_feeds(load_rss_sources(), max_items))
+    return [(poll, ingest_poll(poll, query_id)) for poll in polls]
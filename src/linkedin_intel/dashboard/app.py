@@ -1,4 +1,5 @@
 """Streamlit 대시보드."""
+import html
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
@@ -6,73 +7,134 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 import pandas as pd
 import plotly.express as px
 import streamlit as st
-from linkedin_intel.models import get_session, get_db_path, init_db, Query, Item, Run
+from linkedin_intel.config import settings
+from linkedin_intel.dashboard import queries
+from linkedin_intel.models import get_session, get_db_path, init_db
+from linkedin_intel.search import render_highlight, search_items
+
+# 버전 키 조회는 짧게, 나머지는 버전(최신 Run)이 바뀌면 자동으로 새 키가 되므로 길게 캐시
+VERSION_TTL = 10
+DATA_TTL = 600
+PAGE_SIZE = 100
 
 st.set_page_config(page_title="LG VS GEO Monitor", page_icon="🔍", layout="wide")
 
+
+@st.cache_resource(show_spinner=False)
+def ensure_db() -> None:
+    """스키마/마이그레이션 확인은 프로세스당 한 번 (rerun 마다 쓰기 엔진을 열고 payload 사전 캐시를 비우지 않게)."""
+    init_db()
+
+
 db_path = get_db_path()
 if not db_path.exists():
     st.error("DB 없음. 'geo init-db --seed' 실행 필요")
     st.stop()
-init_db()
+ensure_db()
+
+
+@st.cache_data(ttl=VERSION_TTL, show_spinner=False)
+def load_version() -> tuple:
+    with get_session(read_only=True) as session:
+        return queries.data_version(session)
+
+
+@st.cache_data(ttl=DATA_TTL, show_spinner=False)
+def load_overview(version: tuple) -> queries.Overview:
+    with get_session(read_only=True) as session:
+        return queries.overview(session)
+
+
+@st.cache_data(ttl=DATA_TTL, show_spinner=False)
+def load_stats(version: tuple, query_id: int | None, channel: str | None) -> queries.ItemStats:
+    with get_session(read_only=True) as session:
+        return queries.item_stats(session, query_id, channel)
+
+
+@st.cache_data(ttl=DATA_TTL, show_spinner=False)
+def load_daily_series(version: tuple, query_id: int | None, channel: str | None) -> list[dict]:
+    with get_session(read_only=True) as session:
+        return queries.daily_series(session, query_id, channel)
+
+
+@st.cache_data(ttl=DATA_TTL, show_spinner=False)
+def load_item_page(version: tuple, query_id: int | None, channel: str | None, after: tuple | None, before: tuple | None,
+                   collapse: bool) -> queries.ItemPage:
+    with get_session(read_only=True) as session:
+        return queries.item_page(session, query_id, channel, after=after, before=before, limit=PAGE_SIZE, collapse=collapse)
+
+
+@st.cache_data(ttl=DATA_TTL, show_spinner=False)
+def load_search(version: tuple, text: str, query_id: int | None, channel: str | None) -> list:
+    with get_session(read_only=True) as session:
+        return search_items(session, text, query_id=query_id, channel=channel, limit=50)
+
+
+version = load_version()
+overview = load_overview(version)
 
 st.sidebar.title("🔍 LG VS GEO")
 st.sidebar.markdown("---")
 
-with get_session() as session:
-    queries = session.query(Query).all()
-    query_options = {q.name: q.id for q in queries}
-
+query_options = overview.queries
 selected_query = st.sidebar.selectbox("쿼리", ["전체"] + list(query_options.keys()))
 query_id = query_options.get(selected_query) if selected_query != "전체" else None
 
 channels = ["전체", "google_cse", "rss", "email", "manual"]
 selected_channel = st.sidebar.selectbox("채널", channels)
 channel = selected_channel if selected_channel != "전체" else None
+search_text = st.sidebar.text_input("🔎 검색", placeholder="제목/스니펫/작성자 (접두 검색: sdv*)").strip()
+collapse = st.sidebar.checkbox("유사 게시물 묶기", value=bool(settings.neardup_threshold), help="채널/URL 이 달라도 제목+스니펫이 거의 같은 게시물은 한 행으로")
 
 st.title("📊 LinkedIn 키워드 모니터링")
 
-with get_session() as session:
-    q = session.query(Item)
-    if query_id:
-        q = q.filter(Item.query_id == query_id)
-    if channel:
-        q = q.filter(Item.channel == channel)
-    total = q.count()
-
+stats = load_stats(version, query_id, channel)
 col1, col2, col3, col4 = st.columns(4)
-col1.metric("총 수집 건수", f"{total:,}")
-
-with get_session() as session:
-    from datetime import datetime, timedelta
-    week_ago = datetime.utcnow() - timedelta(days=7)
-    q = session.query(Item).filter(Item.collected_at >= week_ago)
-    if query_id:
-        q = q.filter(Item.query_id == query_id)
-    col2.metric("7일 신규", f"{q.count():,}")
-
-with get_session() as session:
-    runs = session.query(Run).order_by(Run.started_at.desc()).limit(1).first()
-    col3.metric("마지막 수집", runs.started_at.strftime("%m-%d %H:%M") if runs else "-")
-
+col1.metric("총 수집 건수", f"{stats.total:,}")
+col2.metric("7일 신규", f"{stats.new_7d:,}")
+col3.metric("마지막 수집", overview.last_run_started.strftime("%m-%d %H:%M") if overview.last_run_started else "-")
 col4.metric("쿼리 수", str(len(query_options)))
 
-st.markdown("---")
+series = load_daily_series(version, query_id, channel)
+if series:
+    fig = px.bar(pd.DataFrame(series), x="day", y="new", color="channel", labels={"day": "수집일", "new": "신규", "channel": "채널"}, height=280)
+    fig.update_layout(margin={"l": 0, "r": 0, "t": 10, "b": 0}, legend_title_text="")
+    st.plotly_chart(fig, use_container_width=True)
 
-with get_session() as session:
-    items = session.query(Item)
-    if query_id:
-        items = items.filter(Item.query_id == query_id)
-    if channel:
-        items = items.filter(Item.channel == channel)
-    items = items.order_by(Item.collected_at.desc()).limit(100).all()
+st.markdown("---")
 
-if items:
-    data = [{"제목": i.title or "-", "채널": i.channel, "수집일": i.collected_at.strftime("%Y-%m-%d %H:%M"), "URL": i.url} for i in items]
+if search_text:
+    hits = load_search(version, search_text, query_id, channel)
+    st.subheader(f"검색 결과 {len(hits)}건")
+    for hit in hits:
+        title = render_highlight(hit.title_hl, "<mark>", "</mark>", html.escape) or "-"
+        snippet = render_highlight(hit.snippet_hl, "<mark>", "</mark>", html.escape)
+        st.markdown(f'<a href="{html.escape(hit.url)}" target="_blank"><b>{title}</b></a> '
+                    f'<small>· {hit.channel} · {hit.collected_at:%Y-%m-%d}</small><br><small>{snippet}</small>', unsafe_allow_html=True)
+    st.markdown("---")
+
+# 필터가 바뀌면 첫 페이지로. 커서는 ("after" | "before", (collected_at, id))
+if st.session_state.get("page_filter") != (query_id, channel, collapse):
+    st.session_state.page_filter = (query_id, channel, collapse)
+    st.session_state.page_cursor = None
+direction, cursor = st.session_state.page_cursor or (None, None)
+page = load_item_page(version, query_id, channel, cursor if direction == "after" else None, cursor if direction == "before" else None, collapse)
+if page.rows:
+    data = [{"제목": i["title"] or "-", "채널": i["channel"], "수집일": i["collected_at"].strftime("%Y-%m-%d %H:%M"), "URL": i["url"]}
+            | ({"유사": i["similar"]} if collapse else {}) for i in page.rows]
     df = pd.DataFrame(data)
     st.dataframe(df, use_container_width=True, height=400, column_config={"URL": st.column_config.LinkColumn("URL")})
+    prev_col, info_col, next_col = st.columns([1, 6, 1])
+    info_col.caption(f"{page.rows[0]['collected_at']:%Y-%m-%d %H:%M} ~ {page.rows[-1]['collected_at']:%Y-%m-%d %H:%M} · {len(page.rows)}건")
+    if prev_col.button("◀ 이전", disabled=not page.has_prev, use_container_width=True):
+        st.session_state.page_cursor = ("before", page.first)
+        st.rerun()
+    if next_col.button("다음 ▶", disabled=not page.has_next, use_container_width=True):
+        st.session_state.page_cursor = ("after", page.last)
+        st.rerun()
 else:
     st.info("데이터 없음")
 
 if st.sidebar.button("🔄 새로고침"):
+    st.cache_data.clear()
     st.rerun()
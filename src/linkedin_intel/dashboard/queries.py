@@ -0,0 +1,119 @@
+"""대시보드 조회 함수 (Streamlit 비의존, 세션을 받아 값만 반환)."""
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any
+from sqlalchemy import case, exists, func, or_, select, tuple_
+from sqlalchemy.orm import Session, aliased
+from linkedin_intel.models import Item, ItemRollup, Query, Run
+from linkedin_intel.neardup import cluster_sizes
+
+
+@dataclass(frozen=True)
+class ItemStats:
+    total: int
+    new_7d: int
+
+
+# 키셋 페이지 커서: 경계 행의 (collected_at, id)
+Cursor = tuple[datetime, int]
+
+
+@dataclass(frozen=True)
+class ItemPage:
+    rows: list[dict[str, Any]]
+    has_prev: bool
+    has_next: bool
+
+    @property
+    def first(self) -> Cursor | None:
+        return (self.rows[0]["collected_at"], self.rows[0]["id"]) if self.rows else None
+
+    @property
+    def last(self) -> Cursor | None:
+        return (self.rows[-1]["collected_at"], self.rows[-1]["id"]) if self.rows else None
+
+
+@dataclass(frozen=True)
+class Overview:
+    queries: dict[str, int]
+    last_run_started: datetime | None
+
+
+def data_version(session: Session) -> tuple[Any, ...]:
+    """캐시 무효화 키: 최신 Run.id / 최근 ended_at (+ 진행 중 청크 커밋 반영용 최신 Run 의 records_fetched).
+
+    runs 전체를 합산하지 않고 PK/ended_at 인덱스 끝값만 읽는다."""
+    row = session.execute(select(Run.id, select(func.max(Run.ended_at)).scalar_subquery(), Run.records_fetched)
+        .where(Run.id == select(func.max(Run.id)).scalar_subquery())).first()
+    return tuple(row) if row else (None, None, None)
+
+
+def _item_filters(query_id: int | None, channel: str | None, item=Item) -> list[Any]:
+    filters = []
+    if query_id:
+        filters.append(item.query_id == query_id)
+    if channel:
+        filters.append(item.channel == channel)
+    return filters
+
+
+def _rollup_filters(query_id: int | None, channel: str | None) -> list[Any]:
+    filters = []
+    if query_id:
+        filters.append(ItemRollup.query_id == query_id)
+    if channel:
+        filters.append(ItemRollup.channel == channel)
+    return filters
+
+
+def item_stats(session: Session, query_id: int | None = None, channel: str | None = None) -> ItemStats:
+    """총 건수와 7일(오늘 포함) 신규를 일자별 집계에서 쿼리 한 번으로."""
+    week_start = datetime.utcnow().date() - timedelta(days=6)
+    total, new_7d = session.execute(select(func.coalesce(func.sum(ItemRollup.new_count), 0),
+        func.coalesce(func.sum(case((ItemRollup.day >= week_start, ItemRollup.new_count), else_=0)), 0))
+        .where(*_rollup_filters(query_id, channel))).one()
+    return ItemStats(total=total, new_7d=new_7d)
+
+
+def daily_series(session: Session, query_id: int | None = None, channel: str | None = None, days: int = 90) -> list[dict[str, Any]]:
+    """채널별 일자 신규/재확인 건수 (시계열 차트용)."""
+    since: date = datetime.utcnow().date() - timedelta(days=days - 1)
+    rows = session.execute(select(ItemRollup.day, ItemRollup.channel, func.sum(ItemRollup.new_count).label("new"),
+        func.sum(ItemRollup.seen_count).label("seen")).where(ItemRollup.day >= since, *_rollup_filters(query_id, channel))
+        .group_by(ItemRollup.day, ItemRollup.channel).order_by(ItemRollup.day, ItemRollup.channel))
+    return [row._asdict() for row in rows]
+
+
+def overview(session: Session) -> Overview:
+    queries = dict(session.execute(select(Query.name, Query.id).order_by(Query.id)).all())
+    return Overview(queries=queries, last_run_started=session.scalar(select(func.max(Run.started_at))))
+
+
+def item_page(session: Session, query_id: int | None = None, channel: str | None = None, after: Cursor | None = None,
+              before: Cursor | None = None, limit: int = 100, collapse: bool = False) -> ItemPage:
+    """최신순 목록의 한 페이지 (목록에 필요한 컬럼만). after 는 다음(더 오래된) 페이지, before 는 이전 페이지.
+
+    OFFSET 대신 (collected_at, id) 커서로 인덱스 범위를 바로 찾으므로 몇 번째 페이지든 비용이 같다.
+    collapse 면 유사 게시물 묶음마다 대표 한 행만 (대표가 필터에 걸리지 않으면 구성원이 보인다), 행마다 묶음 크기 similar.
+    """
+    key = tuple_(Item.collected_at, Item.id)
+    stmt = select(Item.id, Item.title, Item.channel, Item.collected_at, Item.url).where(*_item_filters(query_id, channel))
+    if collapse:
+        rep = aliased(Item)
+        stmt = stmt.add_columns(Item.cluster_id).where(or_(Item.cluster_id.is_(None),
+            ~exists().where(rep.id == Item.cluster_id, *_item_filters(query_id, channel, rep))))
+    if before:
+        stmt = stmt.where(key > tuple_(*before)).order_by(Item.collected_at, Item.id)
+    else:
+        stmt = stmt.where(key < tuple_(*after)) if after else stmt
+        stmt = stmt.order_by(Item.collected_at.desc(), Item.id.desc())
+    rows = [row._asdict() for row in session.execute(stmt.limit(limit + 1))]
+    more = len(rows) > limit
+    rows = rows[:limit]
+    if collapse:
+        sizes = cluster_sizes(session, {row["cluster_id"] or row["id"] for row in rows})
+        for row in rows:
+            row["similar"] = sizes.get(row.pop("cluster_id") or row["id"], 1)
+    if before:
+        return ItemPage(rows=rows[::-1], has_prev=more, has_next=True)
+    return ItemPage(rows=rows, has_prev=after is not None, has_next=more)
@@ -0,0 +1,139 @@
+"""수집 항목 내보내기 (geo export): Parquet / JSONL / CSV.
+
+items 를 id 순으로 서버 측 커서(yield_per)로 chunk_size 건씩 읽어 바로 파일에 쓰므로 행 수와 관계없이 메모리가 일정하다.
+쿼리 / 소스 이름은 JOIN 으로, 태그는 청크마다 한 번의 조회로 붙인다. Parquet 은 청크 하나가 row group 하나 (pyarrow 필요).
+임시 파일에 쓰고 끝나면 rename 하므로 중간에 실패해도 반쯤 쓴 파일이 남지 않는다.
+"""
+import csv
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+from sqlalchemy import select
+from linkedin_intel.models import get_session, item_tags, Item, Query, Source, Tag
+
+FORMATS = ("parquet", "jsonl", "csv")
+EXPORT_CHUNK = 5000
+COLUMNS = ("id", "url", "canonical_url", "title", "snippet", "author", "published_at", "collected_at", "last_seen_at", "channel",
+    "query_id", "query", "source_id", "source", "cluster_id", "tags")
+TAG_SEPARATOR = ";"  # CSV 의 tags 칸
+
+
+@dataclass(frozen=True)
+class ExportResult:
+    rows: int
+    last_id: int | None  # 다음 증분 내보내기의 --since-id
+
+
+def export_format(path: Path, fmt: str | None = None) -> str:
+    """형식을 정하거나 확장자로 추정. 모르는 형식이면 ValueError."""
+    fmt = (fmt or path.suffix.lstrip(".")).lower()
+    fmt = "jsonl" if fmt in ("json", "ndjson") else fmt
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format {fmt!r} (use {', '.join(FORMATS)})")
+    return fmt
+
+
+def _item_query(query_id: int | None, channel: str | None, since: datetime | None, until: datetime | None, since_id: int | None):
+    stmt = (select(Item.id, Item.url, Item.canonical_url, Item.title, Item.snippet, Item.author, Item.published_at, Item.collected_at,
+        Item.last_seen_at, Item.channel, Item.query_id, Query.name.label("query"), Item.source_id, Source.name.label("source"), Item.cluster_id)
+        .outerjoin(Query, Query.id == Item.query_id).outerjoin(Source, Source.id == Item.source_id).order_by(Item.id))
+    if query_id is not None:
+        stmt = stmt.where(Item.query_id == query_id)
+    if channel:
+        stmt = stmt.where(Item.channel == channel)
+    if since:
+        stmt = stmt.where(Item.collected_at >= since)
+    if until:
+        stmt = stmt.where(Item.collected_at < until)
+    if since_id is not None:
+        stmt = stmt.where(Item.id > since_id)
+    return stmt
+
+
+def _tags(session, ids: list[int]) -> dict[int, list[str]]:
+    tags: dict[int, list[str]] = {}
+    for item_id, name in session.execute(select(item_tags.c.item_id, Tag.name).join(Tag, Tag.id == item_tags.c.tag_id)
+            .where(item_tags.c.item_id.in_(ids)).order_by(item_tags.c.item_id, Tag.name)):
+        tags.setdefault(item_id, []).append(name)
+    return tags
+
+
+class _JsonlWriter:
+    def __init__(self, path: Path):
+        self.file = open(path, "w", encoding="utf-8")
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        self.file.writelines(json.dumps(row, ensure_ascii=False, default=datetime.isoformat) + "\n" for row in rows)
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class _CsvWriter:
+    def __init__(self, path: Path):
+        self.file = open(path, "w", encoding="utf-8-sig", newline="")  # Excel 이 UTF-8 로 열도록 BOM
+        self.writer = csv.DictWriter(self.file, fieldnames=COLUMNS)
+        self.writer.writeheader()
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        self.writer.writerows({**{k: v.isoformat() if isinstance(v, datetime) else v for k, v in row.items()}, "tags": TAG_SEPARATOR.join(row["tags"])}
+            for row in rows)
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class _ParquetWriter:
+    def __init__(self, path: Path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet export requires pyarrow: pip install -e '.[export]'") from None
+        ts, text, key = pa.timestamp("us"), pa.string(), pa.int64()
+        self.pa = pa
+        self.schema = pa.schema([("id", key), ("url", text), ("canonical_url", text), ("title", text), ("snippet", text), ("author", text),
+            ("published_at", ts), ("collected_at", ts), ("last_seen_at", ts), ("channel", text), ("query_id", key), ("query", text),
+            ("source_id", key), ("source", text), ("cluster_id", key), ("tags", pa.list_(text))])
+        self.writer = pq.ParquetWriter(path, self.schema, compression="zstd")
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        self.writer.write_table(self.pa.Table.from_pylist(rows, schema=self.schema), row_group_size=len(rows))
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+WRITERS = {"parquet": _ParquetWriter, "jsonl": _JsonlWriter, "csv": _CsvWriter}
+
+
+def export_items(path: str | Path, fmt: str | None = None, query_id: int | None = None, channel: str | None = None,
+                 since: datetime | None = None, until: datetime | None = None, since_id: int | None = None,
+                 chunk_size: int = EXPORT_CHUNK, on_chunk: Callable[[int], None] | None = None) -> ExportResult:
+    """필터에 맞는 항목을 id 순으로 path 에 쓴다. since/until 은 collected_at 범위 [since, until), since_id 는 그 id 다음부터."""
+    path = Path(path)
+    writer_cls = WRITERS[export_format(path, fmt)]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    writer = writer_cls(tmp)
+    rows, last_id, done = 0, since_id, False  # 새 항목이 없으면 증분 커서를 그대로 넘긴다
+    try:
+        with get_session(read_only=True) as session:
+            result = session.execute(_item_query(query_id, channel, since, until, since_id).execution_options(yield_per=chunk_size))
+            for partition in result.mappings().partitions():
+                tags = _tags(session, [row["id"] for row in partition])
+                writer.write([{**row, "tags": tags.get(row["id"], [])} for row in partition])
+                rows, last_id = rows + len(partition), partition[-1]["id"]
+                if on_chunk:
+                    on_chunk(rows)
+        done = True
+    finally:
+        writer.close()
+        if done:
+            os.replace(tmp, path)
+        else:
+            tmp.unlink(missing_ok=True)
+    return ExportResult(rows=rows, last_id=last_id)
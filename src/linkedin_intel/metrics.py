@@ -0,0 +1,180 @@
+"""수집 실행(Run)별 단계 시간 / 자원 지표.
+
+커넥터마다 RunStats 하나를 두고 HTTP / 파싱 / 정규화 / dedup 조회 / INSERT / 커밋 시간을 누적해 Run.stats_json 에 남긴다.
+여러 Run 의 지표를 커넥터별 백분위로 묶고 (geo runs --stats), node_exporter textfile 형식으로 내보낸다.
+"""
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator
+from sqlalchemy import select
+from linkedin_intel.models import Run, RunStatus
+
+# 표시 순서. http/parse 는 커넥터가, 나머지는 BaseConnector.ingest 가 기록한다
+PHASES = ("http", "parse", "fetch", "canonicalize", "dedup", "insert", "tag", "neardup", "commit")
+STATS_WINDOW = 200  # 백분위 / textfile 계산에 쓰는 최근 Run 수
+QUANTILES = (0.5, 0.95)
+TEXTFILE_HELP = {
+    "geo_run_phase_seconds": "Ingest phase wall time per run over recent runs",
+    "geo_run_ingest_seconds": "Total ingest wall time per run over recent runs",
+    "geo_run_bytes_downloaded": "HTTP response bytes per run over recent runs",
+    "geo_run_rss_bytes": "Process RSS at the end of each run over recent runs",
+    "geo_process_peak_rss_bytes": "Lifetime peak RSS (ru_maxrss) of the processes that ran recent runs",
+    "geo_run_last_items": "Item counts of the latest run",
+    "geo_run_last_failed": "1 if the latest run failed",
+    "geo_run_last_timestamp_seconds": "End time of the latest run (unix seconds)",
+    "geo_runs_window": "Runs included in the quantiles (latest runs with stats)",
+}
+
+
+def rss_bytes() -> int:
+    """현재 RSS (Linux /proc/self/statm). 읽을 수 없는 플랫폼은 0."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+def process_peak_rss_bytes() -> int:
+    """프로세스가 시작된 뒤 최대 RSS (이 Run 만의 값이 아니다). Linux 는 KB, macOS 는 바이트 단위로 준다. resource 가 없는 플랫폼은 0."""
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@dataclass
+class RunStats:
+    """단계별 벽시계 시간(초) 누적. 동시에 진행된 요청의 http 시간은 합산되므로 실행 시간보다 클 수 있다."""
+    phases: dict[str, float] = field(default_factory=dict)
+    bytes_downloaded: int = 0
+    requests: int = 0
+    rss_start_bytes: int = field(default_factory=rss_bytes)
+
+    def begin(self) -> None:
+        """ingest 시작. 아직 기록한 단계가 없으면 (커넥터를 만들고 한참 뒤 실행하는 경우) 시작 RSS 를 다시 잰다."""
+        if not self.phases:
+            self.rss_start_bytes = rss_bytes()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - started
+
+    def add_download(self, nbytes: int) -> None:
+        self.bytes_downloaded += nbytes
+        self.requests += 1
+
+    def to_dict(self, connector: str, result, ingest_seconds: float) -> dict[str, Any]:
+        return {"connector": connector, "ingest_seconds": round(ingest_seconds, 6),
+            "phases": {name: round(seconds, 6) for name, seconds in self.phases.items()},
+            "bytes_downloaded": self.bytes_downloaded, "requests": self.requests,
+            "rss_start_bytes": self.rss_start_bytes, "rss_end_bytes": rss_bytes(), "process_peak_rss_bytes": process_peak_rss_bytes(),
+            "items": {"fetched": result.total_fetched, "new": result.new_items, "duplicates": result.duplicates, "errors": result.errors}}
+
+
+def percentile(values: list[float], q: float) -> float:
+    """최근접 순위 백분위."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+@dataclass
+class ConnectorStats:
+    connector: str
+    runs: int = 0
+    failed: int = 0
+    # 지표 이름 -> 실행별 값. phase 는 "phase:<이름>", 그 외 ingest_seconds / bytes_downloaded / rss_end_bytes / process_peak_rss_bytes
+    samples: dict[str, list[float]] = field(default_factory=dict)
+    last: dict[str, Any] = field(default_factory=dict)
+    last_ended_at: datetime | None = None
+
+    def add(self, name: str, value: float) -> None:
+        self.samples.setdefault(name, []).append(value)
+
+
+def load_run_stats(session, limit: int = STATS_WINDOW) -> dict[str, ConnectorStats]:
+    """최근 limit 개 Run 의 stats_json 을 커넥터별로 모은다 (last 는 가장 최근 실행)."""
+    rows = session.execute(select(Run.stats_json, Run.status, Run.ended_at).where(Run.stats_json.is_not(None))
+        .order_by(Run.id.desc()).limit(limit))
+    grouped: dict[str, ConnectorStats] = {}
+    for stats_json, status, ended_at in rows:
+        stats = json.loads(stats_json)
+        entry = grouped.setdefault(stats["connector"], ConnectorStats(stats["connector"]))
+        if not entry.runs:
+            entry.last, entry.last_ended_at = {**stats, "failed": status == RunStatus.FAILED}, ended_at
+        entry.runs += 1
+        entry.failed += status == RunStatus.FAILED
+        entry.add("ingest_seconds", stats["ingest_seconds"])
+        entry.add("bytes_downloaded", stats["bytes_downloaded"])
+        if "rss_end_bytes" in stats:
+            entry.add("rss_end_bytes", stats["rss_end_bytes"])
+        # 예전 Run 의 peak_rss_bytes 도 같은 ru_maxrss 값이다
+        entry.add("process_peak_rss_bytes", stats.get("process_peak_rss_bytes", stats.get("peak_rss_bytes", 0)))
+        for phase in PHASES:
+            entry.add(f"phase:{phase}", stats["phases"].get(phase, 0.0))
+    return dict(sorted(grouped.items()))
+
+
+def _labels(**labels: str) -> str:
+    escaped = {k: str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for k, v in labels.items()}
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped.items()) + "}"
+
+
+def render_textfile(grouped: dict[str, ConnectorStats]) -> str:
+    """Prometheus 텍스트 형식. 백분위는 최근 STATS_WINDOW 개 Run 기준, geo_run_last_* 는 마지막 실행 값."""
+    lines: dict[str, list[str]] = {name: [] for name in TEXTFILE_HELP}
+
+    def emit(name: str, value: float | int, **labels) -> None:
+        lines[name].append(f"{name}{_labels(**labels)} {f'{value:.6g}' if isinstance(value, float) else value}")
+
+    for connector, entry in grouped.items():
+        for q in QUANTILES:
+            for phase in PHASES:
+                emit("geo_run_phase_seconds", percentile(entry.samples[f"phase:{phase}"], q), connector=connector, phase=phase, quantile=q)
+            emit("geo_run_ingest_seconds", percentile(entry.samples["ingest_seconds"], q), connector=connector, quantile=q)
+            emit("geo_run_bytes_downloaded", int(percentile(entry.samples["bytes_downloaded"], q)), connector=connector, quantile=q)
+            if entry.samples.get("rss_end_bytes"):
+                emit("geo_run_rss_bytes", int(percentile(entry.samples["rss_end_bytes"], q)), connector=connector, quantile=q)
+        emit("geo_process_peak_rss_bytes", int(max(entry.samples["process_peak_rss_bytes"])), connector=connector)
+        for kind, count in entry.last["items"].items():
+            emit("geo_run_last_items", count, connector=connector, kind=kind)
+        emit("geo_run_last_failed", int(entry.last["failed"]), connector=connector)
+        if entry.last_ended_at is not None:
+            # ended_at 은 UTC naive (datetime.utcnow)
+            emit("geo_run_last_timestamp_seconds", int((entry.last_ended_at - datetime(1970, 1, 1)).total_seconds()), connector=connector)
+        emit("geo_runs_window", entry.runs, connector=connector)
+    out = []
+    for name, help_text in TEXTFILE_HELP.items():
+        if lines[name]:
+            out += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge", *lines[name]]
+    return "\n".join(out) + "\n"
+
+
+def write_textfile(path: str | Path, session) -> None:
+    """textfile collector 가 반쯤 쓴 파일을 읽지 않도록 같은 디렉터리의 임시 파일에 쓰고 rename."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    content = render_textfile(load_run_stats(session))
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
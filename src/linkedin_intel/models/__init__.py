@@ -1,6 +1,28 @@
-"""데이터베이스 모델."""
-from .schema import Base, Query, Source, SourceType, Run, RunStatus, Item, Tag, item_tags, SEED_QUERIES, SEED_TAGS
-from .database import get_engine, get_session, get_db_path, init_db, seed_data
+"""데이터베이스 모델.
 
-__all__ = ["Base", "Query", "Source", "SourceType", "Run", "RunStatus", "Item", "Tag",
-    "item_tags", "SEED_QUERIES", "SEED_TAGS", "get_engine", "get_session", "get_db_path", "init_db", "seed_data"]
+schema/database 는 처음 접근할 때 불러온다 (database 는 설정(pydantic)까지 끌어오므로 schema 만 쓰는 모듈은 가볍게).
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+_SCHEMA = ("Base", "Query", "Source", "SourceType", "Run", "RunStatus", "Item", "ItemPayload", "ItemRollup", "PayloadDict", "Tag",
+    "ProcessedFile", "ApiQuota", "ItemSignature", "ItemLshBand", "TagRule", "TagRuleKind", "item_tags", "SEED_QUERIES", "SEED_TAGS",
+    "SEED_TAG_RULES")
+_DATABASE = ("get_engine", "get_session", "get_db_path", "init_db", "seed_data", "backup_db")
+_EXPORTS = {**dict.fromkeys(_SCHEMA, "schema"), **dict.fromkeys(_DATABASE, "database")}
+
+if TYPE_CHECKING:  # 타입 검사기용. 실제 내보내기는 __getattr__ / __all__
+    from .schema import (Base, Query, Source, SourceType, Run, RunStatus, Item, ItemPayload, ItemRollup, PayloadDict, Tag, ProcessedFile,  # noqa: F401
+        ApiQuota, ItemSignature, ItemLshBand, TagRule, TagRuleKind, item_tags, SEED_QUERIES, SEED_TAGS, SEED_TAG_RULES)  # noqa: F401
+    from .database import get_engine, get_session, get_db_path, init_db, seed_data, backup_db  # noqa: F401
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = [*_SCHEMA, *_DATABASE]
@@ -1,4 +1,5 @@
 """SQLAlchemy 데이터베이스 연결."""
+import sqlite3
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Generator
@@ -6,7 +7,21 @@ from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 from linkedin_intel.config import settings
-from linkedin_intel.models.schema import Base, Query, Source, SourceType, Tag, SEED_QUERIES, SEED_TAGS
+from linkedin_intel.models.migrations import run_migrations
+from linkedin_intel.models.schema import Base, Query, Tag, TagRule, TagRuleKind, SEED_QUERIES, SEED_TAGS, SEED_TAG_RULES
+
+
+# 이름별 SQLite 저장 프로필 (SQLITE_PROFILE). default 는 기존 동작(롤백 저널, 기본 캐시)을 유지한다.
+# journal_mode=WAL 은 DB 파일에 영구 기록되므로 WAL 프로필을 한 번 쓰면 이후 default 로 열어도 WAL 로 동작한다.
+STORAGE_PROFILES: dict[str, dict[str, str | int]] = {
+    "default": {},
+    # cron 수집 위주: 커밋마다 fsync 하지 않고 WAL 체크포인트를 드물게
+    "ingest-heavy": {"journal_mode": "WAL", "synchronous": "NORMAL", "cache_size": -65536, "mmap_size": 268435456,
+        "temp_store": "MEMORY", "busy_timeout": 30000, "wal_autocheckpoint": 10000},
+    # 대시보드 조회 위주: 큰 페이지 캐시 + mmap 으로 읽기 지연 최소화
+    "read-mostly": {"journal_mode": "WAL", "synchronous": "NORMAL", "cache_size": -131072, "mmap_size": 1073741824,
+        "temp_store": "MEMORY", "busy_timeout": 5000},
+}
 
 
 @event.listens_for(Engine, "connect")
@@ -16,8 +31,21 @@ def set_sqlite_pragma(dbapi_connection, connection_record):
     cursor.close()
 
 
+def apply_storage_profile(dbapi_connection, profile: str, read_only: bool = False) -> None:
+    cursor = dbapi_connection.cursor()
+    for pragma, value in STORAGE_PROFILES[profile].items():
+        if read_only and pragma == "journal_mode":
+            continue  # 읽기 전용 연결은 저널 모드를 바꿀 수 없다
+        cursor.execute(f"PRAGMA {pragma}={value}")
+    if read_only:
+        cursor.execute("PRAGMA query_only=ON")
+    cursor.close()
+
+
 _engine = None
 _SessionLocal = None
+_ro_engine = None
+_ro_SessionLocal = None
 
 
 def get_db_path() -> Path:
@@ -26,23 +54,45 @@ def get_db_path() -> Path:
     return path
 
 
-def get_engine() -> Engine:
-    global _engine
+def _create_engine(read_only: bool) -> Engine:
+    if read_only:
+        url = f"sqlite:///file:{get_db_path().resolve()}?mode=ro&uri=true"
+    else:
+        url = f"sqlite:///{get_db_path()}"
+    profile = settings.sqlite_profile
+    if profile not in STORAGE_PROFILES:  # 연결 시점의 KeyError 대신 엔진을 만들 때 바로 알린다
+        raise ValueError(f"Unknown SQLITE_PROFILE {profile!r} (use one of: {', '.join(STORAGE_PROFILES)})")
+    engine = create_engine(url, connect_args={"check_same_thread": False})
+    event.listen(engine, "connect", lambda conn, record: apply_storage_profile(conn, profile, read_only))
+    return engine
+
+
+def get_engine(read_only: bool = False) -> Engine:
+    """read_only=True 면 mode=ro 로 연 별도 엔진 (대시보드 조회용, 수집 쓰기와 락을 다투지 않음)."""
+    global _engine, _ro_engine
+    if read_only:
+        if _ro_engine is None:
+            _ro_engine = _create_engine(read_only=True)
+        return _ro_engine
     if _engine is None:
-        _engine = create_engine(f"sqlite:///{get_db_path()}", connect_args={"check_same_thread": False})
+        _engine = _create_engine(read_only=False)
     return _engine
 
 
-def get_session_factory() -> sessionmaker:
-    global _SessionLocal
+def get_session_factory(read_only: bool = False) -> sessionmaker:
+    global _SessionLocal, _ro_SessionLocal
+    if read_only:
+        if _ro_SessionLocal is None:
+            _ro_SessionLocal = sessionmaker(bind=get_engine(read_only=True), autoflush=False, autocommit=False)
+        return _ro_SessionLocal
     if _SessionLocal is None:
         _SessionLocal = sessionmaker(bind=get_engine(), autoflush=False, autocommit=False)
     return _SessionLocal
 
 
 @contextmanager
-def get_session() -> Generator[Session, None, None]:
-    session = get_session_factory()()
+def get_session(read_only: bool = False) -> Generator[Session, None, None]:
+    session = get_session_factory(read_only)()
     try:
         yield session
         session.commit()
@@ -54,13 +104,30 @@ def get_session() -> Generator[Session, None, None]:
 
 
 def init_db(force: bool = False) -> None:
-    global _engine, _SessionLocal
+    global _engine, _SessionLocal, _ro_engine, _ro_SessionLocal
     db_path = get_db_path()
     if force and db_path.exists():
         db_path.unlink()
-        _engine = None
-        _SessionLocal = None
+        _engine = _SessionLocal = _ro_engine = _ro_SessionLocal = None
+    from linkedin_intel.payload import clear_dictionary_cache  # payload 가 models 를 import 하므로 여기서
+    clear_dictionary_cache()
     Base.metadata.create_all(get_engine())
+    run_migrations(get_engine())
+
+
+def backup_db(dest: Path) -> Path:
+    """sqlite3 backup API 로 온라인 백업. WAL 에만 있는 커밋까지 일관된 스냅샷으로 복사한다 (파일 cp 는 -wal 을 빠뜨린다)."""
+    dest = Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    source = sqlite3.connect(get_db_path(), timeout=30)
+    target = sqlite3.connect(dest)
+    try:
+        with target:
+            source.backup(target)
+    finally:
+        target.close()
+        source.close()
+    return dest
 
 
 def seed_data() -> None:
@@ -71,3 +138,8 @@ def seed_data() -> None:
         for t in SEED_TAGS:
             if not session.query(Tag).filter(Tag.name == t["name"]).first():
                 session.add(Tag(**t))
+        session.flush()
+        for name, rules in SEED_TAG_RULES.items():
+            tag = session.query(Tag).filter(Tag.name == name).one()
+            known = {(rule.kind.value, rule.pattern) for rule in tag.rules}
+            tag.rules.extend(TagRule(kind=TagRuleKind(kind), pattern=pattern) for kind, pattern in rules if (kind, pattern) not in known)
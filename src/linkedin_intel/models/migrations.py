@@ -0,0 +1,159 @@
+"""스키마 마이그레이션 (PRAGMA user_version 기반).
+
+create_all 은 새 테이블만 만들기 때문에, 기존 DB 의 테이블 변경/백필은 여기에 순서대로 추가한다.
+각 마이그레이션은 빈 DB(새로 만든 DB)에서도 그대로 실행되므로 멱등하게 작성한다.
+"""
+from typing import Callable
+from sqlalchemy.engine import Connection, Engine
+
+MIGRATIONS: list[Callable[[Connection], None]] = []
+
+
+def migration(fn: Callable[[Connection], None] | None = None, *, foreign_keys: bool = True):
+    """foreign_keys=False: 테이블 재생성처럼 DROP TABLE 이 ON DELETE 연쇄 동작을 일으키면 안 되는 경우 (끝나고 foreign_key_check)."""
+    def register(fn: Callable[[Connection], None]) -> Callable[[Connection], None]:
+        fn.foreign_keys = foreign_keys
+        MIGRATIONS.append(fn)
+        return fn
+    return register(fn) if fn else register
+
+
+@migration
+def backfill_item_rollups(conn: Connection) -> None:
+    from linkedin_intel.rollup import rebuild_rollups
+    rebuild_rollups(conn)
+
+
+@migration
+def create_items_fts(conn: Connection) -> None:
+    from linkedin_intel.search import create_search_index
+    create_search_index(conn)
+
+
+@migration
+def add_access_path_indexes(conn: Connection) -> None:
+    """대시보드/CLI 조회 패턴용 복합·커버링 인덱스. 이후 모델이 바뀌어도 이 시점 DDL 그대로 실행되도록 직접 적는다."""
+    conn.exec_driver_sql("DROP INDEX IF EXISTS idx_items_channel")  # idx_items_channel_collected 가 대신함
+    for ddl in (
+        "CREATE INDEX IF NOT EXISTS idx_items_channel_collected ON items (channel, collected_at)",
+        "CREATE INDEX IF NOT EXISTS idx_items_query_collected ON items (query_id, collected_at)",
+        "CREATE INDEX IF NOT EXISTS idx_items_query_channel_collected ON items (query_id, channel, collected_at)",
+        "CREATE INDEX IF NOT EXISTS idx_runs_ended_at ON runs (ended_at)",
+        "CREATE INDEX IF NOT EXISTS idx_runs_query_started ON runs (query_id, started_at)",
+        "CREATE INDEX IF NOT EXISTS idx_runs_source_started ON runs (source_id, started_at)",
+        "CREATE INDEX IF NOT EXISTS idx_item_rollups_day_channel ON item_rollups (day, channel, query_id, new_count, seen_count)",
+        "CREATE INDEX IF NOT EXISTS idx_item_rollups_channel_day ON item_rollups (channel, day, query_id, new_count, seen_count)",
+        "CREATE INDEX IF NOT EXISTS idx_item_rollups_query_day ON item_rollups (query_id, day, channel, new_count, seen_count)",
+    ):
+        conn.exec_driver_sql(ddl)
+    from linkedin_intel.search import create_search_index
+    create_search_index(conn, rebuild=False)  # 가중 bm25 를 FTS5 rank 로 등록 (ORDER BY rank 정렬을 FTS 가 처리)
+
+
+# url_key 도입 시점의 items 정의 (이후 모델이 바뀌어도 이 마이그레이션은 이 형태로 재생성한다)
+ITEMS_V4_COLUMNS = ("id, url, canonical_url, title, snippet, author, published_at, collected_at, last_seen_at, "
+    "source_id, query_id, channel, raw_json")
+ITEMS_V4_DDL = """CREATE TABLE items_v4 (
+    id INTEGER NOT NULL, url VARCHAR(2048) NOT NULL, canonical_url VARCHAR(2048) NOT NULL, url_key BIGINT NOT NULL,
+    title VARCHAR(500), snippet TEXT, author VARCHAR(255), published_at DATETIME, collected_at DATETIME NOT NULL,
+    last_seen_at DATETIME NOT NULL, source_id INTEGER, query_id INTEGER, channel VARCHAR(50) NOT NULL, raw_json TEXT,
+    PRIMARY KEY (id),
+    FOREIGN KEY(source_id) REFERENCES sources (id) ON DELETE SET NULL,
+    FOREIGN KEY(query_id) REFERENCES queries (id) ON DELETE SET NULL)"""
+ITEMS_V4_INDEXES = (
+    "CREATE INDEX idx_items_url_key ON items (url_key)",
+    "CREATE INDEX idx_items_collected_at ON items (collected_at)",
+    "CREATE INDEX idx_items_channel_collected ON items (channel, collected_at)",
+    "CREATE INDEX idx_items_query_collected ON items (query_id, collected_at)",
+    "CREATE INDEX idx_items_query_channel_collected ON items (query_id, channel, collected_at)",
+)
+
+
+@migration(foreign_keys=False)
+def key_items_by_url_hash(conn: Connection) -> None:
+    """canonical_url UNIQUE(2048자 문자열 인덱스)를 8바이트 url_key 인덱스로 교체. UNIQUE 제거는 테이블 재생성이 필요하다."""
+    from linkedin_intel.search import create_search_index
+    from linkedin_intel.utils import url_key
+    columns = {row[1] for row in conn.exec_driver_sql("PRAGMA table_info(items)")}
+    unique = any(row[3] == "u" for row in conn.exec_driver_sql("PRAGMA index_list(items)"))
+    if "url_key" in columns and not unique:
+        return  # 현재 모델로 새로 만든 DB
+    conn.connection.driver_connection.create_function("url_key", 1, url_key, deterministic=True)
+    conn.exec_driver_sql(ITEMS_V4_DDL)
+    conn.exec_driver_sql(f"INSERT INTO items_v4 ({ITEMS_V4_COLUMNS}, url_key) "
+        f"SELECT {ITEMS_V4_COLUMNS}, url_key(canonical_url) FROM items")
+    conn.exec_driver_sql("DROP TABLE items")  # 인덱스/FTS 트리거도 같이 삭제됨
+    conn.exec_driver_sql("ALTER TABLE items_v4 RENAME TO items")
+    for ddl in ITEMS_V4_INDEXES:
+        conn.exec_driver_sql(ddl)
+    create_search_index(conn, rebuild=False)  # id 를 그대로 옮겼으므로 색인 내용은 유효, 트리거만 다시 만든다
+
+
+@migration
+def add_schedule_intervals(conn: Connection) -> None:
+    """쿼리/소스별 수집 주기(분). NULL 이면 geo scheduler 가 채널 기본값(SCHEDULER_*_INTERVAL_MINUTES)을 쓴다."""
+    for table in ("queries", "sources"):
+        if "interval_minutes" not in {row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({table})")}:
+            conn.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN interval_minutes INTEGER")
+
+
+@migration
+def add_run_stats(conn: Connection) -> None:
+    if "stats_json" not in {row[1] for row in conn.exec_driver_sql("PRAGMA table_info(runs)")}:
+        conn.exec_driver_sql("ALTER TABLE runs ADD COLUMN stats_json TEXT")
+
+
+@migration
+def add_api_quota(conn: Connection) -> None:
+    conn.exec_driver_sql("""CREATE TABLE IF NOT EXISTS api_quota (
+        day DATE NOT NULL, api VARCHAR(50) NOT NULL, requests INTEGER NOT NULL, cache_hits INTEGER NOT NULL, PRIMARY KEY (day, api))""")
+
+
+@migration
+def add_near_duplicate_clusters(conn: Connection) -> None:
+    """유사 게시물 묶음 컬럼과 MinHash 서명 / LSH 밴드 색인. 기존 항목의 서명은 geo neardup --rebuild 로 채운다."""
+    if "cluster_id" not in {row[1] for row in conn.exec_driver_sql("PRAGMA table_info(items)")}:
+        conn.exec_driver_sql("ALTER TABLE items ADD COLUMN cluster_id INTEGER")
+    conn.exec_driver_sql("CREATE INDEX IF NOT EXISTS idx_items_cluster ON items (cluster_id)")
+    conn.exec_driver_sql("""CREATE TABLE IF NOT EXISTS item_signatures (
+        item_id INTEGER NOT NULL, minhash BLOB NOT NULL, PRIMARY KEY (item_id),
+        FOREIGN KEY(item_id) REFERENCES items (id) ON DELETE CASCADE)""")
+    conn.exec_driver_sql("""CREATE TABLE IF NOT EXISTS item_lsh_bands (
+        band_key BIGINT NOT NULL, item_id INTEGER NOT NULL, PRIMARY KEY (band_key, item_id),
+        FOREIGN KEY(item_id) REFERENCES items (id) ON DELETE CASCADE) WITHOUT ROWID""")
+
+
+@migration
+def add_tag_rules(conn: Connection) -> None:
+    """자동 태깅 규칙. 기존 항목에는 geo retag 로 적용한다."""
+    conn.exec_driver_sql("""CREATE TABLE IF NOT EXISTS tag_rules (
+        id INTEGER NOT NULL, tag_id INTEGER NOT NULL, kind VARCHAR(7) NOT NULL, pattern VARCHAR(500) NOT NULL, created_at DATETIME NOT NULL,
+        PRIMARY KEY (id), CONSTRAINT uq_tag_rule UNIQUE (tag_id, kind, pattern),
+        FOREIGN KEY(tag_id) REFERENCES tags (id) ON DELETE CASCADE)""")
+
+
+def run_migrations(engine: Engine) -> int:
+    """적용 안 된 마이그레이션을 하나씩 자체 트랜잭션으로 실행하고 최종 user_version 을 반환."""
+    with engine.connect() as conn:
+        version = conn.exec_driver_sql("PRAGMA user_version").scalar()
+        conn.commit()
+        for number, fn in enumerate(MIGRATIONS[version:], start=version + 1):
+            foreign_keys = getattr(fn, "foreign_keys", True)
+            if not foreign_keys:
+                conn.exec_driver_sql("PRAGMA foreign_keys=OFF")  # 트랜잭션 밖에서만 적용된다
+            # pysqlite 는 DDL 앞에 BEGIN 을 붙이지 않으므로 명시해야 테이블 재생성까지 원자적으로 적용된다
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+            try:
+                fn(conn)
+                if not foreign_keys and conn.exec_driver_sql("PRAGMA foreign_key_check").first():
+                    raise RuntimeError(f"Migration {number} ({fn.__name__}) left foreign key violations")
+                conn.exec_driver_sql(f"PRAGMA user_version={number}")
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            finally:
+                if not foreign_keys:
+                    conn.exec_driver_sql("PRAGMA foreign_keys=ON")
+                    conn.commit()
+    return len(MIGRATIONS)
@@ -1,8 +1,9 @@
 """SQLAlchemy ORM 모델."""
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
 from typing import Optional
-from sqlalchemy import Column, DateTime, Enum as SQLEnum, ForeignKey, Index, Integer, String, Table, Text, UniqueConstraint
+from sqlalchemy import (BigInteger, Column, Date, DateTime, Enum as SQLEnum, ForeignKey, Index, Integer, LargeBinary, String, Table, Text,
+    UniqueConstraint)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -19,6 +20,11 @@ class SourceType(str, Enum):
     SALESNAV = "salesnav"
 
 
+class TagRuleKind(str, Enum):
+    KEYWORD = "keyword"
+    REGEX = "regex"
+
+
 class RunStatus(str, Enum):
     RUNNING = "running"
     COMPLETED = "completed"
@@ -37,6 +43,7 @@ class Query(Base):
     query_string: Mapped[str] = mapped_column(Text, nullable=False)
     language: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
     region: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    interval_minutes: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)  # geo scheduler 수집 주기, NULL 이면 채널 기본값
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     runs: Mapped[list["Run"]] = relationship(back_populates="query", cascade="all, delete-orphan")
     items: Mapped[list["Item"]] = relationship(back_populates="query")
@@ -48,6 +55,7 @@ class Source(Base):
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     type: Mapped[SourceType] = mapped_column(SQLEnum(SourceType, values_callable=lambda x: [e.value for e in x]), nullable=False)
     config_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    interval_minutes: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     runs: Mapped[list["Run"]] = relationship(back_populates="source", cascade="all, delete-orphan")
     items: Mapped[list["Item"]] = relationship(back_populates="source")
     __table_args__ = (UniqueConstraint("name", "type", name="uq_source_name_type"),)
@@ -63,16 +71,19 @@ class Run(Base):
     status: Mapped[RunStatus] = mapped_column(SQLEnum(RunStatus, values_callable=lambda x: [e.value for e in x]), default=RunStatus.RUNNING)
     records_fetched: Mapped[int] = mapped_column(Integer, default=0)
     error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    stats_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # 단계별 시간/바이트/RSS (metrics.RunStats)
     source: Mapped[Optional["Source"]] = relationship(back_populates="runs")
     query: Mapped[Optional["Query"]] = relationship(back_populates="runs")
-    __table_args__ = (Index("idx_runs_started_at", "started_at"),)
+    __table_args__ = (Index("idx_runs_started_at", "started_at"), Index("idx_runs_ended_at", "ended_at"),
+        Index("idx_runs_query_started", "query_id", "started_at"), Index("idx_runs_source_started", "source_id", "started_at"))
 
 
 class Item(Base):
     __tablename__ = "items"
     id: Mapped[int] = mapped_column(primary_key=True)
     url: Mapped[str] = mapped_column(String(2048), nullable=False)
-    canonical_url: Mapped[str] = mapped_column(String(2048), nullable=False, unique=True)
+    canonical_url: Mapped[str] = mapped_column(String(2048), nullable=False)
+    url_key: Mapped[int] = mapped_column(BigInteger, nullable=False)  # utils.url_key(canonical_url), dedup 은 이 키로 조회
     title: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     snippet: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     author: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
@@ -82,11 +93,14 @@ class Item(Base):
     source_id: Mapped[Optional[int]] = mapped_column(ForeignKey("sources.id", ondelete="SET NULL"), nullable=True)
     query_id: Mapped[Optional[int]] = mapped_column(ForeignKey("queries.id", ondelete="SET NULL"), nullable=True)
     channel: Mapped[str] = mapped_column(String(50), nullable=False)
-    raw_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    cluster_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)  # 유사 게시물 묶음 대표의 id (대표 / 묶이지 않은 항목은 NULL)
     source: Mapped[Optional["Source"]] = relationship(back_populates="items")
     query: Mapped[Optional["Query"]] = relationship(back_populates="items")
     tags: Mapped[list["Tag"]] = relationship(secondary=item_tags, back_populates="items")
-    __table_args__ = (Index("idx_items_channel", "channel"), Index("idx_items_collected_at", "collected_at"))
+    # 대시보드 필터 조합(쿼리/채널/둘 다/없음)마다 collected_at 역순 정렬을 인덱스로 처리
+    __table_args__ = (Index("idx_items_url_key", "url_key"), Index("idx_items_collected_at", "collected_at"),
+        Index("idx_items_channel_collected", "channel", "collected_at"), Index("idx_items_query_collected", "query_id", "collected_at"),
+        Index("idx_items_query_channel_collected", "query_id", "channel", "collected_at"), Index("idx_items_cluster", "cluster_id"))
 
 
 class Tag(Base):
@@ -94,6 +108,87 @@ class Tag(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
     items: Mapped[list["Item"]] = relationship(secondary=item_tags, back_populates="tags")
+    rules: Mapped[list["TagRule"]] = relationship(back_populates="tag", cascade="all, delete-orphan")
+
+
+class TagRule(Base):
+    """자동 태깅 규칙. 수집 시 제목+스니펫에 적용해 item_tags 를 채운다 (tagging.Tagger, 변경 후 geo retag)."""
+    __tablename__ = "tag_rules"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    tag_id: Mapped[int] = mapped_column(ForeignKey("tags.id", ondelete="CASCADE"), nullable=False)
+    kind: Mapped[TagRuleKind] = mapped_column(SQLEnum(TagRuleKind, values_callable=lambda x: [e.value for e in x]), nullable=False)
+    pattern: Mapped[str] = mapped_column(String(500), nullable=False)  # keyword: 단어(열), 대소문자 무시 / regex: re.IGNORECASE
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    tag: Mapped["Tag"] = relationship(back_populates="rules")
+    __table_args__ = (UniqueConstraint("tag_id", "kind", "pattern", name="uq_tag_rule"),)
+
+
+class ItemRollup(Base):
+    """일자별 수집 집계. ingest 트랜잭션 안에서 증분 갱신 (query_id/source_id 없음은 0)."""
+    __tablename__ = "item_rollups"
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    query_id: Mapped[int] = mapped_column(Integer, primary_key=True, default=0)
+    channel: Mapped[str] = mapped_column(String(50), primary_key=True)
+    source_id: Mapped[int] = mapped_column(Integer, primary_key=True, default=0)
+    new_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    seen_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # 합계/시계열 조회가 테이블을 읽지 않도록 카운트까지 포함한 커버링 인덱스 (필터 조합별로 day, channel 순서 유지)
+    __table_args__ = (Index("idx_item_rollups_day_channel", "day", "channel", "query_id", "new_count", "seen_count"),
+        Index("idx_item_rollups_channel_day", "channel", "day", "query_id", "new_count", "seen_count"),
+        Index("idx_item_rollups_query_day", "query_id", "day", "channel", "new_count", "seen_count"))
+
+
+class ApiQuota(Base):
+    """외부 API 일별 사용량 장부. 프로세스/크론 작업이 같은 행을 원자적으로 올려 한도를 공유한다 (quota.reserve)."""
+    __tablename__ = "api_quota"
+    day: Mapped[date] = mapped_column(Date, primary_key=True)  # 할당량이 리셋되는 시간대 기준 날짜 (CSE: 태평양 시간)
+    api: Mapped[str] = mapped_column(String(50), primary_key=True)
+    requests: Mapped[int] = mapped_column(Integer, default=0, nullable=False)  # 네트워크로 보낸 요청 (재시도 포함)
+    cache_hits: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
+class ProcessedFile(Base):
+    """이미 수집한 입력 파일 매니페스트 (증분 수집용)."""
+    __tablename__ = "processed_files"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    path: Mapped[str] = mapped_column(String(1024), nullable=False, unique=True)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    mtime_ns: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    items_found: Mapped[int] = mapped_column(Integer, default=0)
+    processed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class PayloadDict(Base):
+    """item_payloads 압축용 zlib preset 사전. 'geo compact' 가 학습하며 만든 뒤에는 바꾸지 않는다."""
+    __tablename__ = "payload_dicts"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    sample_count: Mapped[int] = mapped_column(Integer, default=0)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class ItemPayload(Base):
+    """Item 원본 payload(raw) 압축본. items 조회에 끌려오지 않도록 분리하고, 요청할 때만 푼다 (payload.load_payload)."""
+    __tablename__ = "item_payloads"
+    item_id: Mapped[int] = mapped_column(ForeignKey("items.id", ondelete="CASCADE"), primary_key=True)
+    dict_id: Mapped[Optional[int]] = mapped_column(ForeignKey("payload_dicts.id"), nullable=True)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+
+class ItemSignature(Base):
+    """제목+스니펫 MinHash 서명 (neardup.minhash). 유사 후보를 확인할 때만 읽으므로 items 와 분리."""
+    __tablename__ = "item_signatures"
+    item_id: Mapped[int] = mapped_column(ForeignKey("items.id", ondelete="CASCADE"), primary_key=True)
+    minhash: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+
+class ItemLshBand(Base):
+    """MinHash LSH 색인: 밴드 해시마다 항목. 밴드 해시가 같은 항목만 유사 후보로 비교한다 (neardup.assign_clusters)."""
+    __tablename__ = "item_lsh_bands"
+    band_key: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    item_id: Mapped[int] = mapped_column(ForeignKey("items.id", ondelete="CASCADE"), primary_key=True)
+    __table_args__ = {"sqlite_with_rowid": False}
 
 
 SEED_QUERIES = [
@@ -105,3 +200,15 @@ SEED_QUERIES = [
 ]
 
 SEED_TAGS = [{"name": "important"}, {"name": "competitor"}, {"name": "technology"}, {"name": "market"}, {"name": "partnership"}]
+
+# 태그 이름 -> [(종류, 패턴)]. important 는 수동 태그라 규칙이 없다
+SEED_TAG_RULES = {
+    "competitor": [("keyword", k) for k in ("Bosch", "Continental", "Harman", "Visteon", "Aptiv", "Denso", "Hyundai Mobis", "Valeo",
+        "Magna", "ZF", "Panasonic Automotive", "Mobileye", "Qualcomm Snapdragon Digital Chassis")],
+    "technology": [("keyword", k) for k in ("ADAS", "SDV", "software defined vehicle", "software-defined vehicle", "digital cockpit",
+        "infotainment", "IVI", "HMI", "OTA", "over the air", "autonomous driving", "lidar", "zonal architecture", "AUTOSAR")],
+    "market": [("keyword", k) for k in ("market share", "CAGR", "forecast", "revenue", "market size")]
+        + [("regex", r"\$\s?\d+(\.\d+)?\s?(billion|million|bn)\b")],
+    "partnership": [("keyword", k) for k in ("partnership", "collaboration", "MOU", "joint venture", "teams up", "strategic alliance")]
+        + [("regex", r"\bpartner(s|ed|ing)? with\b")],
+}
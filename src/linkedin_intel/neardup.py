@@ -0,0 +1,179 @@
+"""유사 게시물(near-duplicate) 묶기: 제목+스니펫 MinHash 서명과 LSH 밴드 색인.
+
+같은 게시물이 CSE / RSS / 이메일 / CSV 로 URL·제목이 조금씩 다르게 들어오므로 URL dedup 과 별개로 묶는다.
+단어 3-gram 집합의 MinHash(32개)를 item_signatures 에, 4개씩 묶은 8 밴드의 해시를 item_lsh_bands 에 (묶음 대표만) 넣는다.
+(2-gram 은 템플릿처럼 비슷한 문구를 쓰는 서로 다른 글끼리도 밴드가 자주 겹쳐 후보가 items 에 비례해 늘었다.)
+밴드 해시가 하나라도 같은 항목만 후보로 읽으므로 버킷에는 실제로 겹치는 글만 모이고, items 가 커져도 후보 수는 거의 그대로다.
+후보는 서명으로 추정한 Jaccard 가 NEARDUP_THRESHOLD 이상이면 묶는다 (0.7 에서 약 90%, 0.8 이상은 거의 모두 후보가 된다).
+묶음 id(Item.cluster_id)는 먼저 들어온 대표 항목의 id 이고, 대표 자신과 묶이지 않은 항목은 NULL.
+"""
+import hashlib
+import random
+import re
+import struct
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Iterable
+from sqlalchemy import bindparam, delete, func, insert, select, update
+from linkedin_intel.config import settings
+from linkedin_intel.models import get_session, Item, ItemLshBand, ItemSignature
+
+NUM_PERM = 32
+BANDS = 8
+ROWS = NUM_PERM // BANDS
+MIN_TOKENS = 6  # 이보다 짧은 글은 우연히 겹치기 쉬워 묶지 않는다
+REBUILD_BATCH = 5000
+MAX_BUCKET = 8  # 밴드 값 하나에 색인할 대표 수 상한
+KEY_CHUNK = 10000  # IN 목록 한 번에 (SQLite 바인드 변수 한도 아래로)
+_MASK = (1 << 64) - 1
+_PACK = struct.Struct(f"<{NUM_PERM}I")
+_BAND_BITS = ROWS * 32
+_LANE_LOW = int.from_bytes(b"\x01\x00\x00\x00" * NUM_PERM, "little")  # 32비트 자리마다 최하위 비트
+_TOKEN = re.compile(r"\w+")
+# 순열 h(x) = (a*x + b) mod 2^64 의 상위 32비트. 서명이 DB 에 남으므로 시드를 바꾸면 rebuild 해야 한다
+_rng = random.Random(20260101)
+_PERMS = [(_rng.getrandbits(64) | 1, _rng.getrandbits(64)) for _ in range(NUM_PERM)]
+
+
+@lru_cache(maxsize=1 << 16)
+def _feature_minhashes(feature: str) -> tuple[int, ...]:
+    x = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+    return tuple(((a * x + b) & _MASK) >> 32 for a, b in _PERMS)
+
+
+def minhash(title: str | None, snippet: str | None) -> bytes | None:
+    """제목+스니펫의 MinHash 서명 (NUM_PERM 개 uint32, 128바이트). 너무 짧으면 None."""
+    tokens = _TOKEN.findall(f"{title or ''} {snippet or ''}".lower())
+    if len(tokens) < MIN_TOKENS:
+        return None
+    shingles = {*zip(tokens, tokens[1:], tokens[2:], strict=False)}  # 겹치는 단어 3-gram (끝의 모자란 조각은 버린다)
+    return _PACK.pack(*map(min, zip(*(_feature_minhashes(" ".join(shingle)) for shingle in shingles), strict=True)))
+
+
+def _matches(a: int, b: int) -> int:
+    """서명(정수로 읽은 값)에서 같은 자리 수. XOR 의 32비트 자리 안을 아래로 접어 0 이 아닌 자리를 센다."""
+    x = a ^ b
+    x |= x >> 1
+    x |= x >> 2
+    x |= x >> 4
+    x |= x >> 8
+    x |= x >> 16
+    return NUM_PERM - (x & _LANE_LOW).bit_count()
+
+
+def similarity(a: bytes, b: bytes) -> float:
+    """서명이 같은 자리 비율 = Jaccard 추정치."""
+    return _matches(int.from_bytes(a, "little"), int.from_bytes(b, "little")) / NUM_PERM
+
+
+def band_keys(signature: bytes) -> list[int]:
+    """밴드마다 ROWS 개 값(128비트)을 64비트로 접고 밴드 번호를 섞은 값 (item_lsh_bands.band_key, 부호 있는 값).
+
+    MinHash 값 자체가 고르게 퍼져 있어 다시 해시하지 않는다."""
+    value = int.from_bytes(signature, "little")
+    keys = []
+    for band in range(BANDS):
+        chunk = value >> (band * _BAND_BITS)
+        key = (chunk ^ (chunk >> 64) ^ band) & _MASK
+        keys.append(key - (1 << 64) if key >> 63 else key)
+    return keys
+
+
+def _set_by_id(session, column: str, values: list[tuple[int, int | None]]) -> None:
+    """id 별로 한 컬럼만 갱신 (executemany). last_seen_at 의 onupdate 가 붙지 않도록 그대로 둔다."""
+    stmt = update(Item).where(Item.id == bindparam("_id")).values({column: bindparam("_value"), "last_seen_at": Item.last_seen_at})
+    session.connection().execute(stmt, [{"_id": item_id, "_value": value} for item_id, value in values])
+
+
+def assign_clusters(session, items: list[tuple[int, bytes]], threshold: float | None = None) -> int:
+    """새 항목 (id, 서명) 들을 id 순서로 기존 대표·앞선 새 항목과 비교해 cluster_id 를 정하고 서명/밴드 색인을 저장한다.
+
+    밴드 색인에는 묶음 대표만 넣고, 이미 MAX_BUCKET 개가 찬 밴드 값에는 더 넣지 않는다. 같은 문구가 반복되는 글이
+    몰려 들어와도 후보 수가 BANDS * MAX_BUCKET 을 넘지 않는다. ingest 와 같은 트랜잭션에서 INSERT 직후 호출. 묶인 항목 수를 반환.
+    """
+    threshold = settings.neardup_threshold if threshold is None else threshold
+    if not items:
+        return 0
+    item_keys = {item_id: band_keys(signature) for item_id, signature in items}
+    buckets: dict[int, dict[int, tuple[int, int]]] = defaultdict(dict)  # band_key -> {대표 id: (서명 정수, 묶음)}
+    keys = list({key for keys in item_keys.values() for key in keys})
+    lookup = select(ItemLshBand.band_key, ItemLshBand.item_id, ItemSignature.minhash, func.coalesce(Item.cluster_id, Item.id)) \
+        .join(ItemSignature, ItemSignature.item_id == ItemLshBand.item_id).join(Item, Item.id == ItemLshBand.item_id)
+    for start in range(0, len(keys), KEY_CHUNK):
+        for key, item_id, signature, cluster in session.execute(lookup.where(ItemLshBand.band_key.in_(keys[start:start + KEY_CHUNK]))):
+            buckets[key][item_id] = (int.from_bytes(signature, "little"), cluster)
+    clusters: dict[int, int] = {}
+    bands = []
+    for item_id, signature in sorted(items):
+        value = int.from_bytes(signature, "little")
+        candidates = {other_id: entry for key in item_keys[item_id] for other_id, entry in buckets.get(key, {}).items()}
+        matches = [cluster for other, cluster in candidates.values() if _matches(value, other) >= threshold * NUM_PERM]
+        if matches:
+            clusters[item_id] = min(matches)
+            continue
+        for key in set(item_keys[item_id]):
+            if len(buckets[key]) < MAX_BUCKET:
+                buckets[key][item_id] = (value, item_id)
+                bands.append({"band_key": key, "item_id": item_id})
+    # 좁은 행을 많이 넣으므로 ORM bulk 대신 Core executemany
+    connection = session.connection()
+    connection.execute(insert(ItemSignature), [{"item_id": item_id, "minhash": signature} for item_id, signature in items])
+    if bands:
+        connection.execute(insert(ItemLshBand), bands)
+    if clusters:
+        _set_by_id(session, "cluster_id", list(clusters.items()))
+    return len(clusters)
+
+
+@dataclass(frozen=True)
+class ClusterStats:
+    signed: int  # 서명이 있는 항목
+    clusters: int  # 2건 이상인 묶음
+    clustered: int  # 대표가 아닌 묶음 구성원
+
+
+def cluster_stats(session) -> ClusterStats:
+    return ClusterStats(signed=session.scalar(select(func.count()).select_from(ItemSignature)),
+        clusters=session.scalar(select(func.count(func.distinct(Item.cluster_id)))),
+        clustered=session.scalar(select(func.count()).select_from(Item).where(Item.cluster_id.is_not(None))))
+
+
+def cluster_sizes(session, ids: Iterable[int]) -> dict[int, int]:
+    """대표 id -> 묶음 크기 (대표 포함). 묶인 것이 없으면 빠진다."""
+    ids = list(ids)
+    if not ids:
+        return {}
+    rows = session.execute(select(Item.cluster_id, func.count()).where(Item.cluster_id.in_(ids)).group_by(Item.cluster_id))
+    return {cluster: count + 1 for cluster, count in rows}
+
+
+def top_clusters(session, limit: int = 10) -> list[tuple[int, int, str | None]]:
+    """크기순 묶음 (대표 id, 크기, 대표 제목)."""
+    size = func.count() + 1
+    rows = session.execute(select(Item.cluster_id, size).where(Item.cluster_id.is_not(None)).group_by(Item.cluster_id)
+        .order_by(size.desc(), Item.cluster_id).limit(limit)).all()
+    titles = dict(session.execute(select(Item.id, Item.title).where(Item.id.in_([cluster for cluster, _ in rows]))).all())
+    return [(cluster, count, titles.get(cluster)) for cluster, count in rows]
+
+
+def rebuild_clusters(batch_size: int = REBUILD_BATCH, on_batch: Callable[[int], None] | None = None) -> ClusterStats:
+    """전체 항목의 서명과 묶음을 id 순으로 다시 계산 (기존 DB / 임계값 변경 후). 배치마다 커밋해 메모리가 일정하다."""
+    with get_session() as session:
+        session.execute(delete(ItemLshBand))
+        session.execute(delete(ItemSignature))
+        session.execute(update(Item).where(Item.cluster_id.is_not(None)).values(cluster_id=None, last_seen_at=Item.last_seen_at)
+            .execution_options(synchronize_session=False))
+    last_id = done = 0
+    while True:
+        with get_session() as session:
+            rows = session.execute(select(Item.id, Item.title, Item.snippet).where(Item.id > last_id).order_by(Item.id).limit(batch_size)).all()
+            if not rows:
+                break
+            signatures = [(item_id, minhash(title, snippet)) for item_id, title, snippet in rows]
+            assign_clusters(session, [(item_id, signature) for item_id, signature in signatures if signature is not None])
+        last_id, done = rows[-1][0], done + len(rows)
+        if on_batch:
+            on_batch(done)
+    with get_session() as session:
+        return cluster_stats(session)
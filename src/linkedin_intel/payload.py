@@ -0,0 +1,156 @@
+"""항목 원본 payload(raw) 압축 저장: item_payloads 사이드 테이블, zlib + 학습한 preset 사전.
+
+목록/대시보드 조회는 items 만 읽고, payload 는 load_payload(s) 로 요청할 때만 푼다.
+"""
+import json
+import logging
+import os
+import re
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Iterable
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.engine import Engine
+from linkedin_intel.models import ItemPayload, PayloadDict
+
+logger = logging.getLogger(__name__)
+
+DICT_SIZE = 32 * 1024  # zlib 창 크기. 이보다 긴 사전은 앞부분이 쓰이지 않는다
+LEVEL = 6
+# JSON 조각: "키": / "값", 단위 (긴 값은 반복될 가능성이 낮아 제외)
+_FRAGMENT = re.compile(rb'[{\[]?"(?:[^"\\]|\\.){1,120}"[:,]?')
+
+_dictionaries: dict[tuple[str, int], bytes] = {}  # 사전은 만든 뒤 바뀌지 않으므로 (DB, id) 단위로 캐시
+
+
+@dataclass
+class CompactResult:
+    converted: int = 0
+    recompressed: int = 0
+    dict_id: int | None = None
+    bytes_before: int = 0
+    bytes_after: int = 0
+
+
+def dumps(raw: dict[str, Any]) -> bytes:
+    return json.dumps(raw, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def encode(raw: dict[str, Any] | bytes, zdict: bytes | None = None) -> bytes:
+    data = raw if isinstance(raw, bytes) else dumps(raw)
+    compressor = zlib.compressobj(LEVEL, zdict=zdict) if zdict else zlib.compressobj(LEVEL)
+    return compressor.compress(data) + compressor.flush()
+
+
+def decode(data: bytes, zdict: bytes | None = None) -> dict[str, Any]:
+    decompressor = zlib.decompressobj(zdict=zdict) if zdict else zlib.decompressobj()
+    return json.loads(decompressor.decompress(data) + decompressor.flush())
+
+
+def train_dictionary(samples: Iterable[bytes], size: int = DICT_SIZE) -> bytes:
+    """여러 payload 에 반복되는 JSON 조각을 모아 사전을 만든다. zlib 은 가까운 거리를 싸게 쓰므로 흔한 조각을 뒤에 둔다."""
+    counts: Counter = Counter()
+    samples = list(samples)
+    for sample in samples:
+        counts.update(set(_FRAGMENT.findall(sample)))
+    picked, total = [], 0
+    for fragment, n in counts.most_common():
+        if n < 2 or total >= size:
+            break
+        if total + len(fragment) <= size:
+            picked.append(fragment)
+            total += len(fragment)
+    logger.info(f"Trained payload dictionary: {total} bytes, {len(picked)} fragments from {len(samples)} samples")
+    return b"".join(reversed(picked))
+
+
+def clear_dictionary_cache() -> None:
+    """DB 를 새로 만들거나 사전을 갈아 끼운 뒤 호출 (같은 경로에서 id 가 다른 사전을 가리킬 수 있다)."""
+    _dictionaries.clear()
+
+
+def _dictionary(session, dict_id: int | None) -> bytes | None:
+    if dict_id is None:
+        return None
+    key = (str(session.get_bind().url), dict_id)
+    if key not in _dictionaries:
+        _dictionaries[key] = session.scalar(select(PayloadDict.data).where(PayloadDict.id == dict_id))
+    return _dictionaries[key]
+
+
+def current_dictionary(session) -> tuple[int | None, bytes | None]:
+    dict_id = session.scalar(select(func.max(PayloadDict.id)))
+    return dict_id, _dictionary(session, dict_id)
+
+
+def save_payloads(session, payloads: list[tuple[int, dict[str, Any]]]) -> None:
+    """(item_id, raw) 목록을 최신 사전으로 압축해 저장 (ingest 트랜잭션 안에서 호출)."""
+    if not payloads:
+        return
+    dict_id, zdict = current_dictionary(session)
+    session.execute(insert(ItemPayload), [{"item_id": item_id, "dict_id": dict_id, "data": encode(raw, zdict)}
+        for item_id, raw in payloads])
+
+
+def load_payload(session, item_id: int) -> dict[str, Any] | None:
+    return load_payloads(session, [item_id]).get(item_id)
+
+
+def load_payloads(session, item_ids: list[int]) -> dict[int, dict[str, Any]]:
+    rows = session.execute(select(ItemPayload.item_id, ItemPayload.dict_id, ItemPayload.data).where(ItemPayload.item_id.in_(item_ids)))
+    return {item_id: decode(data, _dictionary(session, dict_id)) for item_id, dict_id, data in rows}
+
+
+def compact(engine: Engine, samples: int = 2000, batch_size: int = 1000, vacuum: bool = True) -> CompactResult:
+    """items.raw_json(평문)을 item_payloads 로 옮기고, 새로 학습한 사전으로 기존 payload 까지 다시 압축한다.
+
+    변환은 한 트랜잭션으로 처리하고 raw_json 컬럼을 지운 뒤 VACUUM 으로 파일을 줄인다.
+    """
+    from sqlalchemy.orm import Session
+    path = engine.url.database
+    result = CompactResult(bytes_before=os.path.getsize(path) if path and os.path.exists(path) else 0)
+    with engine.connect() as conn:
+        has_raw_json = any(row[1] == "raw_json" for row in conn.exec_driver_sql("PRAGMA table_info(items)"))
+    with Session(engine) as session, session.begin():
+        sample_data = []
+        if has_raw_json:
+            sample_data += [raw.encode() for raw in session.scalars(text(
+                "SELECT raw_json FROM items WHERE raw_json IS NOT NULL ORDER BY random() LIMIT :n"), {"n": samples})]
+        for _item_id, dict_id, data in session.execute(select(ItemPayload.item_id, ItemPayload.dict_id, ItemPayload.data)
+                .order_by(func.random()).limit(max(samples - len(sample_data), 0))):
+            sample_data.append(dumps(decode(data, _dictionary(session, dict_id))))
+        if not sample_data:
+            return result
+        zdict = train_dictionary(sample_data)
+        result.dict_id = session.scalar(insert(PayloadDict).values(data=zdict, sample_count=len(sample_data),
+            created_at=datetime.utcnow()).returning(PayloadDict.id))
+
+        if has_raw_json:
+            last_id = 0
+            while rows := session.execute(text("SELECT id, raw_json FROM items WHERE raw_json IS NOT NULL AND id > :last "
+                    "ORDER BY id LIMIT :n"), {"last": last_id, "n": batch_size}).all():
+                session.execute(delete(ItemPayload).where(ItemPayload.item_id.in_([r.id for r in rows])))
+                session.execute(insert(ItemPayload), [{"item_id": r.id, "dict_id": result.dict_id,
+                    "data": encode(r.raw_json.encode(), zdict)} for r in rows])
+                result.converted += len(rows)
+                last_id = rows[-1].id
+        last_id = 0
+        while rows := session.execute(select(ItemPayload.item_id, ItemPayload.dict_id, ItemPayload.data)
+                .where(ItemPayload.item_id > last_id, ItemPayload.dict_id.is_distinct_from(result.dict_id))
+                .order_by(ItemPayload.item_id).limit(batch_size)).all():
+            for item_id, dict_id, data in rows:
+                session.execute(ItemPayload.__table__.update().where(ItemPayload.item_id == item_id).values(dict_id=result.dict_id,
+                    data=encode(dumps(decode(data, _dictionary(session, dict_id))), zdict)))
+            result.recompressed += len(rows)
+            last_id = rows[-1].item_id
+        session.execute(delete(PayloadDict).where(PayloadDict.id != result.dict_id))
+        if has_raw_json:
+            session.execute(text("ALTER TABLE items DROP COLUMN raw_json"))
+    clear_dictionary_cache()  # 지운 사전이 캐시에 남지 않도록
+    if vacuum:
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.exec_driver_sql("VACUUM")
+    result.bytes_after = os.path.getsize(path) if path and os.path.exists(path) else 0
+    return result
@@ -0,0 +1,70 @@
+"""외부 API 일별 사용량 장부 (api_quota 테이블).
+
+요청을 보내기 전에 reserve 가 오늘 사용량을 한 문장(UPSERT)으로 올리므로, 동시에 도는 크론 작업이나 재시작한 프로세스도
+같은 한도를 나눠 쓴다. 한도에 닿으면 요청을 보내지 않고 QuotaExceededError 를 낸다.
+"""
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from zoneinfo import ZoneInfo
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert
+from linkedin_intel.config import settings
+from linkedin_intel.models import ApiQuota, get_session
+
+CSE_API = "google_cse"
+
+
+class QuotaExceededError(RuntimeError):
+    """일일 요청 한도 초과."""
+
+
+@dataclass(frozen=True)
+class QuotaUsage:
+    day: date
+    requests: int
+    cache_hits: int
+    limit: int  # 0 이면 무제한
+
+    @property
+    def remaining(self) -> int | None:
+        return None if not self.limit else max(0, self.limit - self.requests)
+
+    @property
+    def exhausted(self) -> bool:
+        return bool(self.limit) and self.requests >= self.limit
+
+
+def quota_day(now: datetime | None = None) -> date:
+    """할당량 날짜. Google CSE 는 태평양 시간 자정에 리셋된다 (CSE_QUOTA_TIMEZONE)."""
+    return (now or datetime.now(timezone.utc)).astimezone(ZoneInfo(settings.cse_quota_timezone)).date()
+
+
+def _upsert(api: str, requests: int, cache_hits: int):
+    stmt = insert(ApiQuota).values(day=quota_day(), api=api, requests=requests, cache_hits=cache_hits)
+    return stmt, {"requests": ApiQuota.requests + stmt.excluded.requests, "cache_hits": ApiQuota.cache_hits + stmt.excluded.cache_hits}
+
+
+def reserve(api: str = CSE_API, limit: int | None = None) -> None:
+    """요청 1건을 장부에 올린다. 올리면 limit 을 넘게 되는 경우 아무것도 바꾸지 않고 QuotaExceededError."""
+    limit = settings.cse_daily_quota if limit is None else limit
+    stmt, set_ = _upsert(api, 1, 0)
+    if limit:
+        stmt = stmt.on_conflict_do_update(index_elements=[ApiQuota.day, ApiQuota.api], set_=set_, where=ApiQuota.requests < limit)
+    else:
+        stmt = stmt.on_conflict_do_update(index_elements=[ApiQuota.day, ApiQuota.api], set_=set_)
+    with get_session() as session:
+        if session.execute(stmt).rowcount == 0:
+            raise QuotaExceededError(f"Daily {api} quota exhausted ({limit} requests, resets at midnight {settings.cse_quota_timezone})")
+
+
+def record_cache_hit(api: str = CSE_API) -> None:
+    stmt, set_ = _upsert(api, 0, 1)
+    with get_session() as session:
+        session.execute(stmt.on_conflict_do_update(index_elements=[ApiQuota.day, ApiQuota.api], set_=set_))
+
+
+def usage(session, api: str = CSE_API, day: date | None = None, limit: int | None = None) -> QuotaUsage:
+    day = day or quota_day()
+    row = session.execute(select(ApiQuota.requests, ApiQuota.cache_hits).where(ApiQuota.day == day, ApiQuota.api == api)).first()
+    requests, cache_hits = row if row else (0, 0)
+    return QuotaUsage(day=day, requests=requests, cache_hits=cache_hits, limit=settings.cse_daily_quota if limit is None else limit)
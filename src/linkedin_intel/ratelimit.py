@@ -0,0 +1,38 @@
+"""토큰 버킷 요청 속도 제한 (동기/비동기 공용)."""
+import asyncio
+import threading
+import time
+from typing import Callable
+
+
+class TokenBucket:
+    """초당 rate 개씩 채워지는 버킷 (최대 capacity 개까지 몰아 쓸 수 있다). 일일 한도는 quota 장부가 맡는다.
+
+    토큰을 먼저 예약하고 부족분만큼 기다리므로 스레드/코루틴이 섞여도 전체 속도가 rate 를 넘지 않는다.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        with self._lock:
+            if self.rate <= 0:
+                return 0.0
+            now = self.clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self) -> None:
+        if wait := self._reserve():
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        if wait := self._reserve():
+            await asyncio.sleep(wait)
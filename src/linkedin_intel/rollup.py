@@ -0,0 +1,33 @@
+"""일자별 수집 집계 (item_rollups) 갱신 / 재구성."""
+from collections import Counter
+from datetime import date
+from sqlalchemy import delete, func, insert as sa_insert, literal, select
+from sqlalchemy.dialects.sqlite import insert
+from linkedin_intel.models.schema import Item, ItemRollup
+
+RollupKey = tuple[date, int, str, int]  # (day, query_id, channel, source_id)
+
+
+def rollup_key(day: date, query_id: int | None, channel: str, source_id: int | None) -> RollupKey:
+    return day, query_id or 0, channel, source_id or 0
+
+
+def apply_rollups(session, new: Counter, seen: Counter) -> None:
+    """신규/재확인 건수를 더한다. ingest 와 같은 트랜잭션에서 호출."""
+    rows = [{"day": k[0], "query_id": k[1], "channel": k[2], "source_id": k[3], "new_count": new.get(k, 0), "seen_count": seen.get(k, 0)}
+            for k in new.keys() | seen.keys()]
+    if not rows:
+        return
+    stmt = insert(ItemRollup)
+    stmt = stmt.on_conflict_do_update(index_elements=[ItemRollup.day, ItemRollup.query_id, ItemRollup.channel, ItemRollup.source_id],
+        set_={"new_count": ItemRollup.new_count + stmt.excluded.new_count, "seen_count": ItemRollup.seen_count + stmt.excluded.seen_count})
+    session.execute(stmt, rows)
+
+
+def rebuild_rollups(conn) -> None:
+    """items 전체로 new_count 를 다시 계산. 재확인 이력은 items 에 남지 않으므로 seen_count 는 0 으로 초기화된다."""
+    conn.execute(delete(ItemRollup))
+    day = func.date(Item.collected_at)
+    query_id, source_id = func.coalesce(Item.query_id, 0), func.coalesce(Item.source_id, 0)
+    conn.execute(sa_insert(ItemRollup).from_select(["day", "query_id", "channel", "source_id", "new_count", "seen_count"],
+        select(day, query_id, Item.channel, source_id, func.count(), literal(0)).group_by(day, query_id, Item.channel, source_id)))
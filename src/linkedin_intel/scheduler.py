@@ -0,0 +1,193 @@
+"""상주 수집 스케줄러 (geo scheduler).
+
+Query(CSE) / RSS Source 마다 자기 주기(interval_minutes, 없으면 채널 기본값)로 수집한다.
+다음 실행 시각에 ±jitter 를 섞어 같은 시각에 몰리지 않게 하고, 실패하면 재시도 간격을 지수적으로 늘린다.
+엔진 / HTTP 커넥션 풀 / 쓰기 스레드는 프로세스가 살아 있는 동안 재사용한다.
+"""
+import asyncio
+import json
+import logging
+import random
+import signal
+import time
+from concurrent.futures import Executor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+import httpx
+from sqlalchemy import func, insert, select
+from linkedin_intel.collect import CollectResult, collect_email, collect_query, collect_source, http_client, writer_executor
+from linkedin_intel.config import settings
+from linkedin_intel.models import get_session, Query, Run, RunStatus, Source, SourceType
+
+logger = logging.getLogger(__name__)
+
+REFRESH_SECONDS = 300  # 쿼리/소스 추가·삭제·주기 변경을 반영하는 간격
+EMAIL_JOB = ("email", 0)
+
+
+@dataclass
+class Job:
+    key: tuple[str, int]  # ("query", id) | ("source", id) | EMAIL_JOB
+    name: str
+    interval: float  # 초
+    due: float  # time.time() 기준 다음 실행 시각
+    failures: int = 0
+    running: bool = False
+
+
+def next_delay(interval: float, failures: int = 0, rng: random.Random | None = None) -> float:
+    """다음 실행까지 대기(초). 성공하면 interval, 연속 실패 n 회면 retry * 2^(n-1) (최대 max_backoff). 둘 다 ±jitter."""
+    if failures:
+        delay = min(settings.scheduler_retry_minutes * 60 * 2 ** (failures - 1), settings.scheduler_max_backoff_minutes * 60)
+    else:
+        delay = interval
+    jitter = settings.scheduler_jitter
+    return delay * (1 + (rng or random).uniform(-jitter, jitter))
+
+
+def _failed(collected: CollectResult | None) -> bool:
+    return collected is None or (collected.result is not None and collected.result.failed)
+
+
+class Scheduler:
+    def __init__(self, pages: int = 3, eml_path: Path | None = None, email_query_id: int | None = None, concurrency: int | None = None,
+                 clock: Callable[[], float] = time.time, rng: random.Random | None = None,
+                 on_result: Callable[[Job, CollectResult | None], None] | None = None, incremental: bool | None = None):
+        self.pages = pages
+        self.incremental = incremental
+        self.eml_path = eml_path
+        self.email_query_id = email_query_id
+        self.concurrency = concurrency or settings.collect_concurrency
+        self.clock = clock
+        self.rng = rng or random.Random()
+        self.on_result = on_result
+        self.jobs: dict[tuple[str, int], Job] = {}
+        self._warned_credentials = False
+
+    def load_plan(self) -> tuple[dict[tuple[str, int], tuple[str, float]], dict[tuple[str, int], datetime]]:
+        """DB 에서 (작업 키 -> (이름, 주기 초)) 와 작업별 마지막 Run 시작 시각을 읽는다."""
+        wanted: dict[tuple[str, int], tuple[str, float]] = {}
+        with get_session() as session:
+            if settings.has_cse_credentials():
+                for q in session.query(Query).order_by(Query.id):
+                    wanted[("query", q.id)] = (q.name, (q.interval_minutes or settings.scheduler_cse_interval_minutes) * 60)
+            elif not self._warned_credentials:
+                logger.warning("CSE credentials not configured; skipping CSE queries")
+                self._warned_credentials = True
+            for s in session.query(Source).filter(Source.type == SourceType.RSS).order_by(Source.id):
+                wanted[("source", s.id)] = (s.name, (s.interval_minutes or settings.scheduler_rss_interval_minutes) * 60)
+            if self.eml_path is not None:
+                wanted[EMAIL_JOB] = (str(self.eml_path), settings.scheduler_email_interval_minutes * 60)
+            # 이메일 Run 도 query_id 를 남기므로 CSE 커넥터의 Run 만 본다 (GoogleCSEConnector._date_restrict 와 같은 기준)
+            last_started = {("query", qid): started for qid, started in session.execute(
+                select(Run.query_id, func.max(Run.started_at)).where(Run.query_id.is_not(None),
+                    func.json_extract(Run.stats_json, "$.connector") == SourceType.GOOGLE_CSE.value).group_by(Run.query_id))}
+            last_started.update({("source", sid): started for sid, started in session.execute(
+                select(Run.source_id, func.max(Run.started_at)).where(Run.source_id.is_not(None)).group_by(Run.source_id))})
+        return wanted, last_started
+
+    def apply_plan(self, wanted: dict[tuple[str, int], tuple[str, float]], last_started: dict[tuple[str, int], datetime]) -> None:
+        """작업 목록을 DB 에 맞춘다. 새 작업의 첫 실행은 마지막 Run 시작 + 주기 (기록이 없으면 곧바로, jitter 만큼 분산)."""
+        now = self.clock()
+        for key in set(self.jobs) - set(wanted):
+            if not self.jobs[key].running:
+                del self.jobs[key]
+        for key, (name, interval) in wanted.items():
+            job = self.jobs.get(key)
+            if job is not None:
+                if job.interval != interval and not job.failures and not job.running:
+                    job.due += interval - job.interval
+                job.name, job.interval = name, interval
+                continue
+            started = last_started.get(key)
+            spread = self.rng.uniform(0, interval * settings.scheduler_jitter)
+            # started_at 은 UTC naive (datetime.utcnow)
+            due = now + spread if started is None else \
+                max(now + spread, started.replace(tzinfo=timezone.utc).timestamp() + next_delay(interval, rng=self.rng))
+            self.jobs[key] = Job(key=key, name=name, interval=interval, due=due)
+
+    def refresh(self) -> None:
+        self.apply_plan(*self.load_plan())
+
+    async def execute(self, job: Job, client: httpx.AsyncClient, writer: Executor, limit: asyncio.Semaphore) -> CollectResult | None:
+        """작업 하나를 실행하고 다음 실행 시각을 정한다. 모든 실행은 Run 으로 남는다 (변경 없는 피드 포함)."""
+        kind, ident = job.key
+        collected = None
+        try:
+            if kind == "query":
+                with get_session() as session:
+                    query = session.get(Query, ident)
+                    query_string = query.query_string if query else None
+                if query_string is not None:
+                    collected = await collect_query(client, writer, ident, job.name, query_string, self.pages, limit, self.incremental)
+            elif kind == "source":
+                with get_session() as session:
+                    source = session.get(Source, ident)
+                    config = source.config_json if source else None
+                if source is not None:
+                    collected = await collect_source(client, writer, ident, job.name, json.loads(config) if config else {}, limit)
+                    if collected.result is None:
+                        await asyncio.get_running_loop().run_in_executor(writer, record_unchanged, ident)
+            elif self.eml_path.is_dir() and any(self.eml_path.iterdir()):
+                collected = await collect_email(writer, self.eml_path, self.email_query_id)
+            else:
+                collected = CollectResult("email", job.name, None, "empty")
+        except Exception as e:
+            logger.exception(f"Scheduled job {job.key} failed: {e}")
+        job.failures = job.failures + 1 if _failed(collected) else 0
+        job.due = self.clock() + next_delay(job.interval, job.failures, self.rng)
+        job.running = False
+        if self.on_result:
+            self.on_result(job, collected)
+        return collected
+
+    async def run(self, stop: asyncio.Event | None = None, client: httpx.AsyncClient | None = None) -> None:
+        """stop 이 설정될 때까지 도래한 작업을 concurrency 개까지 동시에 실행. 멈출 때는 실행 중인 작업을 끝까지 기다린다."""
+        stop = stop or asyncio.Event()
+        limit = asyncio.Semaphore(self.concurrency)
+        running: set[asyncio.Task] = set()
+        with writer_executor() as writer:
+            async with (http_client(self.concurrency) if client is None else nullcontext(client)) as client:
+                refresh_at = 0.0
+                while not stop.is_set():
+                    now = self.clock()
+                    if now >= refresh_at:
+                        self.apply_plan(*await asyncio.get_running_loop().run_in_executor(writer, self.load_plan))
+                        refresh_at = now + REFRESH_SECONDS
+                    for job in sorted(self.jobs.values(), key=lambda j: j.due):
+                        if job.due > now:
+                            break
+                        if not job.running:
+                            job.running = True
+                            task = asyncio.create_task(self.execute(job, client, writer, limit))
+                            running.add(task)
+                            task.add_done_callback(running.discard)
+                    wake = min([job.due for job in self.jobs.values() if not job.running] + [refresh_at])
+                    try:
+                        await asyncio.wait_for(stop.wait(), timeout=max(0.0, wake - self.clock()))
+                    except TimeoutError:
+                        pass
+                if running:
+                    await asyncio.gather(*running)
+
+
+def record_unchanged(source_id: int) -> None:
+    """변경 없는 피드 조회도 실행 기록을 남긴다 (스케줄러가 살아 있는지 Run 으로 확인할 수 있게)."""
+    now = datetime.utcnow()
+    with get_session() as session:
+        session.execute(insert(Run).values(source_id=source_id, started_at=now, ended_at=now, status=RunStatus.COMPLETED,
+            records_fetched=0))
+
+
+def serve(scheduler: Scheduler) -> None:
+    """SIGINT/SIGTERM 을 받을 때까지 실행."""
+    async def main():
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+        await scheduler.run(stop)
+    asyncio.run(main())
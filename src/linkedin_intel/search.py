@@ -0,0 +1,94 @@
+"""items 전문 검색 (SQLite FTS5, 트리거로 items 와 동기화)."""
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+logger = logging.getLogger(__name__)
+
+# 하이라이트 구간 표시. 출력하는 쪽(CLI/대시보드)에서 각자 마크업으로 바꾼다.
+HL_START, HL_END = "\x02", "\x03"
+
+FTS_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(title, snippet, author,
+        content='items', content_rowid='id', tokenize='unicode61 remove_diacritics 2')""",
+    """CREATE TRIGGER IF NOT EXISTS items_fts_ai AFTER INSERT ON items BEGIN
+        INSERT INTO items_fts(rowid, title, snippet, author) VALUES (new.id, new.title, new.snippet, new.author);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS items_fts_ad AFTER DELETE ON items BEGIN
+        INSERT INTO items_fts(items_fts, rowid, title, snippet, author) VALUES ('delete', old.id, old.title, old.snippet, old.author);
+    END""",
+    # last_seen_at 만 바뀌는 중복 touch 에는 반응하지 않도록 컬럼 지정
+    """CREATE TRIGGER IF NOT EXISTS items_fts_au AFTER UPDATE OF title, snippet, author ON items BEGIN
+        INSERT INTO items_fts(items_fts, rowid, title, snippet, author) VALUES ('delete', old.id, old.title, old.snippet, old.author);
+        INSERT INTO items_fts(rowid, title, snippet, author) VALUES (new.id, new.title, new.snippet, new.author);
+    END""",
+    # 제목 가중치를 높인 bm25 를 기본 rank 로 (ORDER BY rank 를 FTS5 가 직접 처리해 임시 정렬이 없다)
+    "INSERT INTO items_fts(items_fts, rank) VALUES ('rank', 'bm25(5.0, 1.0, 2.0)')",
+]
+
+_TOKEN = re.compile(r"[^\s\"]+\*?")
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    id: int
+    title: str | None
+    channel: str
+    collected_at: datetime
+    url: str
+    title_hl: str | None
+    snippet_hl: str | None
+    rank: float
+
+
+def create_search_index(conn, rebuild: bool = True) -> bool:
+    """FTS 테이블/트리거 생성 후 기존 행 색인. FTS5 미지원 SQLite 면 False."""
+    try:
+        for ddl in FTS_DDL:
+            conn.exec_driver_sql(ddl)
+    except OperationalError as e:
+        logger.warning(f"FTS5 index unavailable: {e}")
+        return False
+    if rebuild:
+        conn.exec_driver_sql("INSERT INTO items_fts(items_fts) VALUES ('rebuild')")
+    return True
+
+
+def to_match_query(query: str) -> str:
+    """사용자 입력을 FTS5 MATCH 식으로 (단어별 AND, 끝의 * 는 접두 검색). 따옴표 처리로 문법 오류를 막는다."""
+    terms = []
+    for token in _TOKEN.findall(query):
+        prefix = token.endswith("*")
+        word = token.rstrip("*")
+        if word:
+            terms.append(f'"{word}"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+
+def search_items(session, query: str, query_id: int | None = None, channel: str | None = None, limit: int = 20) -> list[SearchHit]:
+    """bm25 순위(제목 가중치 높음)로 검색. 하이라이트는 HL_START/HL_END 로 감싼다."""
+    match = to_match_query(query)
+    if not match:
+        return []
+    sql = f"""SELECT items.id, items.title, items.channel, items.collected_at, items.url,
+            highlight(items_fts, 0, :hs, :he) AS title_hl, snippet(items_fts, 1, :hs, :he, '…', 16) AS snippet_hl,
+            items_fts.rank AS rank
+        FROM items_fts JOIN items ON items.id = items_fts.rowid
+        WHERE items_fts MATCH :match {"AND items.query_id = :query_id" if query_id else ""} {"AND items.channel = :channel" if channel else ""}
+        ORDER BY items_fts.rank LIMIT :limit"""
+    rows = session.execute(text(sql), {"hs": HL_START, "he": HL_END, "match": match, "query_id": query_id, "channel": channel, "limit": limit})
+    return [SearchHit(id=r.id, title=r.title, channel=r.channel, collected_at=_as_datetime(r.collected_at), url=r.url,
+        title_hl=r.title_hl, snippet_hl=r.snippet_hl or None, rank=r.rank) for r in rows]
+
+
+def render_highlight(value: str | None, start: str, end: str, escape=lambda s: s) -> str:
+    if not value:
+        return ""
+    return escape(value).replace(HL_START, start).replace(HL_END, end)
+
+
+def _as_datetime(value) -> datetime:
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
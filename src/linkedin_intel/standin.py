@@ -0,0 +1,200 @@
+"""오프라인 부하 테스트용 대역(stand-in) HTTP 서버: Google CSE JSON API 와 RSS 피드를 흉내 낸다.
+
+GOOGLE_CSE_ENDPOINT 를 이 서버의 /customsearch/v1 로, RSS Source 의 feed_url 을 /feeds/<n>.xml 로 두면
+GoogleCSEConnector / RSSConnector 를 할당량이나 외부 피드 없이 그대로 돌릴 수 있다.
+지연, 500 / 429 비율, ETag / Last-Modified 조건부 응답을 설정으로 바꾼다. 결과는 synth.post 의 게시물 공간을 쓴다.
+"""
+import json
+import logging
+import random
+import threading
+import time
+import zlib
+from dataclasses import asdict, dataclass
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+from xml.sax.saxutils import escape
+from linkedin_intel.synth import post
+
+logger = logging.getLogger(__name__)
+
+STANDIN_PORT = 8765
+CSE_PATH = "/customsearch/v1"
+CSE_MAX_RESULTS = 100  # 실제 CSE 처럼 start+num 은 100 까지
+
+
+@dataclass
+class StandinConfig:
+    latency_ms: float = 0.0  # 응답 전 지연
+    jitter_ms: float = 0.0  # 지연에 더하는 0~jitter 균등 분포
+    error_rate: float = 0.0  # 500 응답 비율
+    throttle_rate: float = 0.0  # 429 응답 비율
+    retry_after: int = 1  # 429 의 Retry-After (초)
+    etag: bool = True  # RSS ETag / Last-Modified 를 내보내고 조건부 요청에 304
+    feeds: int = 10
+    feed_entries: int = 50
+    feed_new_entries: int = 5  # rotate 간격마다 피드마다 새로 올라오는 항목 수
+    feed_rotate_seconds: float = 300.0
+    cse_total_results: int = 100  # 쿼리당 searchInformation.totalResults
+    url_pool: int = 100_000  # CSE 결과 게시물 번호 범위 (쿼리끼리 겹쳐 dedup 이 걸린다)
+    seed: int = 42
+
+
+class StandinServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, config: StandinConfig | None = None, host: str = "127.0.0.1", port: int = STANDIN_PORT):
+        self.config = config or StandinConfig()
+        self.rng = random.Random(self.config.seed)
+        self.counts: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        super().__init__((host, port), _Handler)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self.counts[key] = self.counts.get(key, 0) + 1
+
+    def roll(self) -> tuple[float, float]:
+        """(지연 초, 0~1 난수). 난수 하나로 500 / 429 를 가른다."""
+        with self._lock:
+            return (self.config.latency_ms + self.rng.uniform(0, self.config.jitter_ms)) / 1000, self.rng.random()
+
+    def start(self) -> "StandinServer":
+        """백그라운드 스레드에서 실행 (테스트 / 같은 프로세스 부하 테스트용)."""
+        self._thread = threading.Thread(target=self.serve_forever, name="standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "StandinServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def cse_response(config: StandinConfig, query: str, start: int, num: int) -> dict[str, Any]:
+    """Custom Search JSON API 응답 형태. 같은 (query, start) 는 항상 같은 결과."""
+    total = config.cse_total_results
+    end = min(start + num - 1, total, CSE_MAX_RESULTS)
+    base = zlib.crc32(query.encode())
+    items = []
+    for position in range(start, end + 1):
+        data = post((base + position) % config.url_pool, config.seed)
+        published = time.gmtime(1_767_225_600 + position * 3600)
+        items.append({"kind": "customsearch#result", "title": data["title"], "link": data["url"], "displayLink": urlsplit(data["url"]).netloc,
+            "snippet": data["snippet"], "formattedUrl": data["url"],
+            "pagemap": {"metatags": [{"og:type": "article", "author": data["author"],
+                "article:published_time": time.strftime("%Y-%m-%dT%H:%M:%S+00:00", published)}]}})
+    request = {"searchTerms": query, "startIndex": start, "count": len(items)}
+    body: dict[str, Any] = {"kind": "customsearch#search", "queries": {"request": [request]},
+        "searchInformation": {"totalResults": str(total)}, "items": items}
+    if end < min(total, CSE_MAX_RESULTS):
+        body["queries"]["nextPage"] = [{**request, "startIndex": end + 1}]
+    if not items:
+        del body["items"]
+    return body
+
+
+def feed_state(config: StandinConfig, feed: int, now: float) -> tuple[int, str, str]:
+    """(가장 최근 항목 번호, ETag, Last-Modified). rotate 간격마다 바뀐다."""
+    epoch = int(now // config.feed_rotate_seconds)
+    return epoch * config.feed_new_entries + config.feed_entries, f'"{feed}-{epoch}"', \
+        formatdate(epoch * config.feed_rotate_seconds, usegmt=True)
+
+
+def feed_xml(config: StandinConfig, feed: int, head: int, last_modified: str) -> str:
+    """RSS 2.0. 피드마다 게시물 번호 공간을 나눠 피드끼리 겹치지 않는다."""
+    entries = []
+    for index in range(head - 1, head - 1 - config.feed_entries, -1):
+        k = feed * 10_000_000 + index
+        data = post(k, config.seed)
+        entries.append(f"<item><guid isPermaLink=\"false\">urn:synth:{feed}:{index}</guid><link>{escape(data['url'])}</link>"
+            f"<title>{escape(data['title'])}</title><author>{escape(data['author'])}</author>"
+            f"<pubDate>{formatdate(1_767_225_600 + index * 600, usegmt=True)}</pubDate>"
+            f"<description>{escape('<p>' + data['snippet'] + '</p>')}</description></item>")
+    return (f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>Synthetic feed {feed}</title>'
+        f"<link>https://feeds.synth/{feed}</link><lastBuildDate>{last_modified}</lastBuildDate>{''.join(entries)}</channel></rss>")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: StandinServer
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        if url.path == "/_stats":
+            self._send(200, json.dumps({"counts": self.server.counts, "config": asdict(self.server.config)}), "application/json")
+            return
+        delay, dice = self.server.roll()
+        if delay:
+            time.sleep(delay)
+        config = self.server.config
+        if dice < config.error_rate:
+            self.server.count("500")
+            self._send(500, json.dumps({"error": {"code": 500, "message": "Backend Error"}}), "application/json")
+        elif dice < config.error_rate + config.throttle_rate:
+            self.server.count("429")
+            self._send(429, json.dumps({"error": {"code": 429, "message": "Quota exceeded", "status": "RESOURCE_EXHAUSTED"}}),
+                "application/json", {"Retry-After": str(config.retry_after)})
+        elif url.path == CSE_PATH:
+            self._cse(parse_qs(url.query))
+        elif url.path.startswith("/feeds/") and url.path.endswith(".xml"):
+            self._feed(url.path[len("/feeds/"):-len(".xml")])
+        else:
+            self.server.count("404")
+            self._send(404, "not found", "text/plain")
+
+    def _cse(self, params: dict[str, list[str]]) -> None:
+        query = params.get("q", [""])[0]
+        if not query:
+            self.server.count("400")
+            self._send(400, json.dumps({"error": {"code": 400, "message": "Missing query"}}), "application/json")
+            return
+        start, num = int(params.get("start", ["1"])[0]), min(int(params.get("num", ["10"])[0]), 10)
+        self.server.count("cse")
+        self._send(200, json.dumps(cse_response(self.server.config, query, start, num)), "application/json")
+
+    def _feed(self, name: str) -> None:
+        config = self.server.config
+        if not name.isdigit() or int(name) >= config.feeds:
+            self.server.count("404")
+            self._send(404, "not found", "text/plain")
+            return
+        feed = int(name)
+        head, etag, last_modified = feed_state(config, feed, time.time())
+        if config.etag and (self.headers.get("If-None-Match") == etag or self.headers.get("If-Modified-Since") == last_modified):
+            self.server.count("304")
+            self._send(304, "", None, {"ETag": etag, "Last-Modified": last_modified})
+            return
+        self.server.count("feed")
+        headers = {"ETag": etag, "Last-Modified": last_modified} if config.etag else {}
+        self._send(200, feed_xml(config, feed, head, last_modified), "application/rss+xml; charset=utf-8", headers)
+
+    def _send(self, status: int, body: str, content_type: str | None, headers: dict[str, str] | None = None) -> None:
+        data = body.encode()
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if data and self.command != "HEAD":
+            self.wfile.write(data)
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(f"{self.address_string()} {format % args}")
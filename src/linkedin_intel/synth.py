@@ -0,0 +1,187 @@
+"""부하 테스트용 합성 데이터 (geo synth).
+
+DB 에 Item / Run / Tag 행을 채우고, .eml / CSV 코퍼스를 만든다. 게시물 k 번의 URL·제목·요약은 (seed, k) 로 정해지므로
+대역 서버(standin)와 코퍼스, DB 가 같은 URL 공간을 공유한다 (재수집 시 dedup 이 실제처럼 걸린다).
+"""
+import csv
+import email.message
+import json
+import random
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from email.utils import format_datetime
+from pathlib import Path
+from typing import Any
+from sqlalchemy import func, insert, select
+from linkedin_intel.metrics import PHASES
+from linkedin_intel.models import get_session, item_tags, Item, Query, Run, RunStatus, Source, SourceType, Tag
+from linkedin_intel.rollup import apply_rollups, rollup_key
+from linkedin_intel.utils import canonicalize_urls
+
+TOPICS = ["Software Defined Vehicle", "SDV", "ADAS", "Digital Cockpit", "In-Vehicle Infotainment", "IVI", "OTA update",
+    "zonal architecture", "automotive Android", "telematics", "V2X", "head-up display", "driver monitoring", "EV platform"]
+COMPANIES = ["LG Electronics", "LG VS", "Hyundai Mobis", "Bosch", "Continental", "Aptiv", "Harman", "Qualcomm", "NVIDIA",
+    "Visteon", "Panasonic Automotive", "Denso", "ZF", "Valeo"]
+VERBS = ["announces", "unveils", "partners on", "showcases", "expands", "ships", "invests in", "demos"]
+FIRST_NAMES = ["jisoo", "minho", "hana", "david", "sarah", "kenji", "maria", "alex", "yuna", "thomas", "priya", "lukas"]
+TRACKING_TAILS = ["", "", "?utm_source=share&utm_medium=member_desktop", "?trk=public_post_feed-article-content",
+    "/?lipi=urn%3Ali%3Apage", "/"]
+HOSTS = ["www.linkedin.com"] * 6 + ["kr.linkedin.com", "linkedin.com", "de.linkedin.com"]
+CHANNEL_WEIGHTS = {"google_cse": 50, "rss": 25, "email": 20, "manual": 5}
+RUN_ERRORS = ["HTTPStatusError: Server error '500 Internal Server Error'", "ReadTimeout: timed out",
+    "HTTPStatusError: Client error '429 Too Many Requests'"]
+FEED_SOURCE_PREFIX = "synth-feed-"
+CHUNK = 5000
+
+
+def post(k: int, seed: int = 0) -> dict[str, str]:
+    """k 번째 합성 게시물. 같은 (seed, k) 면 항상 같은 값 (URL 은 추적 파라미터가 붙을 수 있어 정규화 전 형태)."""
+    rng = random.Random(seed * 1_000_003 + k)
+    topic, company, name = rng.choice(TOPICS), rng.choice(COMPANIES), rng.choice(FIRST_NAMES)
+    user = f"{name}-{rng.randrange(1000):03d}"
+    slug = topic.lower().replace(" ", "-")
+    return {"url": f"https://{rng.choice(HOSTS)}/posts/{user}_{slug}-activity-{7_100_000_000_000_000_000 + k}{rng.choice(TRACKING_TAILS)}",
+        "title": f"{company} {rng.choice(VERBS)} {topic} | {name.title()} | LinkedIn",
+        "snippet": f"{company} {topic}: {rng.choice(TOPICS)} and {rng.choice(TOPICS)} for next-generation vehicles. #{slug.replace('-', '')}",
+        "author": f"{name.title()} {chr(65 + rng.randrange(26))}."}
+
+
+@dataclass
+class SynthSummary:
+    items: int = 0
+    runs: int = 0
+    tagged: int = 0
+    sources: int = 0
+
+
+def ensure_feed_sources(count: int, base_url: str) -> list[int]:
+    """대역 RSS 피드를 가리키는 Source (synth-feed-N). 이미 있으면 그대로 쓴다."""
+    with get_session() as session:
+        existing = {s.name: s.id for s in session.query(Source).filter(Source.type == SourceType.RSS, Source.name.like(f"{FEED_SOURCE_PREFIX}%"))}
+        for n in range(count):
+            name = f"{FEED_SOURCE_PREFIX}{n}"
+            if name not in existing:
+                source = Source(name=name, type=SourceType.RSS, config_json=json.dumps({"feed_url": f"{base_url.rstrip('/')}/feeds/{n}.xml"}))
+                session.add(source)
+                session.flush()
+                existing[name] = source.id
+        return [existing[f"{FEED_SOURCE_PREFIX}{n}"] for n in range(count)]
+
+
+def _run_stats(rng: random.Random, connector: str, fetched: int, new: int, failed: bool) -> dict[str, Any]:
+    phases = {phase: round(rng.uniform(0.001, 0.05) * (20 if phase == "http" else 1), 6) for phase in PHASES}
+    return {"connector": connector, "ingest_seconds": round(sum(phases.values()) * 1.1, 6), "phases": phases,
+        "bytes_downloaded": fetched * rng.randrange(800, 3000), "requests": max(1, fetched // 10),
+        "rss_start_bytes": rng.randrange(60, 120) << 20, "rss_end_bytes": rng.randrange(80, 160) << 20, "process_peak_rss_bytes": rng.randrange(160, 200) << 20,
+        "items": {"fetched": fetched, "new": new, "duplicates": fetched - new, "errors": int(failed)}}
+
+
+def synth_db(items: int, runs: int, days: int = 90, feeds: int = 10, feed_base_url: str = "http://127.0.0.1:8765",
+             tag_ratio: float = 0.1, seed: int = 42) -> SynthSummary:
+    """현재 DB 에 합성 행을 추가. collected_at 은 최근 days 일에 퍼지고 id 순서와 시간 순서가 같다. 일자별 집계도 함께 갱신."""
+    rng = random.Random(seed)
+    summary = SynthSummary()
+    source_ids = ensure_feed_sources(feeds, feed_base_url) if feeds else []
+    summary.sources = len(source_ids)
+    with get_session() as session:
+        query_ids = list(session.scalars(select(Query.id).order_by(Query.id)))
+        tag_ids = list(session.scalars(select(Tag.id).order_by(Tag.id)))
+        first_id = (session.scalar(select(func.max(Item.id))) or 0) + 1
+    if not query_ids:
+        raise ValueError("No queries in database (run 'geo init-db --seed' first)")
+    channels = [c for c in CHANNEL_WEIGHTS if c != "rss" or source_ids]
+    weights = [CHANNEL_WEIGHTS[c] for c in channels]
+    now = datetime.utcnow()
+    # 시간 오름차순으로 만들어 id 가 collected_at 을 따라가게 (실제 수집과 같은 모양)
+    offsets = sorted((rng.uniform(0, days * 86400) for _ in range(items)), reverse=True)
+
+    for start in range(0, items, CHUNK):
+        batch = [post(first_id + k, seed) for k in range(start, min(start + CHUNK, items))]
+        rows, new = [], Counter()
+        for data, canonical, offset in zip(batch, canonicalize_urls(d["url"] for d in batch), offsets[start:start + CHUNK], strict=True):
+            channel = rng.choices(channels, weights)[0]
+            collected = now - timedelta(seconds=offset)
+            query_id = None if channel == "rss" else rng.choice(query_ids)
+            source_id = rng.choice(source_ids) if channel == "rss" else None
+            rows.append({"url": data["url"], "canonical_url": canonical.url, "url_key": canonical.key, "title": data["title"],
+                "snippet": data["snippet"], "author": data["author"], "published_at": collected - timedelta(hours=rng.uniform(1, 72)),
+                "collected_at": collected, "last_seen_at": collected, "source_id": source_id, "query_id": query_id, "channel": channel})
+            new[rollup_key(collected.date(), query_id, channel, source_id)] += 1
+        with get_session() as session:
+            session.execute(insert(Item), rows)
+            apply_rollups(session, new, Counter())
+        summary.items += len(rows)
+
+    if tag_ids and items:
+        with get_session() as session:
+            ids = list(session.scalars(select(Item.id).where(Item.id >= first_id)))
+            links = [{"item_id": item_id, "tag_id": tag_id} for item_id in ids if rng.random() < tag_ratio
+                for tag_id in rng.sample(tag_ids, rng.randint(1, min(2, len(tag_ids))))]
+            for start in range(0, len(links), CHUNK):
+                session.execute(insert(item_tags), links[start:start + CHUNK])
+            summary.tagged = len({link["item_id"] for link in links})
+
+    targets = [("google_cse", qid, None) for qid in query_ids] + [("rss", None, sid) for sid in source_ids] + [("email", query_ids[0], None)]
+    run_rows = []
+    for started_offset in sorted((rng.uniform(0, days * 86400) for _ in range(runs)), reverse=True):
+        connector, query_id, source_id = rng.choice(targets)
+        started = now - timedelta(seconds=started_offset)
+        failed = rng.random() < 0.05
+        fetched = 0 if failed else rng.randint(0, 50 if connector == "rss" else 30)
+        new_count = rng.randint(0, fetched)
+        stats = _run_stats(rng, connector, fetched, new_count, failed)
+        run_rows.append({"query_id": query_id, "source_id": source_id, "started_at": started,
+            "ended_at": started + timedelta(seconds=stats["ingest_seconds"]), "status": RunStatus.FAILED if failed else RunStatus.COMPLETED,
+            "records_fetched": new_count, "error": rng.choice(RUN_ERRORS) if failed else None, "stats_json": json.dumps(stats)})
+    if run_rows:
+        with get_session() as session:
+            session.execute(insert(Run), run_rows)
+    summary.runs = len(run_rows)
+    return summary
+
+
+def _links(count: int, dup_ratio: float, rng: random.Random, start: int) -> list[int]:
+    """게시물 번호 목록. dup_ratio 만큼은 앞에서 나온 번호를 다시 쓴다 (뉴스레터 간 반복 링크 / 재수집)."""
+    ks = []
+    for n in range(count):
+        ks.append(rng.choice(ks) if ks and rng.random() < dup_ratio else start + n)
+    return ks
+
+
+def write_eml(directory: Path, files: int, links_per_file: int = 50, dup_ratio: float = 0.2, start: int = 0, seed: int = 42) -> int:
+    """LinkedIn 다이제스트 형태 .eml 파일들. 일부 링크는 Google 리다이렉트로 감싼다. 만든 링크 수를 돌려준다."""
+    rng = random.Random(seed)
+    directory.mkdir(parents=True, exist_ok=True)
+    ks = _links(files * links_per_file, dup_ratio, rng, start)
+    sent = datetime(2026, 1, 5, 9, 0)
+    for n in range(files):
+        parts = []
+        for k in ks[n * links_per_file:(n + 1) * links_per_file]:
+            data = post(k, seed)
+            href = f"https://www.google.com/url?q={data['url']}&sa=D&source=editors" if rng.random() < 0.2 else data["url"]
+            parts.append(f'<tr><td><a href="{href}">{data["title"]}</a><p>{data["snippet"]}</p></td></tr>')
+        msg = email.message.EmailMessage()
+        msg["Subject"] = f"LinkedIn digest #{n + 1}"
+        msg["From"] = "LinkedIn <messages-noreply@linkedin.com>"
+        msg["To"] = "geo@example.com"
+        msg["Date"] = format_datetime((sent + timedelta(days=n)).astimezone())
+        msg.set_content(f"<html><body><table>{''.join(parts)}</table><a href='#top'>top</a> "
+            f"<a href='mailto:unsubscribe@linkedin.com'>unsubscribe</a></body></html>", subtype="html")
+        (directory / f"synth_{n:06d}.eml").write_bytes(msg.as_bytes())
+    return len(ks)
+
+
+def write_csv(path: Path, rows: int, dup_ratio: float = 0.2, start: int = 0, seed: int = 42) -> int:
+    """geo ingest csv 형식 (url,title,snippet,published_at,author,channel)."""
+    rng = random.Random(seed)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    published = datetime(2026, 1, 1)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["url", "title", "snippet", "published_at", "author", "channel"])
+        for k in _links(rows, dup_ratio, rng, start):
+            data = post(k, seed)
+            writer.writerow([data["url"], data["title"], data["snippet"], (published + timedelta(minutes=k % 100_000)).isoformat(),
+                data["author"], "manual"])
+    return rows
@@ -0,0 +1,168 @@
+"""규칙 기반 자동 태깅: 태그별 키워드 / 정규식 규칙(tag_rules)을 제목+스니펫에 적용해 item_tags 를 채운다.
+
+키워드는 전부 단어 단위 Aho-Corasick 오토마톤 하나로 합쳐 텍스트를 한 번만 훑는다. 규칙이 늘어도 항목당 비용은 단어 수에 비례한다.
+여러 단어 키워드("software defined vehicle")는 단어열로 일치하고, 대소문자와 문장부호는 무시하며, 단어 일부(ADAS 와 ADASIS)는 일치하지 않는다.
+정규식은 태그마다 한 패턴으로 합쳐(alternation) 태그당 search 한 번이고, 키워드로 이미 붙은 태그는 건너뛴다.
+수집 때는 새 항목에만 붙이고, 규칙을 바꾼 뒤 기존 항목에는 geo retag (retag) 로 다시 적용한다.
+"""
+import re
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Iterable
+from sqlalchemy import and_, bindparam, delete, func, insert, select
+from linkedin_intel.models import get_session, item_tags, Item, Tag, TagRule, TagRuleKind
+
+RETAG_BATCH = 5000
+_TOKEN = re.compile(r"\w+")
+
+
+def keyword_tokens(pattern: str) -> tuple[str, ...]:
+    return tuple(_TOKEN.findall(pattern.lower()))
+
+
+class Tagger:
+    """규칙 묶음을 한 번 컴파일해 두고 항목마다 tags() 로 태그 id 를 구한다."""
+
+    def __init__(self, rules: Iterable[tuple[int, TagRuleKind | str, str]]):
+        self._goto: list[dict[str, int]] = [{}]  # 상태 -> {단어: 다음 상태}, 0 은 루트
+        self._output: list[frozenset[int]] = [frozenset()]  # 상태에서 끝나는 키워드의 태그 (실패 링크를 따라 합친 값)
+        self._fail: list[int] = [0]
+        regexes: dict[int, list[str]] = {}
+        self.tag_ids: set[int] = set()
+        for tag_id, kind, pattern in rules:
+            self.tag_ids.add(tag_id)
+            if TagRuleKind(kind) is TagRuleKind.REGEX:
+                regexes.setdefault(tag_id, []).append(pattern)
+            elif tokens := keyword_tokens(pattern):
+                self._add_keyword(tokens, tag_id)
+        self._build_failures()
+        self._regexes = [(tag_id, re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)) for tag_id, patterns in regexes.items()]
+
+    @classmethod
+    def load(cls, session) -> "Tagger":
+        return cls(session.execute(select(TagRule.tag_id, TagRule.kind, TagRule.pattern).order_by(TagRule.id)).all())
+
+    def __bool__(self) -> bool:
+        return bool(self.tag_ids)
+
+    def _add_keyword(self, tokens: tuple[str, ...], tag_id: int) -> None:
+        state = 0
+        for token in tokens:
+            if token not in self._goto[state]:
+                self._goto.append({})
+                self._output.append(frozenset())
+                self._fail.append(0)
+                self._goto[state][token] = len(self._goto) - 1
+            state = self._goto[state][token]
+        self._output[state] |= {tag_id}
+
+    def _build_failures(self) -> None:
+        queue = deque(self._goto[0].values())  # 깊이 1 상태의 실패 링크는 루트
+        while queue:
+            state = queue.popleft()
+            for token, child in self._goto[state].items():
+                queue.append(child)
+                fail = self._fail[state]
+                while fail and token not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(token, 0)
+                self._output[child] |= self._output[self._fail[child]]
+
+    def tags(self, title: str | None, snippet: str | None) -> set[int]:
+        found: set[int] = set()
+        goto, fail, output = self._goto, self._fail, self._output
+        for text in (title, snippet):
+            if not text:
+                continue
+            state = 0  # 제목 끝과 스니펫 시작을 이어 붙여 일치하지 않도록 필드마다 처음부터
+            for token in _TOKEN.findall(text.lower()):
+                while state and token not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(token, 0)
+                if output[state]:
+                    found |= output[state]
+        for tag_id, regex in self._regexes:
+            if tag_id not in found and (regex.search(title or "") or regex.search(snippet or "")):
+                found.add(tag_id)
+        return found
+
+
+def validate_rule(kind: TagRuleKind, pattern: str) -> None:
+    """잘못된 규칙이면 ValueError (수집 중에 컴파일이 실패하지 않도록 추가할 때 확인)."""
+    if kind is TagRuleKind.REGEX:
+        try:
+            re.compile(pattern)
+        except re.error as e:
+            raise ValueError(f"Invalid regex {pattern!r}: {e}") from None
+    elif not keyword_tokens(pattern):
+        raise ValueError(f"Keyword {pattern!r} has no word characters")
+
+
+def add_rule(session, tag_name: str, kind: TagRuleKind, pattern: str) -> TagRule:
+    """규칙 추가 (태그가 없으면 만든다). 잘못된 규칙이나 이미 있는 규칙이면 ValueError."""
+    validate_rule(kind, pattern)
+    tag = session.scalar(select(Tag).where(Tag.name == tag_name))
+    if tag is None:
+        tag = Tag(name=tag_name)
+        session.add(tag)
+    elif any(rule.kind is kind and rule.pattern == pattern for rule in tag.rules):
+        raise ValueError(f"Rule already exists: {tag_name} {kind.value} {pattern!r}")
+    rule = TagRule(kind=kind, pattern=pattern)
+    tag.rules.append(rule)
+    session.flush()
+    return rule
+
+
+def tag_items(session, tagger: Tagger, items: Iterable[tuple[int, str | None, str | None]]) -> int:
+    """새 항목 (id, 제목, 스니펫) 에 규칙 태그를 붙인다. ingest 와 같은 트랜잭션에서 INSERT 직후 호출. 붙인 링크 수를 반환."""
+    links = [{"item_id": item_id, "tag_id": tag_id} for item_id, title, snippet in items for tag_id in tagger.tags(title, snippet)]
+    if links:
+        session.connection().execute(insert(item_tags), links)
+    return len(links)
+
+
+@dataclass(frozen=True)
+class RetagStats:
+    items: int
+    added: int
+    removed: int
+
+
+def retag(tag_ids: set[int] | None = None, batch_size: int = RETAG_BATCH, on_batch: Callable[[int], None] | None = None) -> RetagStats:
+    """현재 규칙을 전체 항목에 id 순 배치로 다시 적용 (배치마다 커밋해 메모리가 일정하다).
+
+    규칙이 있는 태그(tag_ids 를 주면 그 태그들)의 item_tags 만 규칙 결과와 같게 고치고 수동 태그는 건드리지 않는다.
+    규칙을 전부 지운 태그는 tag_ids 로 지정하면 비워진다.
+    """
+    with get_session() as session:
+        tagger = Tagger.load(session)
+    managed = tagger.tag_ids if tag_ids is None else set(tag_ids)
+    if not managed:
+        return RetagStats(0, 0, 0)
+    unlink = delete(item_tags).where(and_(item_tags.c.item_id == bindparam("_item_id"), item_tags.c.tag_id == bindparam("_tag_id")))
+    last_id = done = added = removed = 0
+    while True:
+        with get_session() as session:
+            rows = session.execute(select(Item.id, Item.title, Item.snippet).where(Item.id > last_id).order_by(Item.id).limit(batch_size)).all()
+            if not rows:
+                break
+            wanted = {(item_id, tag_id) for item_id, title, snippet in rows for tag_id in tagger.tags(title, snippet) if tag_id in managed}
+            current = set(session.execute(select(item_tags.c.item_id, item_tags.c.tag_id)
+                .where(item_tags.c.item_id.between(rows[0].id, rows[-1].id), item_tags.c.tag_id.in_(managed))).all())
+            connection = session.connection()
+            if stale := current - wanted:
+                connection.execute(unlink, [{"_item_id": item_id, "_tag_id": tag_id} for item_id, tag_id in stale])
+            if new := wanted - current:
+                connection.execute(insert(item_tags), [{"item_id": item_id, "tag_id": tag_id} for item_id, tag_id in new])
+        last_id, done = rows[-1].id, done + len(rows)
+        added, removed = added + len(new), removed + len(stale)
+        if on_batch:
+            on_batch(done)
+    return RetagStats(items=done, added=added, removed=removed)
+
+
+def tag_counts(session) -> list[tuple[str, int, int]]:
+    """태그별 (이름, 규칙 수, 태그된 항목 수)."""
+    rules = dict(session.execute(select(TagRule.tag_id, func.count()).group_by(TagRule.tag_id)).all())
+    items = dict(session.execute(select(item_tags.c.tag_id, func.count()).group_by(item_tags.c.tag_id)).all())
+    return [(name, rules.get(tag_id, 0), items.get(tag_id, 0)) for tag_id, name in session.execute(select(Tag.id, Tag.name).order_by(Tag.id))]
@@ -1,6 +1,9 @@
 """URL 정규화 유틸리티."""
 import hashlib
-from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+import re
+from functools import lru_cache
+from typing import Iterable, NamedTuple
+from urllib.parse import parse_qs, urlencode, urlparse, urlunsplit
 
 TRACKING_PARAMS = {"utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content",
     "fbclid", "gclid", "li_fat_id", "trk", "trkInfo", "refId", "trackingId", "lipi", "licu"}
@@ -9,10 +12,50 @@ LINKEDIN_SUBDOMAIN_MAP = {"www.linkedin.com": "linkedin.com", "kr.linkedin.com":
     "de.linkedin.com": "linkedin.com", "uk.linkedin.com": "linkedin.com", "fr.linkedin.com": "linkedin.com"}
 
 
+# 뉴스레터/피드에 같은 링크가 반복되므로 최근 URL 의 정규화 결과를 메모 (항목당 ~200B)
+URL_CACHE_SIZE = 65536
+
+# unquote/quote_plus 를 거쳐도 그대로인 문자만으로 된 쿼리 키/값
+_PLAIN = re.compile(r"[A-Za-z0-9_.~-]+")
+
+
+class CanonicalUrl(NamedTuple):
+    url: str
+    hash: str
+
+    @property
+    def key(self) -> int:
+        return int.from_bytes(bytes.fromhex(self.hash[:16]), "big", signed=True)
+
+
 def canonicalize_url(url: str) -> str:
     """URL 정규화 (UTM 제거, trailing slash 정규화)."""
     if not url:
         return ""
+    return canonical_url_key(url).url
+
+
+def url_hash(url: str) -> str:
+    return canonical_url_key(url).hash if url else _EMPTY.hash
+
+
+def url_key(canonical_url: str) -> int:
+    """dedup 조회용 고정 폭 키: 정규화 URL sha256 앞 8바이트 (SQLite INTEGER 범위 signed 64bit). 충돌은 URL 비교로 걸러낸다."""
+    return int.from_bytes(hashlib.sha256(canonical_url.encode()).digest()[:8], "big", signed=True)
+
+
+def canonicalize_urls(urls: Iterable[str]) -> list[CanonicalUrl]:
+    """배치 정규화: 입력 순서대로 (정규화 URL, sha256) 을 돌려준다. 반복 URL 은 메모에서 바로 꺼낸다."""
+    return [canonical_url_key(url) if url else _EMPTY for url in urls]
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def canonical_url_key(url: str) -> CanonicalUrl:
+    canonical = _canonicalize(url)
+    return CanonicalUrl(canonical, hashlib.sha256(canonical.encode()).hexdigest())
+
+
+def _canonicalize(url: str) -> str:
     try:
         parsed = urlparse(url.strip())
     except Exception:
@@ -20,14 +63,32 @@ def canonicalize_url(url: str) -> str:
     scheme = "https" if parsed.scheme in ("http", "https", "") else parsed.scheme
     netloc = LINKEDIN_SUBDOMAIN_MAP.get(parsed.netloc.lower(), parsed.netloc.lower())
     path = parsed.path.rstrip("/") or "/"
-    query_params = parse_qs(parsed.query, keep_blank_values=False)
-    filtered = {k: v for k, v in query_params.items() if k.lower() not in TRACKING_PARAMS}
-    query = urlencode(sorted(filtered.items()), doseq=True) if filtered else ""
-    return urlunparse((scheme, netloc, path, "", query, ""))
+    query = _plain_query(parsed.query) if parsed.query else ""
+    if query is None:
+        query_params = parse_qs(parsed.query, keep_blank_values=False)
+        filtered = {k: v for k, v in query_params.items() if k.lower() not in TRACKING_PARAMS}
+        query = urlencode(sorted(filtered.items()), doseq=True) if filtered else ""
+    return urlunsplit((scheme, netloc, path, query, ""))
 
 
-def url_hash(url: str) -> str:
-    return hashlib.sha256(canonicalize_url(url).encode()).hexdigest()
+def _plain_query(query: str) -> str | None:
+    """인코딩할 것 없는 k=v 쌍만 있으면 parse_qs/urlencode 없이 같은 결과를 만든다. 아니면 None (일반 경로)."""
+    kept = {}
+    for pair in query.split("&"):
+        key, sep, value = pair.partition("=")
+        if not value:
+            continue  # 빈 쌍 / '=' 없음 / 빈 값은 parse_qs 도 버린다
+        if not _PLAIN.fullmatch(key):
+            return None
+        if key.lower() in TRACKING_PARAMS:
+            continue
+        if key in kept or not _PLAIN.fullmatch(value):
+            return None
+        kept[key] = value
+    return "&".join(f"{key}={kept[key]}" for key in sorted(kept))
+
+
+_EMPTY = CanonicalUrl("", hashlib.sha256(b"").hexdigest())
 
 
 def clean_title(title: str | None) -> str | None:
@@ -0,0 +1,90 @@
+"""공용 테스트 픽스처 / 헬퍼."""
+import json
+import httpx
+import pytest
+from linkedin_intel.config import settings
+from linkedin_intel.connectors.base import BaseConnector
+from linkedin_intel.models import database, get_session, Source, SourceType
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """임시 SQLite DB 로 엔진/세션을 교체."""
+    monkeypatch.setattr(settings, "database_path", str(tmp_path / "geo.db"))
+    monkeypatch.setattr(database, "_engine", None)
+    monkeypatch.setattr(database, "_SessionLocal", None)
+    monkeypatch.setattr(database, "_ro_engine", None)
+    monkeypatch.setattr(database, "_ro_SessionLocal", None)
+    database.init_db()
+    database.seed_data()
+    yield tmp_path / "geo.db"
+    for engine in (database._engine, database._ro_engine):
+        if engine is not None:
+            engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def cse_cache_dir(tmp_path, monkeypatch):
+    """CSE 응답 캐시를 테스트마다 빈 임시 디렉터리로 (저장소의 ./data 에 쓰지 않게)."""
+    monkeypatch.setattr(settings, "cse_cache_dir", str(tmp_path / "cse_cache"))
+
+
+@pytest.fixture
+def cse_settings(monkeypatch):
+    """CSE 키를 채우고 속도 제한 / 일일 한도를 끈다 (요청은 각 테스트의 MockTransport 나 대역 서버로)."""
+    from linkedin_intel.connectors.google_cse import get_rate_limiter
+    monkeypatch.setattr(settings, "google_cse_api_key", "key")
+    monkeypatch.setattr(settings, "google_cse_cx", "cx")
+    monkeypatch.setattr(settings, "cse_qps", 0)
+    monkeypatch.setattr(settings, "cse_daily_quota", 0)
+    get_rate_limiter.cache_clear()
+    yield
+    get_rate_limiter.cache_clear()
+
+
+class ListConnector(BaseConnector):
+    """fetch 대신 넘겨받은 items 를 그대로 저장하는 커넥터."""
+    channel = "manual"
+
+    def fetch(self, items, **kwargs):
+        return items
+
+
+def post_item(n: int, **extra) -> dict:
+    return {"url": f"https://www.linkedin.com/posts/p{n}/?utm_source=x", "title": f"Post {n} | LinkedIn", **extra}
+
+
+def rss_feed(*guids: str) -> str:
+    """guid 마다 LinkedIn 링크 하나인 RSS 2.0 문서."""
+    items = "".join(f"<item><guid>{guid}</guid><link>https://linkedin.com/posts/{guid}</link><title>{guid.upper()}</title></item>"
+        for guid in guids)
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>{items}</channel></rss>'
+
+
+def add_rss_sources(*names: str) -> None:
+    """https://feeds.test/<이름> 을 읽는 RSS 소스."""
+    with get_session() as s:
+        for name in names:
+            s.add(Source(name=name, type=SourceType.RSS, config_json=json.dumps({"feed_url": f"https://feeds.test/{name}"})))
+
+
+class FeedServer:
+    """feeds.test 응답 (httpx.MockTransport 핸들러). /broken 은 500, /plain 은 검증자 없이, /dated 는 Last-Modified 만
+    (If-Modified-Since 가 맞으면 304), 나머지는 ETag "v1" 이고 If-None-Match 가 맞으면 304. 받은 요청은 requests 에 남는다."""
+    LAST_MODIFIED = "Mon, 05 Jan 2026 09:00:00 GMT"
+
+    def __init__(self, feed: str):
+        self.feed = feed
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path == "/broken":
+            return httpx.Response(500)
+        if request.url.path == "/dated":
+            if request.headers.get("If-Modified-Since") == self.LAST_MODIFIED:
+                return httpx.Response(304)
+            return httpx.Response(200, text=self.feed, headers={"Last-Modified": self.LAST_MODIFIED})
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text=self.feed, headers={} if request.url.path == "/plain" else {"ETag": '"v1"'})
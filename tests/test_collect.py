@@ -0,0 +1,59 @@
+"""geo collect 오케스트레이터 테스트."""
+import asyncio
+import hashlib
+import httpx
+from linkedin_intel.collect import CollectSummary, collect_async, load_queries
+from linkedin_intel.connectors.rss import load_rss_sources
+from linkedin_intel.models import get_session, Item, Run, RunStatus
+from tests.conftest import add_rss_sources, rss_feed
+
+
+class Server:
+    """CSE / RSS 응답을 흉내내고 동시에 처리 중인 요청 수의 최댓값을 기록."""
+
+    def __init__(self):
+        self.in_flight = self.peak = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if request.url.host == "feeds.test":
+            name = request.url.path.strip("/")
+            return httpx.Response(500) if name == "broken" else httpx.Response(200, text=rss_feed(name))
+        q = request.url.params["q"]
+        slug = hashlib.md5(q.encode()).hexdigest()[:8]
+        return httpx.Response(200, json={"items": [{"link": f"https://www.linkedin.com/posts/{slug}-{n}", "title": q}
+            for n in range(3)]})
+
+
+def _run(server: Server, concurrency: int = 2):
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+            return await collect_async(load_queries(), load_rss_sources(), pages=1, concurrency=concurrency, client=client)
+    return CollectSummary(results=asyncio.run(run()))
+
+
+class TestCollect:
+    def test_collects_all_queries_and_sources_in_one_pass(self, db, cse_settings):
+        add_rss_sources("a", "b", "broken")
+        server = Server()
+        summary = _run(server, concurrency=2)
+        queries = load_queries()
+        assert [r.channel for r in summary.results] == ["google_cse"] * len(queries) + ["rss"] * 3
+        assert server.peak <= 2
+        total = summary.total
+        assert summary.failed == 1 and summary.unchanged == 0
+        assert total.new_items == 3 * len(queries) + 2
+        with get_session() as s:
+            assert s.query(Item).count() == total.new_items
+            assert s.query(Run).count() == len(queries) + 3
+            assert s.query(Run).filter(Run.status == RunStatus.FAILED).count() == 1
+
+    def test_second_pass_reports_unchanged_feeds_and_duplicates(self, db, cse_settings):
+        add_rss_sources("a")
+        _run(Server())
+        summary = _run(Server())
+        assert summary.unchanged == 1 and summary.failed == 0
+        assert summary.total.new_items == 0 and summary.total.duplicates == 3 * len(load_queries())
@@ -0,0 +1,142 @@
+"""CSE 응답 캐시 / 일일 할당량 장부 테스트."""
+import asyncio
+import os
+import time
+from datetime import datetime, timezone
+import httpx
+import pytest
+from linkedin_intel.cache import ResponseCache
+from linkedin_intel.collect import collect
+from linkedin_intel.config import settings
+from linkedin_intel.connectors.google_cse import GoogleCSEConnector
+from linkedin_intel.models import get_session
+from linkedin_intel.quota import quota_day, QuotaExceededError, reserve, usage
+
+
+def _page(request: httpx.Request) -> httpx.Response:
+    start = int(request.url.params["start"])
+    items = [{"link": f"https://www.linkedin.com/posts/p{start + n}", "title": f"P{start + n}"} for n in range(10)]
+    return httpx.Response(200, json={"items": items, "queries": {"nextPage": [{}]}, "searchInformation": {"totalResults": "100"}})
+
+
+@pytest.fixture
+def cse(db, cse_settings):
+    """네트워크로 나간 요청의 start 목록."""
+    return []
+
+
+def _fetch(sent: list[int], query: str, pages: int, incremental: bool | None = None, restricts: list | None = None) -> list[dict]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(int(request.url.params["start"]))
+        if restricts is not None:
+            restricts.append(request.url.params.get("dateRestrict"))
+        return _page(request)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await GoogleCSEConnector(query_id=1).fetch_async(client, query, pages, incremental)
+    return asyncio.run(run())
+
+
+def _ingest(items: list[dict]) -> None:
+    GoogleCSEConnector(query_id=1).ingest(items=items)
+
+
+def _usage():
+    with get_session() as s:
+        return usage(s)
+
+
+class TestResponseCache:
+    def test_roundtrip_and_ttl(self, tmp_path):
+        cache = ResponseCache(tmp_path, ttl_seconds=60, max_bytes=1 << 20)
+        cache.put(("q", 1), {"items": [1, 2]})
+        assert cache.get(("q", 1)) == {"items": [1, 2]} and cache.get(("q", 11)) is None
+        path = next(tmp_path.glob("*.json.gz"))
+        os.utime(path, (time.time() - 120, time.time() - 120))
+        assert cache.get(("q", 1)) is None
+
+    def test_evicts_oldest_over_budget(self, tmp_path):
+        cache = ResponseCache(tmp_path, ttl_seconds=3600, max_bytes=4000)
+        blob = os.urandom(900).hex()  # 압축이 거의 안 되는 값
+        for n in range(8):
+            cache.put(("q", n), blob)
+            path = cache._path(("q", n))
+            os.utime(path, (time.time() - 100 + n, time.time() - 100 + n))
+        assert cache.size() <= 4000
+        assert cache.get(("q", 7)) == blob and cache.get(("q", 0)) is None
+
+    def test_disabled_with_zero_ttl(self, tmp_path):
+        cache = ResponseCache(tmp_path, ttl_seconds=0, max_bytes=1 << 20)
+        cache.put(("q", 1), {})
+        assert cache.get(("q", 1)) is None and not list(tmp_path.iterdir())
+
+
+def test_rerun_served_from_cache_without_quota(cse):
+    first = _fetch(cse, "adas", pages=2)
+    second = _fetch(cse, "adas", pages=2)
+    assert first == second and cse == [1, 11]
+    assert (_usage().requests, _usage().cache_hits) == (2, 2)
+    # cx 가 바뀌면 다른 검색엔진이므로 다시 요청
+    settings.google_cse_cx = "other"
+    _fetch(cse, "adas", pages=1)
+    assert cse == [1, 11, 1]
+
+
+def test_hard_stop_at_daily_budget(cse, monkeypatch):
+    monkeypatch.setattr(settings, "cse_daily_quota", 3)
+    with pytest.raises(QuotaExceededError):
+        _fetch(cse, "adas", pages=5, incremental=True)  # 한 페이지씩 요청해야 보낸 요청 수가 정해진다
+    assert len(cse) == 3 and _usage().requests == 3 and _usage().exhausted
+    with pytest.raises(QuotaExceededError):
+        reserve()
+    assert _usage().requests == 3
+
+
+def test_collect_skips_cse_when_exhausted(cse, monkeypatch):
+    monkeypatch.setattr(settings, "cse_daily_quota", 1)
+    reserve()
+    summary = collect(pages=1, rss=False, eml_path=None)
+    assert not summary.results and "할당량" in summary.skipped[0] and cse == []
+
+
+def test_quota_day_follows_pacific_midnight(monkeypatch):
+    monkeypatch.setattr(settings, "cse_quota_timezone", "America/Los_Angeles")
+    assert str(quota_day(datetime(2026, 3, 1, 7, 0, tzinfo=timezone.utc))) == "2026-02-28"
+    assert str(quota_day(datetime(2026, 3, 1, 9, 0, tzinfo=timezone.utc))) == "2026-03-01"
+
+
+def test_incremental_stops_at_known_page(cse):
+    _ingest(_fetch(cse, "adas", pages=2, incremental=False))
+    restricts = []
+    # 첫 페이지가 전부 이미 있는 URL 이면 한 번만 요청. 마지막 성공 Run 이후로 dateRestrict (캐시 키도 달라 새로 요청)
+    items = _fetch(cse, "adas", pages=5, incremental=True, restricts=restricts)
+    assert cse == [1, 11, 1] and restricts == ["d2"] and len(items) == 10
+
+
+def test_incremental_pages_until_known(cse):
+    _ingest(_fetch(cse, "adas", pages=3, incremental=False)[10:])
+    cse.clear()
+    _fetch(cse, "adas", pages=5, incremental=True)
+    assert cse == [1, 11]
+    cse.clear()
+    # 전체 모드는 요청한 페이지를 전부, dateRestrict 없이 (이전 응답은 캐시에서)
+    restricts = []
+    assert len(_fetch(cse, "adas", pages=5, incremental=False, restricts=restricts)) == 50
+    assert sorted(cse) == [31, 41] and restricts == [None, None]  # 전체 모드는 나머지 페이지를 동시에 요청
+
+
+def test_no_date_restrict_without_successful_run(cse):
+    restricts = []
+    _fetch(cse, "adas", pages=1, incremental=True, restricts=restricts)
+    assert restricts == [None]
+
+
+def test_incremental_is_opt_in(cse, monkeypatch):
+    _ingest(_fetch(cse, "adas", pages=1, incremental=False))
+    restricts = []
+    # 기본 (CSE_INCREMENTAL=false) 은 이미 있는 URL 이어도 요청한 페이지 전부, dateRestrict 없이
+    assert len(_fetch(cse, "adas", pages=3, restricts=restricts)) == 30 and restricts == [None, None]
+    monkeypatch.setattr(settings, "cse_incremental", True)
+    restricts.clear()
+    assert len(_fetch(cse, "adas", pages=3, restricts=restricts)) == 10 and restricts == ["d2"]
@@ -0,0 +1,29 @@
+"""대시보드 조회 함수 테스트."""
+from linkedin_intel.dashboard import queries
+from linkedin_intel.models import get_session, Item
+from tests.conftest import ListConnector, post_item
+
+
+class TestItemPage:
+    def test_keyset_pages_walk_forward_and_back(self, db):
+        # 같은 청크의 항목은 collected_at 이 같으므로 id 로 순서가 갈린다
+        ListConnector(query_id=1).ingest(chunk_size=7, items=[post_item(n) for n in range(25)])
+        with get_session() as s:
+            expected = [i for (i,) in s.query(Item.id).order_by(Item.collected_at.desc(), Item.id.desc())]
+            pages = [queries.item_page(s, limit=10)]
+            while pages[-1].has_next:
+                pages.append(queries.item_page(s, after=pages[-1].last, limit=10))
+            assert [[r["id"] for r in p.rows] for p in pages] == [expected[:10], expected[10:20], expected[20:]]
+            assert (pages[0].has_prev, pages[-1].has_prev) == (False, True)
+            back = queries.item_page(s, before=pages[-1].first, limit=10)
+            assert back.rows == pages[1].rows and back.has_prev and back.has_next
+            assert not queries.item_page(s, before=pages[1].first, limit=10).has_prev
+            assert set(pages[0].rows[0]) == {"id", "title", "channel", "collected_at", "url"}
+
+    def test_filters_apply_to_pages(self, db):
+        ListConnector(query_id=1).ingest(items=[post_item(n) for n in range(5)])
+        ListConnector(query_id=2).ingest(items=[post_item(n) for n in range(5, 8)])
+        with get_session() as s:
+            page = queries.item_page(s, query_id=2, limit=2)
+            assert len(page.rows) == 2 and page.has_next
+            assert len(queries.item_page(s, query_id=2, after=page.last, limit=2).rows) == 1
@@ -0,0 +1,63 @@
+"""SQLite 저장 프로필 / 읽기 전용 엔진 / 온라인 백업 테스트."""
+import sqlite3
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from typer.testing import CliRunner
+from linkedin_intel.cli import app
+from linkedin_intel.config import settings
+from linkedin_intel.models import database, get_engine, get_session
+from linkedin_intel.models.database import STORAGE_PROFILES
+from tests.conftest import ListConnector, post_item
+
+
+@pytest.fixture
+def wal_db(request, monkeypatch):
+    """ingest-heavy 프로필(WAL, 드문 체크포인트)로 연 임시 DB."""
+    monkeypatch.setattr(settings, "sqlite_profile", "ingest-heavy")
+    return request.getfixturevalue("db")
+
+
+def test_backup_includes_commits_still_in_wal(wal_db, tmp_path):
+    ListConnector(query_id=1).ingest(items=[post_item(n) for n in range(5)])
+    assert wal_db.with_name("geo.db-wal").stat().st_size > 0  # 체크포인트 전: 커밋이 -wal 에만 있다
+    dest = tmp_path / "backups" / "geo.db"
+    out = CliRunner().invoke(app, ["backup", str(dest)])
+    assert out.exit_code == 0 and "백업 완료" in out.output
+    with sqlite3.connect(dest) as conn:
+        assert conn.execute("SELECT count(*) FROM items").fetchone() == (5,)
+        assert conn.execute("PRAGMA integrity_check").fetchone() == ("ok",)
+    conn.close()
+
+
+def test_backup_without_db_fails(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "database_path", str(tmp_path / "missing.db"))
+    out = CliRunner().invoke(app, ["backup", str(tmp_path / "out.db")])
+    assert out.exit_code == 1 and "DB 없음" in out.output
+
+
+@pytest.mark.parametrize("profile", STORAGE_PROFILES)
+def test_profile_pragmas_on_new_connection(profile, request, monkeypatch):
+    monkeypatch.setattr(settings, "sqlite_profile", profile)
+    request.getfixturevalue("db")
+    expected = {"journal_mode": "delete", "cache_size": -2000, "busy_timeout": 5000}  # 기본값 (busy_timeout 은 sqlite3 timeout=5.0)
+    expected.update({k: v.lower() if isinstance(v, str) else v for k, v in STORAGE_PROFILES[profile].items()
+        if k in expected})
+    with get_engine().connect() as conn:
+        assert {pragma: conn.exec_driver_sql(f"PRAGMA {pragma}").scalar() for pragma in expected} == expected
+
+
+def test_read_only_session_rejects_writes(wal_db):
+    with get_session(read_only=True) as s:
+        assert s.execute(text("PRAGMA query_only")).scalar() == 1
+        with pytest.raises(OperationalError, match="readonly"):
+            s.execute(text("UPDATE queries SET name = 'x'"))
+    with get_session() as s:
+        assert "x" not in {name for (name,) in s.execute(text("SELECT name FROM queries"))}
+
+
+def test_unknown_profile_fails_when_engine_is_created(db, monkeypatch):
+    monkeypatch.setattr(settings, "sqlite_profile", "fast")
+    monkeypatch.setattr(database, "_ro_engine", None)
+    with pytest.raises(ValueError, match="Unknown SQLITE_PROFILE 'fast'.*ingest-heavy"):
+        get_engine(read_only=True)
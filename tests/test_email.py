@@ -0,0 +1,135 @@
+"""Email (.eml) 커넥터: 처리한 파일 매니페스트 / 프로세스 풀 파싱 테스트."""
+import os
+import pytest
+from typer.testing import CliRunner
+from linkedin_intel.cli import app
+from linkedin_intel.connectors import email_import
+from linkedin_intel.connectors.email_import import _imap_bounded, _InlineExecutor, EmailConnector
+from linkedin_intel.models import get_session, ProcessedFile, Run, RunStatus
+
+EML = """From: alerts@google.com
+To: me@example.com
+Subject: Google Alert
+Date: Mon, 05 Jan 2026 09:00:00 +0000
+MIME-Version: 1.0
+Content-Type: text/html; charset=utf-8
+
+<html><body>{links}</body></html>
+"""
+
+
+def _write(path, *slugs: str) -> None:
+    links = "".join(f'<a href="https://www.google.com/url?url=https%3A%2F%2Fwww.linkedin.com%2Fposts%2F{s}&sa=U">{s}</a>' for s in slugs)
+    path.write_text(EML.format(links=links), encoding="utf-8")
+
+
+@pytest.fixture
+def eml_dir(tmp_path):
+    folder = tmp_path / "eml"
+    folder.mkdir()
+    _write(folder / "a.eml", "a1", "a2")
+    _write(folder / "b.eml", "b1")
+    return folder
+
+
+@pytest.fixture
+def parsed(monkeypatch) -> list[str]:
+    """인라인 실행에서 실제로 연(파싱한) 파일 이름."""
+    opened = []
+    parse = email_import._parse_file
+
+    def counting(path: str):
+        opened.append(os.path.basename(path))
+        return parse(path)
+    monkeypatch.setattr(email_import, "_parse_file", counting)
+    return opened
+
+
+def _ingest(folder, **kwargs):
+    return EmailConnector(query_id=1).ingest(eml_path=folder, workers=1, **kwargs)
+
+
+def _manifest() -> dict[str, ProcessedFile]:
+    with get_session() as s:
+        entries = s.query(ProcessedFile).all()
+        s.expunge_all()
+    return {os.path.basename(entry.path): entry for entry in entries}
+
+
+def test_unchanged_files_are_not_opened(db, eml_dir, parsed):
+    first = _ingest(eml_dir)
+    assert (first.total_fetched, first.new_items) == (3, 3) and sorted(parsed) == ["a.eml", "b.eml"]
+    assert {name: entry.items_found for name, entry in _manifest().items()} == {"a.eml": 2, "b.eml": 1}
+    parsed.clear()
+    second = _ingest(eml_dir)
+    assert second.total_fetched == 0 and parsed == []
+
+
+def test_touched_file_with_same_content_is_skipped(db, eml_dir, parsed):
+    _ingest(eml_dir)
+    before = _manifest()["a.eml"].mtime_ns
+    os.utime(eml_dir / "a.eml", ns=(before + 10**9, before + 10**9))
+    parsed.clear()
+    # mtime 이 바뀌어 열어 보지만 해시가 같으므로 항목을 내지 않고 매니페스트만 갱신
+    assert _ingest(eml_dir).total_fetched == 0 and parsed == ["a.eml"]
+    assert _manifest()["a.eml"].mtime_ns == before + 10**9
+    parsed.clear()
+    assert _ingest(eml_dir).total_fetched == 0 and parsed == []
+
+
+def test_changed_file_is_reimported(db, eml_dir, parsed):
+    _ingest(eml_dir)
+    _write(eml_dir / "b.eml", "b1", "b2")
+    result = _ingest(eml_dir)
+    assert (result.total_fetched, result.new_items, result.duplicates) == (2, 1, 1)
+    assert _manifest()["b.eml"].items_found == 2
+
+
+def test_failed_run_does_not_record_files(db, eml_dir, parsed, monkeypatch):
+    def fail(self, session, batch, result):
+        raise RuntimeError("disk full")
+    with monkeypatch.context() as m:
+        m.setattr(EmailConnector, "_save_batch", fail)
+        result = _ingest(eml_dir)
+    assert result.failed and _manifest() == {}
+    # 다음 실행은 같은 파일을 다시 읽는다
+    assert _ingest(eml_dir).new_items == 3
+    with get_session() as s:
+        assert [status for (status,) in s.query(Run.status).order_by(Run.id)] == [RunStatus.FAILED, RunStatus.COMPLETED]
+
+
+def test_unreadable_file_is_skipped_and_not_recorded(db, eml_dir):
+    (eml_dir / "broken.eml").mkdir()  # read_bytes 가 실패하는 항목
+    assert _ingest(eml_dir).new_items == 3
+    assert set(_manifest()) == {"a.eml", "b.eml"}
+
+
+def test_full_reimports_everything(db, eml_dir, parsed):
+    _ingest(eml_dir)
+    parsed.clear()
+    result = _ingest(eml_dir, incremental=False)
+    assert (result.total_fetched, result.new_items, result.duplicates) == (3, 0, 3) and sorted(parsed) == ["a.eml", "b.eml"]
+    out = CliRunner().invoke(app, ["ingest", "email", "--path", str(eml_dir), "-q", "1", "--workers", "1", "--full"])
+    assert out.exit_code == 0 and "중복 3" in out.output
+
+
+def test_process_pool_matches_inline(db, tmp_path):
+    folder = tmp_path / "many"
+    folder.mkdir()
+    for n in range(6):
+        _write(folder / f"{n}.eml", *(f"p{n}-{k}" for k in range(3)))
+    items = list(EmailConnector(query_id=1).fetch(folder, workers=2))
+    assert [item["title"] for item in items] == [f"p{n}-{k}" for n in range(6) for k in range(3)]
+    assert items[0]["url"] == "https://www.linkedin.com/posts/p0-0"
+    assert list(EmailConnector(query_id=1).fetch(folder, workers=1)) == items
+
+
+def test_imap_bounded_keeps_order_and_limits_lookahead():
+    submitted = []
+
+    def work(n: int) -> int:
+        submitted.append(n)
+        return n * 10
+    results = _imap_bounded(_InlineExecutor(), work, list(range(10)), ahead=3)
+    assert next(results) == 0 and submitted == [0, 1, 2]
+    assert list(results) == [n * 10 for n in range(1, 10)]
@@ -0,0 +1,72 @@
+"""geo export (항목 내보내기) 테스트."""
+import csv
+import json
+from datetime import datetime, timedelta
+import pytest
+from linkedin_intel.export import export_format, export_items, ExportResult
+from linkedin_intel.models import get_session, Item
+from tests.conftest import ListConnector
+
+
+def _post(n: int, title: str = "Bosch digital cockpit update") -> dict:
+    return {"url": f"https://www.linkedin.com/posts/p{n}", "title": title, "snippet": f"post number {n}"}
+
+
+def _read_jsonl(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_jsonl_chunks_joins_and_since_id(db, tmp_path):
+    ListConnector(query_id=1).ingest(items=[_post(n) for n in range(5)] + [_post(5, "Weekend photos")])
+    ListConnector(query_id=2).ingest(items=[_post(n) for n in range(6, 9)])
+    chunks = []
+    result = export_items(tmp_path / "all.jsonl", chunk_size=4, on_chunk=chunks.append)
+    rows = _read_jsonl(tmp_path / "all.jsonl")
+    assert (result.rows, result.last_id, chunks) == (9, 9, [4, 8, 9])
+    assert [row["id"] for row in rows] == list(range(1, 10))
+    assert rows[0]["query"] == "ADAS" and rows[0]["tags"] == ["competitor", "technology"] and rows[5]["tags"] == []
+    assert datetime.fromisoformat(rows[0]["collected_at"])
+    # 증분: 지난번 마지막 id 다음부터
+    ListConnector(query_id=1).ingest(items=[_post(20)])
+    result = export_items(tmp_path / "new.jsonl", since_id=9)
+    assert result.rows == 1 and [row["id"] for row in _read_jsonl(tmp_path / "new.jsonl")] == [10]
+    # 새 항목이 없어도 커서는 유지
+    assert export_items(tmp_path / "none.jsonl", since_id=10) == ExportResult(rows=0, last_id=10)
+
+
+def test_csv_filters(db, tmp_path):
+    ListConnector(query_id=1).ingest(items=[_post(n) for n in range(3)])
+    ListConnector(query_id=2).ingest(items=[_post(n) for n in range(3, 5)])
+    with get_session() as s:
+        s.query(Item).filter(Item.id == 1).update({"collected_at": datetime(2026, 1, 5)})
+    assert export_items(tmp_path / "q2.csv", query_id=2).rows == 2
+    with open(tmp_path / "q2.csv", encoding="utf-8-sig", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert {row["query"] for row in rows} == {"SDV"} and rows[0]["tags"] == "competitor;technology"
+    assert export_items(tmp_path / "jan.csv", since=datetime(2026, 1, 1), until=datetime(2026, 1, 6)).rows == 1
+    assert export_items(tmp_path / "later.csv", since=datetime(2026, 1, 6)).rows == 4
+    assert export_items(tmp_path / "none.csv", channel="rss").rows == 0 and (tmp_path / "none.csv").exists()
+
+
+def test_parquet_row_groups(db, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    ListConnector(query_id=1).ingest(items=[_post(n) for n in range(5)])
+    export_items(tmp_path / "items.parquet", chunk_size=2)
+    file = pq.ParquetFile(tmp_path / "items.parquet")
+    assert file.metadata.num_rows == 5 and file.num_row_groups == 3
+    table = file.read()
+    assert table.column("tags").to_pylist()[0] == ["competitor", "technology"]
+    assert table.column("collected_at").to_pylist()[0] > datetime.utcnow() - timedelta(minutes=5)
+
+
+def test_format_and_failed_export_leaves_no_file(db, tmp_path):
+    assert export_format(tmp_path / "a.ndjson") == "jsonl" and export_format(tmp_path / "a", "CSV") == "csv"
+    with pytest.raises(ValueError):
+        export_format(tmp_path / "a.xml")
+    ListConnector(query_id=1).ingest(items=[_post(1)])
+
+    def fail(rows):
+        raise RuntimeError("stop")
+    with pytest.raises(RuntimeError):
+        export_items(tmp_path / "out.jsonl", on_chunk=fail)
+    assert list(tmp_path.glob("*out.jsonl*")) == []
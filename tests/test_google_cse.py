@@ -0,0 +1,73 @@
+"""GoogleCSEConnector.fetch_async 페이지 동시 요청 테스트."""
+import asyncio
+import httpx
+import pytest
+from linkedin_intel.connectors.google_cse import GoogleCSEConnector
+
+
+class PagedSearch:
+    """start 마다 10건. 뒤 페이지일수록 먼저 응답해 완료 순서가 요청 순서와 달라지게 한다.
+
+    gate 를 주면 그만큼의 요청이 동시에 들어올 때까지 (최대 1초) 응답을 붙잡아 둔다 (느린 머신에서도 동시성 검사가 흔들리지 않도록).
+    """
+
+    def __init__(self, total: int = 100, gate: int = 0):
+        self.total = total
+        self.gate = gate
+        self.starts: list[int] = []
+        self.in_flight = self.peak = 0
+        self._all_in: asyncio.Event | None = None
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        start = int(request.url.params["start"])
+        self.starts.append(start)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        if start > 1 and self.gate:
+            self._all_in = self._all_in or asyncio.Event()
+            if self.in_flight >= self.gate:
+                self._all_in.set()
+            await asyncio.wait_for(self._all_in.wait(), timeout=1)
+        await asyncio.sleep((100 - start) / 5000)
+        self.in_flight -= 1
+        count = max(0, min(10, self.total - start + 1))
+        data = {"items": [{"link": f"https://www.linkedin.com/posts/p{start + n}", "title": f"P{start + n}"} for n in range(count)],
+                "searchInformation": {"totalResults": str(self.total)}}
+        if start + 10 <= self.total:
+            data["queries"] = {"nextPage": [{}]}
+        return httpx.Response(200, json=data)
+
+
+@pytest.fixture
+def search(db, cse_settings):
+
+    def fetch(server: PagedSearch, pages: int) -> list[dict]:
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+                return await GoogleCSEConnector(query_id=1).fetch_async(client, "adas", pages, incremental=False)
+        return asyncio.run(run())
+    return fetch
+
+
+def test_pages_fan_out_concurrently_and_keep_order(search):
+    server = PagedSearch(total=100, gate=4)
+    items = search(server, pages=5)
+    assert server.starts[0] == 1 and sorted(server.starts) == [1, 11, 21, 31, 41]
+    assert server.peak == 4  # 첫 페이지 뒤 나머지 4 페이지를 동시에
+    assert [item["title"] for item in items] == [f"P{n}" for n in range(1, 51)]
+
+
+def test_stops_at_total_results(search):
+    server = PagedSearch(total=25)
+    items = search(server, pages=10)
+    assert sorted(server.starts) == [1, 11, 21] and len(items) == 25
+
+
+def test_single_page_without_next_page(search):
+    server = PagedSearch(total=7)
+    assert len(search(server, pages=5)) == 7 and server.starts == [1]
+
+
+def test_pages_capped_at_cse_limit(search):
+    server = PagedSearch(total=1000)
+    assert len(search(server, pages=15)) == 100 and max(server.starts) == 91
@@ -0,0 +1,65 @@
+"""CLI 콜드 스타트 예산: `python -X importtime` 로 서브커맨드가 불러오는 모듈과 누적 import 시간을 잰다.
+
+예산(ms)은 환경변수로 조정: GEO_IMPORT_BUDGET_HELP_MS (geo --help), GEO_IMPORT_BUDGET_CSV_MS (geo ingest csv).
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+HELP_BUDGET_MS = float(os.environ.get("GEO_IMPORT_BUDGET_HELP_MS", 500))
+CSV_BUDGET_MS = float(os.environ.get("GEO_IMPORT_BUDGET_CSV_MS", 1500))
+# csv 임포트에 필요 없는 다른 커넥터의 의존성
+NETWORK_MODULES = ("httpx", "feedparser", "bs4", "linkedin_intel.connectors.google_cse", "linkedin_intel.connectors.rss",
+    "linkedin_intel.connectors.email_import")
+
+
+def import_profile(*args: str, env: dict[str, str] | None = None) -> tuple[float, set[str]]:
+    """`geo <args>` 를 새 인터프리터로 실행하고 (최상위 import 누적 시간 ms, 불러온 모듈 집합) 을 돌려준다."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-m", "linkedin_intel.cli", *args], capture_output=True, text=True,
+        env={**os.environ, **(env or {})})
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+    total_us, modules = 0, set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue  # 헤더
+        modules.add(name.strip())
+        if not name[1:].startswith(" "):  # 최상위 import 만 합산 (하위 모듈은 누적값에 포함)
+            total_us += int(cumulative)
+    return total_us / 1000, modules
+
+
+def test_help_imports_no_app_modules():
+    total_ms, modules = import_profile("--help")
+    assert not {m for m in modules if m.startswith("linkedin_intel.") and m != "linkedin_intel.cli"}
+    assert not {"sqlalchemy", "pydantic"} & modules
+    assert total_ms < HELP_BUDGET_MS, f"geo --help import {total_ms:.0f} ms > budget {HELP_BUDGET_MS:.0f} ms"
+
+
+def test_ingest_csv_help_imports_no_app_modules():
+    _, modules = import_profile("ingest", "csv", "--help")
+    assert not {m for m in modules if m.startswith("linkedin_intel.") and m != "linkedin_intel.cli"}
+
+
+def test_ingest_csv_skips_network_connectors(tmp_path):
+    csv_path = tmp_path / "items.csv"
+    csv_path.write_text("url,title\nhttps://www.linkedin.com/posts/a_activity-1,A\n", encoding="utf-8")
+    env = {"DATABASE_PATH": str(tmp_path / "geo.db")}
+    import_profile("init-db", "--seed", env=env)
+    total_ms, modules = import_profile("ingest", "csv", "-f", str(csv_path), "-q", "1", env=env)
+    assert "linkedin_intel.connectors.csv_import" in modules
+    assert not set(NETWORK_MODULES) & modules
+    assert total_ms < CSV_BUDGET_MS, f"geo ingest csv import {total_ms:.0f} ms > budget {CSV_BUDGET_MS:.0f} ms"
+
+
+@pytest.mark.parametrize("package, name", [("linkedin_intel.connectors", "CSVConnector"), ("linkedin_intel.models", "Item"),
+    ("linkedin_intel.models", "get_session")])
+def test_lazy_exports_resolve(package, name):
+    module = __import__(package, fromlist=[name])
+    assert getattr(module, name).__name__ == name
+    with pytest.raises(AttributeError):
+        _ = module.missing_name
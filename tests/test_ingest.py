@@ -0,0 +1,96 @@
+"""BaseConnector.ingest 테스트."""
+from datetime import datetime, timedelta
+from linkedin_intel.connectors import base
+from linkedin_intel.connectors.base import BaseConnector
+from linkedin_intel.models import get_session, Item, Run, RunStatus
+from tests.conftest import ListConnector, post_item
+
+
+class TestBatchedIngest:
+    def test_counts_new_and_duplicates(self, db):
+        first = ListConnector(query_id=1).ingest(items=[post_item(n) for n in range(1200)])
+        assert (first.total_fetched, first.new_items, first.duplicates) == (1200, 1200, 0)
+        second = ListConnector(query_id=1).ingest(items=[post_item(n) for n in range(1000, 1500)])
+        assert (second.new_items, second.duplicates) == (300, 200)
+        with get_session() as s:
+            assert s.query(Item).count() == 1500
+            assert s.query(Run).filter(Run.status == RunStatus.COMPLETED).count() == 2
+
+    def test_repeated_url_in_batch_and_missing_url(self, db):
+        items = [post_item(1), {"url": "http://linkedin.com/posts/p1"}, {"url": ""}, post_item(2)]
+        result = ListConnector(query_id=1).ingest(items=items)
+        assert (result.new_items, result.duplicates, result.errors) == (2, 2, 0)
+        with get_session() as s:
+            item = s.query(Item).filter(Item.canonical_url == "https://linkedin.com/posts/p1").one()
+            assert item.title == "Post 1"
+
+    def test_duplicate_touches_last_seen(self, db, monkeypatch):
+        clock = [datetime(2026, 1, 5, 9, 0)]
+
+        class FrozenDatetime(datetime):
+            @classmethod
+            def utcnow(cls):
+                return clock[0]
+        monkeypatch.setattr(base, "datetime", FrozenDatetime)
+        ListConnector(query_id=1).ingest(items=[post_item(1)])
+        clock[0] += timedelta(hours=1)
+        ListConnector(query_id=1).ingest(items=[post_item(1)])
+        with get_session() as s:
+            collected, last_seen = s.query(Item.collected_at, Item.last_seen_at).one()
+        assert last_seen > collected and (collected, last_seen) == (datetime(2026, 1, 5, 9, 0), datetime(2026, 1, 5, 10, 0))
+
+    def test_url_key_collision_is_not_a_duplicate(self, db):
+        from linkedin_intel.utils import canonicalize_url, url_key
+        ListConnector(query_id=1).ingest(items=[post_item(1)])
+        with get_session() as s:
+            # 다른 URL 이 같은 8바이트 키를 가진 상황을 만든다
+            s.query(Item).update({"url_key": url_key(canonicalize_url(post_item(2)["url"]))})
+        result = ListConnector(query_id=1).ingest(items=[post_item(2)])
+        assert (result.new_items, result.duplicates) == (1, 0)
+        with get_session() as s:
+            assert s.query(Item).count() == 2
+
+
+class FailingConnector(BaseConnector):
+    channel = "manual"
+
+    def fetch(self, n_ok, **kwargs):
+        for n in range(n_ok):
+            yield post_item(n)
+        raise RuntimeError("boom")
+
+
+class TestStreamingIngest:
+    def test_failure_keeps_committed_chunks(self, db):
+        result = FailingConnector(query_id=1).ingest(chunk_size=100, n_ok=250)
+        assert result.failed and result.error_messages == ["boom"]
+        with get_session() as s:
+            # 마지막 미완성 청크(50건)는 커밋 전이라 버려진다
+            assert s.query(Item).count() == 200
+            run = s.get(Run, result.run_id)
+            assert (run.status, run.records_fetched, run.error) == (RunStatus.FAILED, 200, "boom")
+
+    def test_csv_rows_keep_their_channel(self, db, tmp_path):
+        from linkedin_intel.connectors.csv_import import CSVConnector
+        csv_path = tmp_path / "links.csv"
+        csv_path.write_text("url,title,channel\nhttps://linkedin.com/posts/a,A,salesnav\nhttps://linkedin.com/posts/b,B,\n")
+        result = CSVConnector(query_id=1).ingest(chunk_size=1, csv_path=csv_path)
+        assert (result.total_fetched, result.new_items) == (2, 2)
+        with get_session() as s:
+            assert dict(s.query(Item.title, Item.channel).all()) == {"A": "salesnav", "B": "manual"}
+
+
+class TestDailyRollup:
+    def test_rollup_tracks_new_and_seen(self, db):
+        from sqlalchemy import func
+        from linkedin_intel.models import get_engine, ItemRollup
+        from linkedin_intel.rollup import rebuild_rollups
+        ListConnector(query_id=1).ingest(items=[post_item(n) for n in range(10)])
+        ListConnector(query_id=2).ingest(items=[post_item(n) for n in range(5, 20)])
+        with get_session() as s:
+            rows = {(r.query_id, r.channel, r.source_id): (r.new_count, r.seen_count) for r in s.query(ItemRollup)}
+            assert rows == {(1, "manual", 0): (10, 0), (2, "manual", 0): (10, 5)}
+        with get_engine().begin() as conn:
+            rebuild_rollups(conn)
+        with get_session() as s:
+            assert s.query(func.sum(ItemRollup.new_count)).scalar() == s.query(Item).count() == 20
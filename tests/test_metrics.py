@@ -0,0 +1,97 @@
+"""Run 단계별 지표 (metrics) 테스트."""
+import asyncio
+import json
+import httpx
+from linkedin_intel.collect import collect_query, writer_executor
+from linkedin_intel.config import settings
+from linkedin_intel.connectors import base
+from linkedin_intel.connectors.rss import ingest_poll, load_rss_sources, poll_feeds
+from linkedin_intel.metrics import load_run_stats, percentile, render_textfile
+from linkedin_intel.models import get_session, Run, RunStatus
+from tests.conftest import add_rss_sources, ListConnector, rss_feed
+
+FEED = rss_feed("a")
+CSE = json.dumps({"items": [{"link": f"https://www.linkedin.com/posts/p{n}", "title": f"P{n}"} for n in range(3)]})
+
+
+def _stats(run_id: int) -> dict:
+    with get_session() as s:
+        return json.loads(s.get(Run, run_id).stats_json)
+
+
+def test_ingest_records_phases_and_counts(db):
+    items = [{"url": f"https://www.linkedin.com/posts/p{n}"} for n in range(5)]
+    ListConnector(query_id=1).ingest(items=items)
+    result = ListConnector(query_id=1).ingest(items=items + [{"url": "https://www.linkedin.com/posts/new"}])
+    stats = _stats(result.run_id)
+    assert stats["connector"] == "manual"
+    assert {"fetch", "canonicalize", "dedup", "insert", "commit"} <= set(stats["phases"])
+    assert stats["items"] == {"fetched": 6, "new": 1, "duplicates": 5, "errors": 0}
+    assert stats["rss_start_bytes"] > 0 and stats["rss_end_bytes"] > 0 and stats["process_peak_rss_bytes"] > 0
+    assert stats["ingest_seconds"] >= sum(stats["phases"].values())
+
+
+def test_rss_poll_stats_carry_into_run(db):
+    add_rss_sources("feed")
+
+    async def poll():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(200, text=FEED))) as client:
+            return await poll_feeds(load_rss_sources(), client=client)
+
+    result = ingest_poll(asyncio.run(poll())[0])
+    stats = _stats(result.run_id)
+    assert stats["connector"] == "rss" and stats["requests"] == 1 and stats["bytes_downloaded"] == len(FEED)
+    assert stats["phases"]["http"] > 0 and stats["phases"]["parse"] > 0
+
+
+def test_cse_http_stats_carry_into_run(db, cse_settings):
+
+    async def run():
+        with writer_executor() as writer:
+            async with httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(200, text=CSE))) as client:
+                return await collect_query(client, writer, 1, "ADAS", "adas", pages=1)
+
+    collected = asyncio.run(run())
+    stats = _stats(collected.result.run_id)
+    assert stats["connector"] == "google_cse" and stats["requests"] == 1
+    assert stats["bytes_downloaded"] == len(CSE) and stats["items"]["new"] == 3
+
+
+def test_textfile_written_after_each_run(db, tmp_path, monkeypatch):
+    path = tmp_path / "textfile" / "geo.prom"
+    monkeypatch.setattr(settings, "metrics_textfile", str(path))
+    statuses = []
+
+    def write_after_commit(target, session):
+        # 다른 세션에서도 Run 종료가 보여야 한다 (쓰기 트랜잭션 밖에서 파일을 쓴다)
+        with get_session() as s:
+            statuses.append(s.query(Run.status).order_by(Run.id.desc()).limit(1).scalar())
+        write_textfile(target, session)
+    write_textfile = base.write_textfile
+    monkeypatch.setattr(base, "write_textfile", write_after_commit)
+    ListConnector(query_id=1).ingest(items=[{"url": f"https://www.linkedin.com/posts/p{n}"} for n in range(3)])
+    assert statuses == [RunStatus.COMPLETED]
+    text = path.read_text()
+    assert 'geo_run_rss_bytes{connector="manual",quantile="0.5"}' in text and "# TYPE geo_process_peak_rss_bytes gauge" in text
+    assert 'geo_run_last_items{connector="manual",kind="new"} 3' in text
+    assert 'geo_run_last_failed{connector="manual"} 0' in text
+    assert "# TYPE geo_run_phase_seconds gauge" in text
+    assert not list(path.parent.glob(".*.tmp"))
+
+
+def test_failed_run_and_quantiles(db):
+    ok = [{"url": "https://www.linkedin.com/posts/p1"}]
+    for _ in range(3):
+        ListConnector(query_id=1).ingest(items=ok)
+
+    def broken():
+        yield {"url": "https://www.linkedin.com/posts/p2"}
+        raise RuntimeError("boom")
+
+    ListConnector(query_id=1).ingest(items=broken())
+    with get_session() as s:
+        grouped = load_run_stats(s)
+    entry = grouped["manual"]
+    assert (entry.runs, entry.failed, entry.last["failed"]) == (4, 1, True)
+    assert 'geo_run_last_failed{connector="manual"} 1' in render_textfile(grouped)
+    assert [percentile([1, 2, 3, 4], q) for q in (0.5, 0.95)] == [2, 4]
@@ -0,0 +1,41 @@
+"""기존 DB 마이그레이션 테스트."""
+from linkedin_intel.models import get_engine, get_session, init_db, Item
+from linkedin_intel.search import search_items
+from linkedin_intel.utils import url_key
+from tests.conftest import ListConnector, post_item
+
+# url_key 도입 전 items (canonical_url UNIQUE)
+OLD_ITEMS_DDL = """CREATE TABLE items (id INTEGER NOT NULL, url VARCHAR(2048) NOT NULL, canonical_url VARCHAR(2048) NOT NULL,
+    title VARCHAR(500), snippet TEXT, author VARCHAR(255), published_at DATETIME, collected_at DATETIME NOT NULL,
+    last_seen_at DATETIME NOT NULL, source_id INTEGER, query_id INTEGER, channel VARCHAR(50) NOT NULL, raw_json TEXT,
+    PRIMARY KEY (id), UNIQUE (canonical_url), FOREIGN KEY(source_id) REFERENCES sources (id) ON DELETE SET NULL,
+    FOREIGN KEY(query_id) REFERENCES queries (id) ON DELETE SET NULL)"""
+
+
+def test_url_key_migration_rebuilds_items(db):
+    with get_engine().connect() as conn:
+        conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+        conn.exec_driver_sql("DROP TABLE items")
+        conn.exec_driver_sql(OLD_ITEMS_DDL)
+        for n in (1, 2):
+            conn.exec_driver_sql("INSERT INTO items (id, url, canonical_url, title, collected_at, last_seen_at, query_id, channel) "
+                f"VALUES ({n}, 'https://linkedin.com/posts/p{n}', 'https://linkedin.com/posts/p{n}', 'Cockpit post {n}', "
+                "'2026-01-01 00:00:00', '2026-01-01 00:00:00', 1, 'manual')")
+        conn.exec_driver_sql("INSERT INTO items_fts(items_fts) VALUES ('rebuild')")
+        conn.exec_driver_sql("INSERT INTO item_tags (item_id, tag_id) VALUES (1, 1)")
+        conn.exec_driver_sql("PRAGMA user_version=3")
+        conn.commit()
+        conn.exec_driver_sql("PRAGMA foreign_keys=ON")
+    init_db()
+    with get_engine().connect() as conn:
+        assert not any(row[2] for row in conn.exec_driver_sql("PRAGMA index_list(items)"))  # UNIQUE 없음
+        assert conn.exec_driver_sql("SELECT item_id FROM item_tags").scalars().all() == [1]
+        assert conn.exec_driver_sql("PRAGMA foreign_keys").scalar() == 1
+    with get_session() as s:
+        assert {i.canonical_url: i.url_key for i in s.query(Item)} == {u: url_key(u) for u in
+            ("https://linkedin.com/posts/p1", "https://linkedin.com/posts/p2")}
+        assert len(search_items(s, "cockpit")) == 2
+    result = ListConnector(query_id=1).ingest(items=[post_item(1), post_item(3)])
+    assert (result.new_items, result.duplicates) == (1, 1)
+    with get_session() as s:
+        assert len(search_items(s, "post")) == 3
@@ -0,0 +1,78 @@
+"""유사 게시물 묶기 (neardup) 테스트."""
+import pytest
+from linkedin_intel.config import settings
+from linkedin_intel.dashboard import queries
+from linkedin_intel.models import get_session, Item, ItemSignature
+from linkedin_intel.neardup import cluster_stats, ClusterStats, minhash, rebuild_clusters, similarity
+from tests.conftest import ListConnector
+
+TEXT = ("LG Electronics unveiled its next generation digital cockpit platform at CES, combining the instrument cluster, "
+        "infotainment display and passenger screen on a single software defined vehicle controller with over the air updates")
+
+
+class EmailList(ListConnector):
+    channel = "email"
+
+
+@pytest.fixture
+def neardup(db, monkeypatch):
+    monkeypatch.setattr(settings, "neardup_threshold", 0.7)
+
+
+def _post(n: int, snippet: str, title: str = "Digital cockpit launch") -> dict:
+    return {"url": f"https://www.linkedin.com/posts/p{n}", "title": title, "snippet": snippet}
+
+
+def _clusters() -> dict[int, int | None]:
+    with get_session() as s:
+        return dict(s.query(Item.id, Item.cluster_id).order_by(Item.id).all())
+
+
+def test_minhash_is_deterministic_and_skips_short_text():
+    assert minhash("Digital cockpit launch", TEXT) == minhash("digital  cockpit launch", TEXT)
+    assert len(minhash(None, TEXT)) == 128
+    assert minhash("Post 1", "short") is None
+    assert similarity(minhash(None, TEXT), minhash(None, TEXT.replace("CES", "IAA"))) >= 0.7
+    assert similarity(minhash(None, TEXT), minhash(None, "Hiring embedded engineers for our ADAS perception team in Seoul and Munich")) < 0.3
+
+
+def test_variants_across_channels_cluster(neardup):
+    ListConnector(query_id=1).ingest(items=[_post(1, TEXT), _post(2, "Hiring embedded engineers for our ADAS perception team in Seoul")])
+    EmailList(query_id=2).ingest(items=[_post(3, TEXT.replace("at CES", "at CES 2026") + " #SDV", title="Digital cockpit launch | LinkedIn"),
+                                        _post(4, TEXT.replace("LG Electronics", "LG"))])
+    clusters = _clusters()
+    assert clusters == {1: None, 2: None, 3: 1, 4: 1}
+    with get_session() as s:
+        assert cluster_stats(s) == ClusterStats(signed=4, clusters=1, clustered=2)
+
+
+def test_collapsed_page_shows_representative_with_size(neardup):
+    ListConnector(query_id=1).ingest(items=[_post(1, TEXT), _post(2, "Hiring embedded engineers for our ADAS perception team in Seoul")])
+    EmailList(query_id=1).ingest(items=[_post(3, TEXT + " #SDV"), _post(4, TEXT.replace("CES", "IAA"))])
+    with get_session() as s:
+        assert len(queries.item_page(s).rows) == 4
+        rows = queries.item_page(s, collapse=True).rows
+        assert {row["id"]: row["similar"] for row in rows} == {1: 3, 2: 1}
+        # 대표가 필터에 걸리지 않으면 구성원이 그대로 보인다
+        rows = queries.item_page(s, channel="email", collapse=True).rows
+        assert {row["id"] for row in rows} == {3, 4}
+
+
+def test_rebuild_reproduces_clusters_and_keeps_last_seen(neardup):
+    ListConnector(query_id=1).ingest(items=[_post(n, TEXT.replace("CES", f"CES {n}")) for n in range(5)]
+                                     + [_post(9, "Hiring embedded engineers for our ADAS perception team in Seoul")])
+    before = _clusters()
+    with get_session() as s:
+        seen = dict(s.query(Item.id, Item.last_seen_at).all())
+        s.query(ItemSignature).delete()
+    stats = rebuild_clusters(batch_size=2)
+    assert _clusters() == before and stats.clusters == 1 and stats.signed == 6
+    with get_session() as s:
+        assert dict(s.query(Item.id, Item.last_seen_at).all()) == seen
+
+
+def test_off_by_default(db):
+    ListConnector(query_id=1).ingest(items=[_post(1, TEXT), _post(2, TEXT + " #SDV")])
+    assert _clusters() == {1: None, 2: None}
+    with get_session() as s:
+        assert s.query(ItemSignature).count() == 0
@@ -0,0 +1,66 @@
+"""payload 압축 저장 테스트."""
+from linkedin_intel.models import get_engine, get_session, init_db, Item, ItemPayload, PayloadDict, seed_data
+from linkedin_intel.payload import compact, decode, dumps, encode, load_payload, load_payloads, train_dictionary
+from tests.conftest import ListConnector, post_item
+
+
+def _pagemap(n: int) -> dict:
+    return {"displayLink": "www.linkedin.com", "formattedUrl": f"https://www.linkedin.com/posts/p{n}",
+        "pagemap": {"metatags": [{"og:type": "article", "og:site_name": "LinkedIn", "twitter:card": "summary_large_image",
+            "og:title": f"Post {n} about software defined vehicles", "article:published_time": "2026-03-01T09:00:00Z"}]}}
+
+
+class TestCodec:
+    def test_dictionary_round_trip_and_smaller(self):
+        samples = [dumps(_pagemap(n)) for n in range(200)]
+        zdict = train_dictionary(samples)
+        assert 0 < len(zdict) <= 32 * 1024
+        raw = _pagemap(999)
+        assert decode(encode(raw, zdict), zdict) == raw
+        assert len(encode(raw, zdict)) < len(encode(raw)) < len(dumps(raw))
+
+
+class TestPayloadStorage:
+    def test_ingest_stores_payload_out_of_line(self, db):
+        ListConnector(query_id=1).ingest(items=[post_item(1, raw=_pagemap(1)), post_item(2)])
+        with get_session() as s:
+            ids = dict(s.query(Item.title, Item.id).all())
+            assert load_payload(s, ids["Post 1"]) == _pagemap(1)
+            assert load_payloads(s, list(ids.values())) == {ids["Post 1"]: _pagemap(1)}
+
+    def test_compact_moves_raw_json_and_recompresses(self, db):
+        ListConnector(query_id=1).ingest(items=[post_item(n, raw=_pagemap(n)) for n in range(20)])
+        with get_engine().begin() as conn:
+            # 변경 전 DB: 평문 raw_json 컬럼에 payload 가 있던 행
+            conn.exec_driver_sql("ALTER TABLE items ADD COLUMN raw_json TEXT")
+            conn.exec_driver_sql("DELETE FROM item_payloads WHERE item_id > 10")
+            for item_id in range(11, 21):
+                conn.exec_driver_sql("UPDATE items SET raw_json = ? WHERE id = ?", (dumps(_pagemap(item_id - 1)).decode(), item_id))
+        result = compact(get_engine(), vacuum=False)
+        assert (result.converted, result.recompressed) == (10, 10)
+        with get_engine().connect() as conn:
+            assert "raw_json" not in {row[1] for row in conn.exec_driver_sql("PRAGMA table_info(items)")}
+        with get_session() as s:
+            assert s.query(PayloadDict.id).all() == [(result.dict_id,)]
+            assert {d for (d,) in s.query(ItemPayload.dict_id)} == {result.dict_id}
+            assert load_payloads(s, list(range(1, 21))) == {n + 1: _pagemap(n) for n in range(20)}
+        ListConnector(query_id=1).ingest(items=[post_item(99, raw=_pagemap(99))])
+        with get_session() as s:
+            item_id = s.query(Item.id).filter(Item.title == "Post 99").scalar()
+            assert s.get(ItemPayload, item_id).dict_id == result.dict_id
+            assert load_payload(s, item_id) == _pagemap(99)
+
+    def test_dictionary_cache_is_reset_when_db_is_recreated(self, db):
+        ListConnector(query_id=1).ingest(items=[post_item(n, raw=_pagemap(n)) for n in range(20)])
+        first = compact(get_engine(), vacuum=False).dict_id
+        ListConnector(query_id=1).ingest(items=[post_item(50, raw=_pagemap(50))])  # 최신 사전을 캐시에 올린다
+        init_db(force=True)
+        seed_data()
+        # 같은 경로의 새 DB 에서 같은 id 가 다른 사전을 가리킨다
+        other = train_dictionary([dumps({"company": f"Company {n}", "industry": "Automotive"}) for n in range(50)])
+        with get_session() as s:
+            s.add(PayloadDict(id=first, data=other, sample_count=50))
+        ListConnector(query_id=1).ingest(items=[post_item(1, raw=_pagemap(1))])
+        with get_session() as s:
+            payload = s.query(ItemPayload).one()
+            assert payload.dict_id == first and decode(payload.data, other) == _pagemap(1)
@@ -0,0 +1,131 @@
+"""핫 쿼리 실행 계획 회귀 테스트 (EXPLAIN QUERY PLAN).
+
+실제 조회 함수를 실행하면서 나가는 SQL 을 잡아 계획을 확인한다. 필터가 있는데 큰 테이블을 훑거나
+(SCAN items ...) 정렬/그룹핑용 임시 B-tree 를 만들면 실패.
+"""
+import re
+from contextlib import contextmanager
+import pytest
+from sqlalchemy import event
+from typer.testing import CliRunner
+from linkedin_intel.cli import app
+from linkedin_intel.dashboard import queries
+from linkedin_intel.models import get_engine, get_session, init_db
+from linkedin_intel.search import search_items
+from tests.conftest import ListConnector, post_item
+
+LARGE_TABLES = ("items", "runs", "item_rollups", "processed_files")
+FILTERS = [(None, None), (1, None), (None, "manual"), (1, "manual")]
+
+
+@contextmanager
+def captured_plans():
+    """블록 안에서 (읽기 전용 엔진 포함) 실행된 SELECT/UPDATE/DELETE 의 (SQL, 계획 detail 목록)."""
+    engine, statements = get_engine(), []
+    engines = (engine, get_engine(read_only=True))
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().split(None, 1)[0].upper() in ("SELECT", "UPDATE", "DELETE"):
+            statements.append((statement, parameters))
+
+    plans = []
+    for e in engines:
+        event.listen(e, "before_cursor_execute", capture)
+    try:
+        yield plans
+    finally:
+        for e in engines:
+            event.remove(e, "before_cursor_execute", capture)
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+            plans.append((statement, [r[3] for r in rows]))
+
+
+def assert_indexed(plans, allow_scan: tuple[str, ...] = ()) -> None:
+    """allow_scan: 필터 없는 전체 합계/최근순 LIMIT 처럼 전체 순회 자체가 정답인 테이블. 정렬이 섞이면 TEMP B-TREE 로 걸린다."""
+    assert plans
+    scan = re.compile(rf"^SCAN ({'|'.join(LARGE_TABLES)})( |$)")
+    for statement, details in plans:
+        for detail in details:
+            assert "TEMP B-TREE" not in detail, f"{detail}\n{statement}"
+            m = scan.match(detail)
+            assert not m or m.group(1) in allow_scan, f"{detail}\n{statement}"
+
+
+@pytest.fixture
+def sample(db):
+    ListConnector(query_id=1).ingest(items=[post_item(n) for n in range(50)])
+    ListConnector(query_id=2).ingest(items=[post_item(n) for n in range(40, 80)])
+    return db
+
+
+class TestDashboardPlans:
+    @pytest.mark.parametrize("query_id,channel", FILTERS)
+    def test_item_pages(self, sample, query_id, channel):
+        with get_session() as s:
+            with captured_plans() as first_plans:
+                first = queries.item_page(s, query_id, channel, limit=10)
+            with captured_plans() as cursor_plans:
+                second = queries.item_page(s, query_id, channel, after=first.last, limit=10)
+                queries.item_page(s, query_id, channel, before=second.first, limit=10)
+        assert_indexed(first_plans, allow_scan=("items",) if query_id is None and channel is None else ())
+        assert_indexed(cursor_plans)  # 깊은 페이지도 인덱스 범위 검색으로 바로 시작
+
+    @pytest.mark.parametrize("query_id,channel", FILTERS)
+    def test_rollup_stats_and_series(self, sample, query_id, channel):
+        with get_session() as s, captured_plans() as plans:
+            queries.item_stats(s, query_id, channel)
+            queries.daily_series(s, query_id, channel)
+        assert_indexed(plans, allow_scan=("item_rollups",) if query_id is None and channel is None else ())
+
+    def test_version_and_overview(self, sample):
+        with get_session() as s, captured_plans() as plans:
+            queries.data_version(s)
+            queries.overview(s)
+        assert_indexed(plans)
+
+    @pytest.mark.parametrize("query_id,channel", FILTERS)
+    def test_search(self, sample, query_id, channel):
+        with get_session() as s, captured_plans() as plans:
+            search_items(s, "post", query_id=query_id, channel=channel)
+        assert_indexed(plans)
+
+
+class TestIngestPlans:
+    def test_dedup_lookup_and_touch(self, sample):
+        with captured_plans() as plans:
+            ListConnector(query_id=1).ingest(items=[post_item(n) for n in range(70, 120)])
+        assert_indexed(plans)
+
+
+class TestCliPlans:
+    def _invoke(self, *args: str):
+        with captured_plans() as plans:
+            out = CliRunner().invoke(app, list(args))
+        assert out.exit_code == 0, out.output
+        return plans
+
+    def test_status(self, sample):
+        # 건수는 테이블 전체 합계라 전체 순회가 정답 (Run 은 작은 인덱스로 센다)
+        assert_indexed(self._invoke("status"), allow_scan=("runs", "item_rollups"))
+
+    @pytest.mark.parametrize("args", [(), ("--stats",)])
+    def test_runs(self, sample, args):
+        # 최근순 LIMIT 은 rowid 역순 순회로 바로 끝난다
+        assert_indexed(self._invoke("runs", *args), allow_scan=("runs",))
+
+    def test_scheduler_plan_last_started(self, sample, cse_settings):
+        # 작업별 마지막 Run.started_at 은 (query_id|source_id, started_at) 인덱스로
+        assert_indexed(self._invoke("scheduler", "plan"))
+
+
+def test_migration_adds_indexes_to_existing_db(db):
+    with get_engine().begin() as conn:
+        conn.exec_driver_sql("DROP INDEX idx_items_query_channel_collected")
+        conn.exec_driver_sql("CREATE INDEX idx_items_channel ON items (channel)")
+        conn.exec_driver_sql("PRAGMA user_version=2")
+    init_db()
+    with get_engine().connect() as conn:
+        names = {r[0] for r in conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='items'")}
+    assert "idx_items_query_channel_collected" in names and "idx_items_channel" not in names
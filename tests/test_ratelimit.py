@@ -0,0 +1,77 @@
+"""토큰 버킷 (ratelimit.TokenBucket) 테스트. 가짜 시계로 대기 시간을 잰다."""
+import asyncio
+import pytest
+from linkedin_intel import ratelimit
+from linkedin_intel.ratelimit import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    async def sleep_async(self, seconds: float) -> None:
+        self.sleep(seconds)
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(ratelimit.time, "sleep", clock.sleep)
+    monkeypatch.setattr(ratelimit.asyncio, "sleep", clock.sleep_async)
+    return clock
+
+
+def test_burst_up_to_capacity_then_rate(clock):
+    bucket = TokenBucket(rate=2, capacity=3, clock=clock)
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.sleeps == []
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]
+    # 이후로는 rate 간격 (초당 2건)
+    for _ in range(4):
+        bucket.acquire()
+    assert clock.now == pytest.approx(2.5)
+
+
+def test_idle_refill_is_capped_at_capacity(clock):
+    bucket = TokenBucket(rate=1, capacity=2, clock=clock)
+    bucket.acquire()
+    clock.now += 100
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.sleeps == []
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(1.0)]
+
+
+def test_async_acquire_waits_the_same(clock):
+    bucket = TokenBucket(rate=4, capacity=1, clock=clock)
+
+    async def run():
+        for _ in range(5):
+            await bucket.acquire_async()
+    asyncio.run(run())
+    assert clock.now == pytest.approx(1.0)
+
+
+def test_concurrent_reservations_do_not_exceed_rate(clock):
+    # 코루틴이 동시에 예약하면 뒤에 온 쪽일수록 더 오래 기다린다 (같은 토큰을 나눠 쓰지 않음)
+    bucket = TokenBucket(rate=10, capacity=1, clock=clock)
+    waits = [bucket._reserve() for _ in range(4)]
+    assert waits == [0.0, pytest.approx(0.1), pytest.approx(0.2), pytest.approx(0.3)]
+
+
+def test_zero_rate_is_unlimited(clock):
+    bucket = TokenBucket(rate=0, clock=clock)
+    for _ in range(100):
+        bucket.acquire()
+    assert clock.sleeps == []
@@ -0,0 +1,83 @@
+"""RSS 조건부 수집 테스트."""
+import asyncio
+import json
+import httpx
+from typer.testing import CliRunner
+from linkedin_intel.cli import app
+from linkedin_intel.connectors import rss
+from linkedin_intel.connectors.rss import ingest_poll, load_rss_sources, poll_feeds, RSSConnector
+from linkedin_intel.models import get_session, Item, Run, RunStatus, Source
+from tests.conftest import add_rss_sources, FeedServer, rss_feed
+
+
+def _poll_and_ingest(server: FeedServer | None = None):
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(server or FeedServer(rss_feed("a", "b")))) as client:
+            return await poll_feeds(load_rss_sources(), client=client)
+    return [(poll, ingest_poll(poll)) for poll in asyncio.run(run())]
+
+
+def _config(name: str) -> dict:
+    with get_session() as s:
+        return json.loads(s.query(Source.config_json).filter(Source.name == name).scalar())
+
+
+class TestConditionalPolling:
+    def test_second_poll_skips_unchanged_feeds(self, db):
+        add_rss_sources("etag", "plain")
+        first = _poll_and_ingest()
+        assert [(p.status, r.new_items) for p, r in first] == [("changed", 2), ("changed", 0)]
+        second = _poll_and_ingest()
+        assert [(p.status, r) for p, r in second] == [("not_modified", None), ("unchanged", None)]
+        with get_session() as s:
+            assert s.query(Item).count() == 2 and s.query(Run).count() == 2
+        assert _config("etag")["etag"] == '"v1"'
+
+    def test_same_entries_hash_skips_parse_and_run(self, db, monkeypatch):
+        add_rss_sources("plain")
+        _poll_and_ingest()
+        parsed = []
+        monkeypatch.setattr(RSSConnector, "parse_entries", lambda self, entries: parsed.append(entries) or [])
+        # 검증자가 없어 매번 200 이지만 엔트리 ID 해시가 같으므로 파싱 / Run 없이 끝난다
+        [(poll, result)] = _poll_and_ingest()
+        assert (poll.status, result, parsed) == ("unchanged", None, [])
+        with get_session() as s:
+            assert s.query(Run).count() == 1
+
+    def test_last_modified_only_source_sends_if_modified_since(self, db):
+        add_rss_sources("dated")
+        server = FeedServer(rss_feed("a"))
+        _poll_and_ingest(server)
+        assert _config("dated")["last_modified"] == FeedServer.LAST_MODIFIED and "etag" not in _config("dated")
+        [(poll, result)] = _poll_and_ingest(server)
+        assert (poll.status, result) == ("not_modified", None)
+        assert [r.headers.get("If-Modified-Since") for r in server.requests] == [None, FeedServer.LAST_MODIFIED]
+        assert "If-None-Match" not in server.requests[-1].headers
+
+    def test_failing_feed_keeps_its_validators_and_others_continue(self, db):
+        add_rss_sources("etag", "broken")
+        stored = {"feed_url": "https://feeds.test/broken", "etag": '"old"', "entries_hash": "old"}
+        with get_session() as s:
+            s.query(Source).filter(Source.name == "broken").one().config_json = json.dumps(stored)
+        polls = _poll_and_ingest()
+        assert [(p.name, p.status) for p, _ in polls] == [("etag", "changed"), ("broken", "error")]
+        assert polls[0][1].new_items == 2 and polls[1][1].failed
+        assert _config("broken") == stored and _config("etag")["etag"] == '"v1"'
+        with get_session() as s:
+            assert sorted(status for (status,) in s.query(Run.status)) == sorted([RunStatus.COMPLETED, RunStatus.FAILED])
+
+
+def test_cli_ingest_all(db, monkeypatch):
+    add_rss_sources("etag", "broken")
+    server = FeedServer(rss_feed("a", "b"))
+
+    async def mocked(sources, max_items=50, client=None):
+        async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+            return await poll_feeds(sources, max_items, client)
+    monkeypatch.setattr(rss, "poll_feeds", mocked)
+    out = CliRunner().invoke(app, ["ingest", "rss", "--all"])
+    assert out.exit_code == 1 and "✓ etag: 총 2, 신규 2" in out.output and "✗ broken" in out.output
+    with get_session() as s:
+        s.query(Source).filter(Source.name == "broken").delete()
+    out = CliRunner().invoke(app, ["ingest", "rss", "--all"])
+    assert out.exit_code == 0 and "etag: 변경 없음 (not_modified)" in out.output
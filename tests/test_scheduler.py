@@ -0,0 +1,110 @@
+"""geo scheduler 테스트."""
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+import httpx
+import pytest
+from linkedin_intel.collect import writer_executor
+from linkedin_intel.config import settings
+from linkedin_intel.models import get_session, Item, Query, Run, RunStatus, Source
+from linkedin_intel.scheduler import Scheduler, next_delay
+from tests.conftest import add_rss_sources, FeedServer, rss_feed
+
+
+@pytest.fixture
+def no_jitter(monkeypatch):
+    monkeypatch.setattr(settings, "scheduler_jitter", 0)
+    monkeypatch.setattr(settings, "google_cse_api_key", "")
+
+
+class TestNextDelay:
+    def test_success_uses_interval_with_jitter(self, monkeypatch):
+        monkeypatch.setattr(settings, "scheduler_jitter", 0.1)
+        delays = [next_delay(3600) for _ in range(200)]
+        assert 3240 <= min(delays) < max(delays) <= 3960
+
+    def test_failures_back_off_exponentially_up_to_cap(self, no_jitter, monkeypatch):
+        monkeypatch.setattr(settings, "scheduler_retry_minutes", 5)
+        monkeypatch.setattr(settings, "scheduler_max_backoff_minutes", 60)
+        assert [next_delay(86400, n) / 60 for n in range(1, 6)] == [5, 10, 20, 40, 60]
+
+
+class TestPlan:
+    def test_first_run_follows_last_run_and_interval_override(self, db, no_jitter, cse_settings):
+        started = datetime.utcnow() - timedelta(hours=1)
+        with get_session() as s:
+            s.add(Run(query_id=1, started_at=started, status=RunStatus.COMPLETED, stats_json=json.dumps({"connector": "google_cse"})))
+            s.get(Query, 2).interval_minutes = 30
+        scheduler = Scheduler()
+        now = time.time()
+        scheduler.refresh()
+        assert scheduler.jobs[("query", 1)].due == pytest.approx(now + 23 * 3600, abs=5)
+        assert scheduler.jobs[("query", 2)].interval == 1800 and scheduler.jobs[("query", 2)].due == pytest.approx(now, abs=5)
+
+    def test_query_plan_ignores_email_runs_with_same_query_id(self, db, no_jitter, cse_settings):
+        now = datetime.utcnow()
+        with get_session() as s:
+            s.add(Run(query_id=1, started_at=now - timedelta(days=2), status=RunStatus.COMPLETED, stats_json=json.dumps({"connector": "google_cse"})))
+            s.add(Run(query_id=1, started_at=now - timedelta(minutes=5), status=RunStatus.COMPLETED, stats_json=json.dumps({"connector": "email"})))
+        _, last_started = Scheduler().load_plan()
+        assert last_started[("query", 1)] == now - timedelta(days=2)
+        scheduler = Scheduler()
+        scheduler.refresh()
+        # 마지막 CSE Run 이 이틀 전이므로 이메일 수집과 관계없이 곧바로 실행
+        assert scheduler.jobs[("query", 1)].due == pytest.approx(time.time(), abs=5)
+
+    def test_refresh_drops_deleted_sources(self, db, no_jitter):
+        add_rss_sources("a", "b")
+        scheduler = Scheduler()
+        scheduler.refresh()
+        assert {job.name for job in scheduler.jobs.values()} == {"a", "b"}
+        with get_session() as s:
+            s.delete(s.query(Source).filter(Source.name == "b").one())
+        scheduler.refresh()
+        assert {job.name for job in scheduler.jobs.values()} == {"a"}
+
+
+class TestRun:
+    def test_runs_due_jobs_and_backs_off_failures(self, db, no_jitter):
+        add_rss_sources("a", "broken")
+        done = []
+
+        async def run():
+            stop = asyncio.Event()
+
+            def on_result(job, collected):
+                done.append(job.name)
+                if len(done) == 2:
+                    stop.set()
+
+            scheduler = Scheduler(on_result=on_result)
+            async with httpx.AsyncClient(transport=httpx.MockTransport(FeedServer(rss_feed("a")))) as client:
+                await asyncio.wait_for(scheduler.run(stop, client=client), timeout=10)
+            return scheduler
+
+        now = time.time()
+        scheduler = asyncio.run(run())
+        jobs = {job.name: job for job in scheduler.jobs.values()}
+        assert sorted(done) == ["a", "broken"]
+        assert jobs["a"].failures == 0 and jobs["a"].due == pytest.approx(now + 3600, abs=5)
+        assert jobs["broken"].failures == 1 and jobs["broken"].due == pytest.approx(now + 300, abs=5)
+        with get_session() as s:
+            assert s.query(Item).count() == 1
+            assert sorted(s.query(Run.status).all()) == [(RunStatus.COMPLETED,), (RunStatus.FAILED,)]
+
+    def test_unchanged_feed_still_records_run(self, db, no_jitter):
+        add_rss_sources("a")
+        scheduler = Scheduler()
+        scheduler.refresh()
+        job = scheduler.jobs[("source", 1)]
+
+        async def execute():
+            with writer_executor() as writer:
+                async with httpx.AsyncClient(transport=httpx.MockTransport(FeedServer(rss_feed("a")))) as client:
+                    return [await scheduler.execute(job, client, writer, asyncio.Semaphore(1)) for _ in range(2)]
+
+        first, second = asyncio.run(execute())
+        assert first.result.new_items == 1 and second.result is None and second.status == "not_modified"
+        with get_session() as s:
+            assert s.query(Run).filter(Run.source_id == 1, Run.status == RunStatus.COMPLETED).count() == 2
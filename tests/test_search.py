@@ -0,0 +1,27 @@
+"""전문 검색 테스트."""
+from linkedin_intel.models import get_session, Item
+from linkedin_intel.search import HL_END, HL_START, search_items, to_match_query
+from tests.conftest import ListConnector
+
+
+class TestToMatchQuery:
+    def test_quotes_terms_and_keeps_prefix(self):
+        assert to_match_query('SDV cock* "x') == '"SDV" "cock"* "x"'
+
+    def test_operators_are_literal(self):
+        assert to_match_query("AND OR NOT (") == '"AND" "OR" "NOT" "("'
+
+
+class TestSearchItems:
+    def test_triggers_keep_index_in_sync(self, db):
+        ListConnector(query_id=1).ingest(items=[
+            {"url": "https://linkedin.com/posts/a", "title": "Digital cockpit launch", "snippet": "New HMI for SDV"},
+            {"url": "https://linkedin.com/posts/b", "title": "ADAS sensor fusion", "snippet": "lidar"}])
+        with get_session() as s:
+            hits = search_items(s, "cockpit")
+            assert [h.url for h in hits] == ["https://linkedin.com/posts/a"]
+            assert hits[0].title_hl == f"Digital {HL_START}cockpit{HL_END} launch"
+            assert search_items(s, "cockpit", channel="rss") == []
+            s.query(Item).filter(Item.url.endswith("/b")).update({"title": "Cockpit domain controller"})
+        with get_session() as s:
+            assert len(search_items(s, "cock*")) == 2
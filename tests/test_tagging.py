@@ -0,0 +1,74 @@
+"""규칙 기반 자동 태깅 테스트."""
+import pytest
+from sqlalchemy import select
+from linkedin_intel.models import get_session, item_tags, Item, Tag, TagRuleKind
+from linkedin_intel.tagging import add_rule, retag, Tagger, validate_rule
+from tests.conftest import ListConnector
+
+
+def _tags() -> dict[int, set[str]]:
+    with get_session() as s:
+        rows = s.execute(select(item_tags.c.item_id, Tag.name).join(Tag, Tag.id == item_tags.c.tag_id)).all()
+    found: dict[int, set[str]] = {}
+    for item_id, name in rows:
+        found.setdefault(item_id, set()).add(name)
+    return found
+
+
+def _post(n: int, title: str, snippet: str | None = None) -> dict:
+    return {"url": f"https://www.linkedin.com/posts/p{n}", "title": title, "snippet": snippet}
+
+
+class TestTagger:
+    def test_keywords_match_whole_words_and_phrases(self):
+        tagger = Tagger([(1, "keyword", "ADAS"), (2, "keyword", "software defined vehicle"), (3, "keyword", "defined"),
+                         (4, "keyword", "Hyundai Mobis")])
+        assert tagger.tags("New ADAS stack", None) == {1}
+        assert tagger.tags("ADASIS map data", "adas-ready") == {1}
+        assert tagger.tags("Software-Defined Vehicle roadmap", None) == {2, 3}
+        assert tagger.tags("hyundai mobis", None) == {4}
+        # 제목 끝과 스니펫 시작은 이어지지 않는다
+        assert tagger.tags("Hyundai", "Mobis") == set()
+
+    def test_regex_rules_are_combined_per_tag(self):
+        tagger = Tagger([(1, "regex", r"\$\d+ ?billion"), (1, "regex", r"CAGR of \d+%"), (2, TagRuleKind.REGEX, r"partner(ed|s)? with")])
+        assert tagger.tags("Market hits $40 billion", None) == {1}
+        assert tagger.tags(None, "a cagr of 12% and partnered with Bosch") == {1, 2}
+        assert not Tagger([]) and tagger.tags("nothing here", "") == set()
+
+
+def test_ingest_tags_new_items_with_seed_rules(db):
+    ListConnector(query_id=1).ingest(items=[_post(1, "Bosch and Harman team up on the digital cockpit"),
+                                            _post(2, "Weekend photos", "Nothing to see"),
+                                            _post(3, "LG partners with Qualcomm", "Market size forecast at $12 billion")])
+    assert _tags() == {1: {"competitor", "technology"}, 3: {"market", "partnership"}}
+    # 재수집된 중복은 다시 태그하지 않는다
+    result = ListConnector(query_id=1).ingest(items=[_post(1, "Bosch and Harman team up on the digital cockpit")])
+    assert result.duplicates == 1 and len(_tags()[1]) == 2
+
+
+def test_validate_rule():
+    with pytest.raises(ValueError):
+        validate_rule(TagRuleKind.REGEX, "(")
+    with pytest.raises(ValueError):
+        validate_rule(TagRuleKind.KEYWORD, "++")
+
+
+def test_retag_applies_changed_rules_and_keeps_manual_tags(db):
+    ListConnector(query_id=1).ingest(items=[_post(n, f"Post {n} about NXP radar", "with Bosch") for n in range(5)]
+                                     + [_post(9, "Unrelated", "text")])
+    with get_session() as s:
+        important = s.scalar(select(Tag.id).where(Tag.name == "important"))
+        s.execute(item_tags.insert().values(item_id=1, tag_id=important))
+        add_rule(s, "radar", TagRuleKind.KEYWORD, "NXP")
+        competitor = s.scalar(select(Tag).where(Tag.name == "competitor"))
+        competitor.rules = [rule for rule in competitor.rules if rule.pattern != "Bosch"]
+        with pytest.raises(ValueError):
+            add_rule(s, "radar", TagRuleKind.KEYWORD, "NXP")
+    stats = retag(batch_size=2)
+    assert (stats.items, stats.added, stats.removed) == (6, 5, 5)
+    tags = _tags()
+    assert tags[1] == {"radar", "important"} and all(tags[n] == {"radar"} for n in range(2, 6)) and 6 not in tags
+    assert retag().added == retag().removed == 0
+    with get_session() as s:
+        assert s.query(Item).count() == 6
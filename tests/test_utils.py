@@ -1,6 +1,36 @@
 """URL 유틸리티 테스트."""
+import hashlib
+from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 import pytest
-from linkedin_intel.utils import canonicalize_url, url_hash, clean_title
+from linkedin_intel.utils import LINKEDIN_SUBDOMAIN_MAP, TRACKING_PARAMS, canonicalize_url, canonicalize_urls, url_hash, clean_title
+
+
+def reference_canonicalize(url: str) -> str:
+    """메모/빠른 경로 도입 전 구현 그대로 (동일 출력 기준)."""
+    if not url:
+        return ""
+    try:
+        parsed = urlparse(url.strip())
+    except Exception:
+        return url
+    scheme = "https" if parsed.scheme in ("http", "https", "") else parsed.scheme
+    netloc = LINKEDIN_SUBDOMAIN_MAP.get(parsed.netloc.lower(), parsed.netloc.lower())
+    path = parsed.path.rstrip("/") or "/"
+    query_params = parse_qs(parsed.query, keep_blank_values=False)
+    filtered = {k: v for k, v in query_params.items() if k.lower() not in TRACKING_PARAMS}
+    query = urlencode(sorted(filtered.items()), doseq=True) if filtered else ""
+    return urlunparse((scheme, netloc, path, "", query, ""))
+
+
+EDGE_URLS = [
+    "https://www.linkedin.com/posts/abc_activity-1/?utm_source=share&utm_medium=member_desktop",
+    "https://kr.linkedin.com/pulse/x?trk=public_post&b=2&a=1",
+    "http://LinkedIn.com/feed/update/urn:li:activity:1/?trkInfo=x&refId=y",
+    "https://example.com/a?b=1&a=2&b=3", "https://example.com/a?q=hello+world&x=%41", "https://example.com/a?=v&k",
+    "https://example.com/a?k=&z=1&&", "https://example.com/p;params?z=1#frag", "  https://example.com/a/  ",
+    "//example.com/a", "mailto:someone@example.com", "http://[::1/a", "https://example.com?UTM_SOURCE=x&Trk=y",
+    "https://example.com/a?ä=ü&b=~.-_", "ftp://files.example.com/x/", "",
+]
 
 
 class TestCanonicalizeUrl:
@@ -25,6 +55,19 @@ class TestUrlHash:
         assert url_hash(url1) == url_hash(url2)
 
 
+class TestCanonicalizeUrls:
+    @pytest.mark.parametrize("url", EDGE_URLS)
+    def test_matches_reference(self, url):
+        assert canonicalize_url(url) == canonicalize_url(url) == reference_canonicalize(url)
+
+    def test_batch_matches_single_with_hash(self):
+        urls = EDGE_URLS * 3
+        result = canonicalize_urls(urls)
+        assert [r.url for r in result] == [reference_canonicalize(u) for u in urls]
+        assert [r.hash for r in result] == [hashlib.sha256(reference_canonicalize(u).encode()).hexdigest() for u in urls]
+        assert [r.hash for r in result] == [url_hash(u) for u in urls]
+
+
 class TestCleanTitle:
     def test_removes_linkedin_suffix(self):
         assert clean_title("Some Post | LinkedIn") == "Some Post"